@@ -1,7 +1,43 @@
 # Bomberman/__run__.py
+import sys
+from settings import LEVEL_SIZE, LEVEL_SEED
 from main import Game
+from replay import MatchReplay
 
-# Run this file to compile entire program
+
+# This function returns the value passed after an option on the command line (None if the option is missing)
+def option_value(option):
+    return sys.argv[sys.argv.index(option) + 1] if option in sys.argv[:-1] else None
+
+
+# Run this file to compile entire program (pass '--headless' to simulate a single match without a display)
+# Pass '--level-size ROWSxCOLUMNS' and optionally '--level-seed SEED' to play a generated level
+# Pass '--record FILE' to record the played matches and '--replay FILE' to replay a recorded match
 if __name__ == "__main__":
-    bomberman = Game()
-    bomberman.run()
+    headless = '--headless' in sys.argv
+    replay_path = option_value('--replay')
+    record_path = option_value('--record')
+
+    # A replay is played on the level it was recorded on
+    if replay_path:
+        replay = MatchReplay.load(replay_path)
+        bomberman = Game(headless=headless, level_size=replay.settings['level_size'],
+                         level_seed=replay.settings['level_seed'])
+        ticks = bomberman.run_replay(replay)
+        print(f"Replay finished after {ticks} of {len(replay.ticks)} ticks: {bomberman.player_end_info_dict}")
+        sys.exit()
+
+    level_size = option_value('--level-size')
+    level_size = tuple(int(n) for n in level_size.split('x')) if level_size else LEVEL_SIZE
+    level_seed = int(option_value('--level-seed')) if option_value('--level-seed') else LEVEL_SEED
+
+    bomberman = Game(headless=headless, level_size=level_size, level_seed=level_seed)
+    if record_path:
+        bomberman.start_recording(record_path)
+
+    if headless:
+        steps = bomberman.run_headless(game_mode_2player='--2player' in sys.argv)
+        bomberman.finish_recording()
+        print(f"Headless match finished after {steps} steps: {bomberman.player_end_info_dict}")
+    else:
+        bomberman.run()
@@ -0,0 +1,188 @@
+# Bomberman/asset_manager.py
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pygame as pg
+from settings import join, TILE_SIZE, BASE_IMG_DIR, BASE_FONT_DIR, BASE_ICON_DIR, BASE_AUDIO_DIR, \
+    ASSET_LOADER_THREADS, SHARED_DIR
+from bomb import BOMB_COUNTDOWN_COLORS, EXPLOSION_PULSES
+from creep import CREEP_FRAME_PATHS
+
+sys.path.append(SHARED_DIR)  # the asset pack reader is shared by every game, so it is stored next to the game dirs
+from asset_pack import open_asset_pack
+
+# Color of the pixels that are left out when a pre-rendered frame is displayed
+FRAME_COLORKEY = (255, 0, 255)
+
+# Soundeffects loaded before the menu is displayed, the other soundeffects keep loading in the background
+STARTUP_SOUND_EFFECTS = ('menu_nav', 'menu_confirm', 'menu_adjust')
+
+
+class AssetManager:
+    def __init__(self, game):
+        # REFERENCE
+        self.game = game  # Reference to the Game class to access its attributes & methods
+
+        # ASSET PACK (Memory-mapped once, every asset inside it is read without opening its own file)
+        self.pack = open_asset_pack()  # None if the pack has not been built (the asset files are loaded instead)
+
+        # ICON FILE PATH
+        self.icon_path = join(BASE_ICON_DIR, 'ibicon.png')
+
+        # IMAGE FILE PATHS (Each image path is mapped to the size the image is scaled to, None keeps the original size)
+        self.image_paths = {
+            # CREEPS
+            join(BASE_IMG_DIR, 'creeps', 'creep_purple_default.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'creeps', 'creep_white_default.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'creeps', 'creep_red_default.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'creeps', 'creep_red_rage.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'creeps', 'creep_cyan_default.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'creeps', 'creep_cyan_ice_tile.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'creeps', 'creep_yellow_default.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'creeps', 'creep_yellow_immune.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'creeps', 'creep_yellow_alert.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'creeps', 'creep_yellow_tmutated.png'): (TILE_SIZE, TILE_SIZE),
+            # POWERUPS
+            join(BASE_IMG_DIR, 'power_ups', 'explosion_radius_pwr.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'power_ups', 'explosion_radius_pwr_onice.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'power_ups', 'extra_bomb_pwr.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'power_ups', 'extra_bomb_pwr_onice.png'): (TILE_SIZE, TILE_SIZE),
+            # EXIT PORTAL
+            join(BASE_IMG_DIR, 'exit_portal', 'ep_closed.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'exit_portal', 'ep_open1.png'): (TILE_SIZE, TILE_SIZE),
+            join(BASE_IMG_DIR, 'exit_portal', 'ep_open2.png'): (TILE_SIZE, TILE_SIZE),
+            # DEATH SIGILS
+            join(BASE_IMG_DIR, 'death_sigils', 'death_sigil_green.png'): None,
+            join(BASE_IMG_DIR, 'death_sigils', 'death_sigil_blue.png'): None,
+            # MENU
+            join(BASE_IMG_DIR, 'menu', 'banner.png'): None,
+            join(BASE_IMG_DIR, 'menu', 'select_marker_bomb.png'): None,
+            join(BASE_IMG_DIR, 'menu', 'defeat_face.png'): (125, 125)
+        }
+
+        # FONT FILE PATHS (Each font name is mapped to its font file path and font size)
+        self.font_paths = {
+            'menu': (join(BASE_FONT_DIR, 'menu(upheaval-tt-brk).ttf'), 48),
+            'end': (join(BASE_FONT_DIR, 'end(arkkos-gmimi).ttf'), 90),
+            'pause_screen': (join(BASE_FONT_DIR, 'pause_screen(kindlyrewind).ttf'), 60),
+            'profiler': (None, 18)  # Pygame's default font
+        }
+
+        # SOUNDEFFECTS FILE PATHS
+        self.sound_effect_paths = {
+            'menu_nav': join(BASE_AUDIO_DIR, 'menu_nav_sfx.ogg'),
+            'menu_confirm': join(BASE_AUDIO_DIR, 'menu_confirm_sfx.ogg'),
+            'menu_adjust': join(BASE_AUDIO_DIR, 'menu_adjust_sfx.ogg'),
+            'end_game_victory': join(BASE_AUDIO_DIR, 'end_game_victory_sfx.ogg'),
+            'end_game_defeat': join(BASE_AUDIO_DIR, 'end_game_defeat_sfx.ogg'),
+            'pause_game': join(BASE_AUDIO_DIR, 'pause_game_sfx.ogg'),
+            'exit_portal_reveal': join(BASE_AUDIO_DIR, 'exit_portal_reveal_sfx.ogg'),
+            'powerup_reveal': join(BASE_AUDIO_DIR, 'powerup_reveal_sfx.ogg'),
+            'powerup_pickup': join(BASE_AUDIO_DIR, 'powerup_pickup_sfx.ogg'),
+            'bomb_countdown_tick': join(BASE_AUDIO_DIR, 'bomb_countdown_tick_sfx.ogg'),
+            'bomb_explosion': join(BASE_AUDIO_DIR, 'bomb_explosion_sfx.ogg'),
+            'player_death': join(BASE_AUDIO_DIR, 'player_death_sfx.ogg')
+        }
+
+        # LOADED ASSETS (Shared by every object in the game, looked up by their path or name)
+        self.images = {}  # Dictionary that stores the converted and scaled images by their image path
+        self.fonts = {}  # Dictionary that stores the font objects by their font name
+        self.sound_effects = {}  # Dictionary that stores the sound objects by their soundeffect name
+        self.bomb_frames = {}  # Dictionary that stores the pre-rendered bomb animation frames by their animation name
+        self.creep_frames = []  # List of the creep and ice tile frames shared by every instance (indexed by frame)
+
+        # BACKGROUND LOADING
+        self.pending_sound_effects = {}  # Dictionary that maps the soundeffects decoded in the background to their name
+
+    # This function loads every image and soundeffect once, the files are decoded (and the images scaled) in parallel
+    # on a thread pool and every finished image is converted on the calling thread, the progress function is called
+    # with the number of loaded assets and the total number of assets before loading and after each loaded asset
+    # Only the images and the menu soundeffects are waited for, the soundeffects played during a match keep decoding
+    # in the background and are stored once per frame (a soundeffect that is not stored yet is not played)
+    # (the display mode has to be set and the mixer initialized before calling this)
+    def load_images_and_sound_effects(self, on_progress=None):
+        executor = ThreadPoolExecutor(max_workers=ASSET_LOADER_THREADS)
+
+        # Submit the assets needed by the menu first, so they are decoded before the other soundeffects
+        startup_assets = {executor.submit(self.decode_sound_effect, self.sound_effect_paths[name]):
+                          (self.sound_effects, name) for name in STARTUP_SOUND_EFFECTS}
+        startup_assets.update({executor.submit(self.decode_image, image_path, size): (self.images, image_path)
+                               for image_path, size in self.image_paths.items()})
+        for effect_name, sound_effect_path in self.sound_effect_paths.items():
+            if effect_name not in STARTUP_SOUND_EFFECTS:
+                future = executor.submit(self.decode_sound_effect, sound_effect_path)
+                self.pending_sound_effects[future] = effect_name
+        executor.shutdown(wait=False)  # the worker threads exit once the background soundeffects are decoded
+
+        num_of_assets = len(startup_assets)
+        if on_progress is not None:
+            on_progress(0, num_of_assets)
+
+        # Store every asset needed by the menu as soon as it has been decoded
+        for num_of_loaded_assets, future in enumerate(as_completed(startup_assets), 1):
+            assets, name = startup_assets[future]
+            asset = future.result()
+            assets[name] = asset.convert_alpha() if assets is self.images else asset
+
+            if on_progress is not None:
+                on_progress(num_of_loaded_assets, num_of_assets)
+
+    # This function stores the soundeffects that finished decoding in the background (called once per frame on the main
+    # thread, an error raised while decoding a soundeffect is raised again here)
+    def store_loaded_sound_effects(self):
+        if not self.pending_sound_effects:
+            return
+        for future in [future for future in self.pending_sound_effects if future.done()]:
+            effect_name = self.pending_sound_effects.pop(future)
+            self.sound_effects[effect_name] = future.result()
+
+    # This function returns a file-like view of an asset inside the asset pack, or the asset's file path if the asset
+    # is not packed (both can be passed to pygame's loaders)
+    def open_asset(self, asset_path):
+        if self.pack is not None and asset_path in self.pack:
+            return self.pack.open(asset_path)
+        return asset_path
+
+    # This function decodes an image file and scales the image only if a size was defined for it (called on a worker
+    # thread, the image is converted to the display pixel format afterwards)
+    def decode_image(self, image_path, size):
+        image = pg.image.load(self.open_asset(image_path), image_path)
+        if size is not None:
+            image = pg.transform.smoothscale(image, size)
+        return image
+
+    # This function decodes a soundeffect file (called on a worker thread)
+    def decode_sound_effect(self, sound_effect_path):
+        return pg.mixer.Sound(file=self.open_asset(sound_effect_path))
+
+    # This function loads the window icon
+    def load_icon(self):
+        return pg.image.load(self.open_asset(self.icon_path), self.icon_path)
+
+    # This function collects the converted creep state images and the blank blink frame into the shared frame list
+    def load_creep_frames(self):
+        blank_frame = pg.Surface((TILE_SIZE, TILE_SIZE), pg.SRCALPHA).convert_alpha()
+        blank_frame.fill((0, 0, 0, 0))
+        self.creep_frames = [self.images[image_path] for image_path in CREEP_FRAME_PATHS] + [blank_frame]
+
+    # This function pre-renders the frames of the bomb's countdown and explosion animations once
+    def render_bomb_frames(self):
+        self.bomb_frames['countdown'] = [self.render_circle_frame(color, TILE_SIZE // 2)
+                                         for color in BOMB_COUNTDOWN_COLORS]
+        self.bomb_frames['explosion'] = [self.render_circle_frame(color, radius) for color, radius in EXPLOSION_PULSES]
+
+    # This function renders a circle onto a frame as large as the circle, the pixels around the circle are skipped
+    # with a colorkey (cheaper to blit than per pixel alpha)
+    @staticmethod
+    def render_circle_frame(color, radius):
+        frame = pg.Surface((2 * radius, 2 * radius))
+        frame.fill(FRAME_COLORKEY)
+        pg.draw.circle(frame, color, (radius, radius), radius)
+        frame.set_colorkey(FRAME_COLORKEY, pg.RLEACCEL)
+        return frame.convert()
+
+    # This function loads every font once
+    def load_fonts(self):
+        for font_name, (font_path, font_size) in self.font_paths.items():
+            font_file = self.open_asset(font_path) if font_path is not None else None  # None is the default font
+            self.fonts[font_name] = pg.font.Font(font_file, font_size)
+
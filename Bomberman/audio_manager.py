@@ -1,6 +1,9 @@
 # Ilijablaster/audio_manager.py
 import pygame as pg
 from settings import join, BASE_AUDIO_DIR
+from voice_pool import VoicePool
+from event_bus import GAME_STARTED, GAME_PAUSED, GAME_RESUMED, MENU_OPENED, MATCH_ENDED, END_SCREEN_SHOWN, \
+    PLAYER_DIED, PLAYER_EXITED
 
 
 class AudioManager:
@@ -12,23 +15,10 @@ class AudioManager:
         pg.mixer.pre_init(frequency=48000, size=32, channels=2, buffer=512)
         pg.mixer.init(frequency=48000, size=-16, channels=2, buffer=1024)
         self.num_of_channels = 8
+        pg.mixer.set_num_channels(self.num_of_channels)
+        pg.mixer.set_reserved(self.num_of_channels)  # the channels are only played on through the voice pool
         self.channels = [pg.mixer.Channel(i) for i in range(self.num_of_channels)]
-
-        # SOUNDEFFECTS FILE PATHS
-        self.sound_effect_paths = {
-            'menu_nav': join(BASE_AUDIO_DIR, 'menu_nav_sfx.ogg'),
-            'menu_confirm': join(BASE_AUDIO_DIR, 'menu_confirm_sfx.ogg'),
-            'menu_adjust': join(BASE_AUDIO_DIR, 'menu_adjust_sfx.ogg'),
-            'end_game_victory': join(BASE_AUDIO_DIR, 'end_game_victory_sfx.ogg'),
-            'end_game_defeat': join(BASE_AUDIO_DIR, 'end_game_defeat_sfx.ogg'),
-            'pause_game': join(BASE_AUDIO_DIR, 'pause_game_sfx.ogg'),
-            'exit_portal_reveal': join(BASE_AUDIO_DIR, 'exit_portal_reveal_sfx.ogg'),
-            'powerup_reveal': join(BASE_AUDIO_DIR, 'powerup_reveal_sfx.ogg'),
-            'powerup_pickup': join(BASE_AUDIO_DIR, 'powerup_pickup_sfx.ogg'),
-            'bomb_countdown_tick': join(BASE_AUDIO_DIR, 'bomb_countdown_tick_sfx.ogg'),
-            'bomb_explosion': join(BASE_AUDIO_DIR, 'bomb_explosion_sfx.ogg'),
-            'player_death': join(BASE_AUDIO_DIR, 'player_death_sfx.ogg')
-        }
+        self.voices = VoicePool(self.channels)  # voice pool that limits and prioritises the soundeffects
 
         # SOUNDTRACK FILE PATHS
         self.soundtrack_paths = {
@@ -36,13 +26,11 @@ class AudioManager:
             'ingame': join(BASE_AUDIO_DIR, 'game_theme_track.wav')
         }
 
-        # SOUNDEFFECTS
-        self.sound_effects = {name: pg.mixer.Sound(path) for name, path in self.sound_effect_paths.items()}
+        # SOUNDEFFECTS (Loaded once by the asset manager at startup)
+        self.sound_effects = self.game.assets.sound_effects
 
         # SFX FLAGS
         self.sound_effects_enabled = True
-        self.victory_sfx_playing = False
-        self.defeat_sfx_playing = False
 
         # MUSIC
         self.soundtracks = {track: path for track, path in self.soundtrack_paths.items()}
@@ -50,6 +38,19 @@ class AudioManager:
         # MUSIC FLAGS
         self.menu_soundtrack_playing = False
         self.ingame_soundtrack_playing = False
+        self.music_muted = False  # Flag used to mute the music while the game is paused or once the match is ending
+        self.match_ending = False  # Flag used to keep the music muted after a player died or left through the portal
+
+        # EVENTS (The soundtrack is arranged once per game state transition, never in headless mode)
+        if not self.game.headless:
+            self.game.events.subscribe(MENU_OPENED, self.on_menu_opened)
+            self.game.events.subscribe(GAME_STARTED, self.on_game_started)
+            self.game.events.subscribe(GAME_PAUSED, self.on_game_paused)
+            self.game.events.subscribe(GAME_RESUMED, self.on_game_resumed)
+            self.game.events.subscribe(PLAYER_DIED, self.on_player_died)
+            self.game.events.subscribe(PLAYER_EXITED, self.on_match_ending)
+            self.game.events.subscribe(MATCH_ENDED, self.on_match_ending)
+            self.game.events.subscribe(END_SCREEN_SHOWN, self.on_end_screen_shown)
 
     # This function toggles the game's soundeffects ON/OFF based on what is selected in menu audio options
     def toggle_sfx(self):
@@ -58,62 +59,80 @@ class AudioManager:
 
     # This function adjust the game's music volume based on what is selected in menu audio options
     def adjust_music_volume(self):
-        # If str 'OFF' found at index 0 in audio options set music volume to 0 (mute music)
-        if 'OFF' in self.game.menu.audio_options[0]:
+        # If the music is muted or str 'OFF' found at index 0 in audio options set music volume to 0 (mute music)
+        if self.music_muted or 'OFF' in self.game.menu.audio_options[0]:
             pg.mixer.music.set_volume(0)
         # Else, set music volume based on the percentage number inside the str
         else:
             new_volume_percentage = int(self.game.menu.audio_options[0].split()[-2].strip('<>%'))
             pg.mixer.music.set_volume(new_volume_percentage / 100)
 
-    # This function plays a sound effect based on the provided effect name and volume.
+    # This function plays a sound effect based on the provided effect name and volume on one of the reserved channels
+    # (the voice pool drops or steals voices once too many sound effects play at the same time)
     def play_sfx(self, effect_name, volume=1.0):
         effect_sound = self.sound_effects.get(effect_name)
-        if effect_sound:
-            effect_sound.set_volume(volume if self.sound_effects_enabled else 0)
-            effect_sound.play(maxtime=0)
+        if effect_sound and self.sound_effects_enabled:
+            self.voices.play(effect_name, effect_sound, volume, pg.time.get_ticks())
 
     # This function stops all currently playing sound effects
     def stop_all_sfx(self):
-        for sound_effect in self.sound_effects.values():
-            sound_effect.stop()
+        self.voices.stop_all()
 
     # This function plays the menu sountrack
     def play_menu_track(self):
-        pg.mixer.music.load(self.soundtracks['menu'])
+        pg.mixer.music.load(self.game.assets.open_asset(self.soundtracks['menu']), self.soundtracks['menu'])
         pg.mixer.music.play(loops=-1)
         pg.mixer.music.set_volume(1)
 
     # This function plays the ingame sountrack
     def play_ingame_track(self):
-        pg.mixer.music.load(self.soundtracks['ingame'])
+        pg.mixer.music.load(self.game.assets.open_asset(self.soundtracks['ingame']), self.soundtracks['ingame'])
         pg.mixer.music.play(loops=-1)
         pg.mixer.music.set_volume(1)
 
-    # This function handles the soundtrack arrangement (what track is played at what condition) for the game
-    def track_arrangement(self):
-        if self.game.in_menu:
-            if not self.menu_soundtrack_playing:
-                self.play_menu_track()
-                self.menu_soundtrack_playing = True
-                self.ingame_soundtrack_playing = False
-        else:
-            if not self.ingame_soundtrack_playing:
-                self.play_ingame_track()
-                self.ingame_soundtrack_playing = True
-                self.menu_soundtrack_playing = False
-
-            # Mute pygame mixer music when player collides with creep or is hit by bomb explosion
-            for player in self.game.players:
-                if player.collided_with_creep or player.hit_by_bomb_explosion or player.collided_with_exit_portal:
-                    pg.mixer.music.set_volume(0)
-
-            # Mute pygame mixer music when game is paused or end game screen is pulled up
-            if self.game.menu.in_end or self.game.paused:
-                pg.mixer.music.set_volume(0)
+    # This function plays the menu soundtrack when the main menu is opened
+    def on_menu_opened(self):
+        self.music_muted = False
+        if not self.menu_soundtrack_playing:
+            self.play_menu_track()
+            self.menu_soundtrack_playing = True
+            self.ingame_soundtrack_playing = False
+
+    # This function plays the ingame soundtrack (unmuted) when a new match starts
+    def on_game_started(self):
+        self.music_muted = False
+        self.match_ending = False
+        if not self.ingame_soundtrack_playing:
+            self.play_ingame_track()
+            self.ingame_soundtrack_playing = True
+            self.menu_soundtrack_playing = False
+
+    # This function mutes the music while the game is paused
+    def on_game_paused(self):
+        self.music_muted = True
+
+    # This function unmutes the music when the game resumes, unless the match is ending
+    def on_game_resumed(self):
+        self.music_muted = self.match_ending
+
+    # This function plays the player death soundeffect and mutes the music
+    def on_player_died(self, player):
+        self.play_sfx('player_death', volume=0.2)
+        self.on_match_ending()
+
+    # This function mutes the music for the rest of the match (a player died or collided with the exit portal)
+    def on_match_ending(self, *args):
+        self.match_ending = True
+        self.music_muted = True
+
+    # This function plays the end game soundeffect of the outcome displayed on the end screen
+    def on_end_screen_shown(self, outcome):
+        if outcome == 'victory':
+            self.play_sfx('end_game_victory', volume=0.5)
+        elif outcome == 'defeat':
+            self.play_sfx('end_game_defeat', volume=0.5)
 
     # This function handles dynamic updates for the audio
     def update(self):
         self.toggle_sfx()
         self.adjust_music_volume()
-        self.track_arrangement()
@@ -0,0 +1,274 @@
+# Bomberman/benchmark.py
+import sys
+import json
+import math
+import random
+import platform
+from time import perf_counter
+import pygame as pg
+from settings import FPS, BENCHMARK_FRAMES, BENCHMARK_REGRESSION_THRESHOLD, BENCHMARK_MIN_REGRESSION_MS
+from main import Game
+from bomb import Bomb
+from creep import Creep, IceTile
+from player import Player
+from level_manager import LevelManager
+from replay import MatchReplay, INPUT_BITS_PER_PLAYER
+
+# Methods whose call durations are measured in every scenario, as (class, method name)
+TIMED_METHODS = (
+    (Game, 'update'),
+    (Game, 'draw'),
+    (Creep, 'pathfind'),
+    (Bomb, 'detonate'),
+    (Bomb, 'explosion_animation'),
+    (Player, 'movement'),
+    (LevelManager, 'setup')
+)
+
+# Percentiles reported (and compared against the baseline) for every timed method
+PERCENTILES = (50, 95, 99)
+
+# Methods called fewer times than this in a scenario are too noisy to be compared against the baseline
+MIN_COMPARED_SAMPLES = 10
+
+# Number of frames a scripted player keeps walking in the same direction
+SCRIPTED_INPUT_FRAMES = 30
+
+
+class MethodTimer:
+    def __init__(self, methods):
+        # METHODS
+        self.methods = methods  # Tuple of the (class, method name) pairs to measure
+        self.original_methods = {}  # Dictionary that maps a (class, method name) pair to its unwrapped method
+
+        # SAMPLES
+        self.samples = {self.label(cls, name): [] for cls, name in methods}  # Call durations in ms of every method
+
+    # This function returns the label under which the call durations of a method are reported
+    @staticmethod
+    def label(cls, name):
+        return f"{cls.__name__}.{name}"
+
+    # This function replaces every measured method with a wrapper that records the duration of each call
+    def install(self):
+        for cls, name in self.methods:
+            self.original_methods[(cls, name)] = cls.__dict__[name]
+            setattr(cls, name, self.timed(cls.__dict__[name], self.samples[self.label(cls, name)]))
+
+    # This function puts the unwrapped methods back in place
+    def uninstall(self):
+        for (cls, name), method in self.original_methods.items():
+            setattr(cls, name, method)
+        self.original_methods.clear()
+
+    # This function wraps a method so the duration of each call is appended to the given samples list
+    @staticmethod
+    def timed(method, samples):
+        def timed_method(*args, **kwargs):
+            start = perf_counter()
+            result = method(*args, **kwargs)
+            samples.append((perf_counter() - start) * 1000)
+            return result
+        return timed_method
+
+    # This function empties the recorded samples, so the timer can be reused for the next scenario
+    def reset(self):
+        for samples in self.samples.values():
+            samples.clear()
+
+    # This function summarizes the recorded samples of every method that was called at least once
+    def summary(self):
+        return {label: summarize(samples) for label, samples in self.samples.items() if samples}
+
+
+# This function returns the nearest-rank percentile of a sorted list of samples
+def percentile(sorted_samples, percent):
+    return sorted_samples[max(0, math.ceil(percent / 100 * len(sorted_samples)) - 1)]
+
+
+# This function summarizes a list of call durations (in ms) by their count, mean and percentiles
+def summarize(samples):
+    sorted_samples = sorted(samples)
+    summary = {'count': len(samples), 'mean': round(sum(samples) / len(samples), 4)}
+    for percent in PERCENTILES:
+        summary[f"p{percent}"] = round(percentile(sorted_samples, percent), 4)
+    return summary
+
+
+# This function scripts the ticks of a benchmarked match: the players walk in a random direction (or stand still)
+# and pick a new one every few frames, bombs are only dropped by the scenarios
+def scripted_ticks(seed, num_of_ticks, num_of_players):
+    rng = random.Random(seed)
+    ticks = []
+    input_bits = 0
+    for tick in range(num_of_ticks):
+        if tick % SCRIPTED_INPUT_FRAMES == 0:
+            input_bits = 0
+            for player_index in range(num_of_players):
+                direction = rng.choice([None, 0, 1, 2, 3])  # UP, DOWN, LEFT, RIGHT bit or standing still
+                if direction is not None:
+                    input_bits |= 1 << (direction + player_index * INPUT_BITS_PER_PLAYER)
+        ticks.append((round((tick + 1) * 1000 / FPS), input_bits))
+    return ticks
+
+
+# This function drops 20 bombs with an explosion radius of 5 on random paths outside of the players rows and columns
+def drop_bomb_barrage(game, rng):
+    player = game.players[0]
+    player_rows = {other_player.location[0] for other_player in game.players}
+    player_cols = {other_player.location[1] for other_player in game.players}
+    cells = [(int(row), int(col)) for row, col in game.level.find_cells({1})
+             if row not in player_rows and col not in player_cols]
+
+    for row, col in rng.sample(cells, min(20, len(cells))):
+        bomb = Bomb(game, player, row, col, 5)
+        player.bombs.append(bomb)
+        game.level.set_cell_value(row, col, 6)
+
+
+# This function covers every path of the level (including the players starting cells) in ice tiles
+def cover_level_in_ice(game, rng):
+    for cell in game.level.find_cells({1, 3, 4}):
+        game.ice_tiles.append(IceTile(game, (int(cell[0]), int(cell[1])), IceTile.current_cluster_id))
+    IceTile.current_cluster_id += 1
+
+
+# Benchmark scenarios, each one starts matches with the given settings (the same settings a replay stores), calls
+# its setup function on every started match and restarts the match after 'match_frames' frames or once it ended
+SCENARIOS = {
+    'default': {
+        'settings': {'game_mode_2player': False, 'custom_options': ['< Default >', 'Back'],
+                     'level_size': None, 'level_seed': None},
+        'setup': None,
+        'match_frames': None
+    },
+    'creep_horde': {
+        'settings': {'game_mode_2player': False,
+                     'custom_options': ['< Custom >', 'Breakable Walls - < 40 >', 'Purple Creeps - < 100 >',
+                                        'White Creeps - < 100 >', 'Red Creeps - < 100 >', 'Cyan Creeps - < 100 >',
+                                        'Yellow Creeps - < 100 >', 'Back'],
+                     'level_size': [41, 61], 'level_seed': 0},
+        'setup': None,
+        'match_frames': None
+    },
+    'bomb_barrage': {
+        'settings': {'game_mode_2player': True, 'custom_options': ['< Default >', 'Back'],
+                     'level_size': None, 'level_seed': None},
+        'setup': drop_bomb_barrage,
+        'match_frames': 4 * FPS + FPS // 10  # one barrage lasts 4 seconds (countdown + explosion)
+    },
+    'ice_field': {
+        'settings': {'game_mode_2player': True, 'custom_options': ['< Default >', 'Back'],
+                     'level_size': None, 'level_seed': None},
+        'setup': cover_level_in_ice,
+        'match_frames': None
+    },
+    'level_setup': {
+        'settings': {'game_mode_2player': True, 'custom_options': ['< Default >', 'Back'],
+                     'level_size': [51, 101], 'level_seed': 0},
+        'setup': None,
+        'match_frames': 1
+    }
+}
+
+
+# This function runs a scenario for a number of frames (drawing and updating the game every frame) and returns the
+# summarized call durations of the timed methods
+def run_scenario(scenario, frames, timer):
+    settings = scenario['settings']
+    level_size = tuple(settings['level_size']) if settings['level_size'] else None
+    game = Game(headless=True, level_size=level_size, level_seed=settings['level_seed'])
+    num_of_players = 2 if settings['game_mode_2player'] else 1
+
+    timer.reset()
+    remaining_frames = frames
+    match_index = 0
+    while remaining_frames > 0:
+        # Start the next match as a replay of scripted ticks, every match gets its own seed
+        match_frames = min(remaining_frames, scenario['match_frames'] or remaining_frames)
+        game.replay = MatchReplay(match_index, settings, scripted_ticks(match_index, match_frames, num_of_players))
+        game.replay.start(game)
+        if scenario['setup'] is not None:
+            scenario['setup'](game, random.Random(match_index))
+
+        # Draw and update the game until the match ends or its frames run out
+        for _ in range(match_frames):
+            game.draw()
+            game.update()
+            remaining_frames -= 1
+            if game.menu.in_end:
+                break
+
+        game.replay = None
+        match_index += 1
+
+    return timer.summary()
+
+
+# This function compares benchmark results against baseline results and returns the regressions found, a percentile
+# regresses when it is slower than the baseline by more than the threshold of its method (and by more than noise)
+def compare_results(results, baseline, threshold, method_thresholds):
+    regressions = []
+    for scenario_name, methods in results['scenarios'].items():
+        baseline_methods = baseline['scenarios'].get(scenario_name, {})
+        for label, summary in methods.items():
+            if label not in baseline_methods or min(summary['count'], baseline_methods[label]['count']) \
+                    < MIN_COMPARED_SAMPLES:
+                continue
+            allowed_slowdown = method_thresholds.get(label, threshold)
+            for percent in PERCENTILES:
+                key = f"p{percent}"
+                current, previous = summary[key], baseline_methods[label][key]
+                if current > previous * (1 + allowed_slowdown) and current - previous > BENCHMARK_MIN_REGRESSION_MS:
+                    regressions.append((scenario_name, label, key, previous, current))
+    return regressions
+
+
+# This function returns the value passed after an option on the command line (None if the option is missing)
+def option_value(option):
+    return sys.argv[sys.argv.index(option) + 1] if option in sys.argv[:-1] else None
+
+
+# Run this file to benchmark the game under the SDL dummy drivers (no display needed), options:
+# '--scenarios NAME,NAME' to run only some scenarios, '--frames N' to change the frames simulated per scenario,
+# '--output FILE' to write the results as JSON, '--baseline FILE' to compare the results against stored results,
+# '--threshold FRACTION' and '--thresholds LABEL=FRACTION,...' to set the allowed slowdown (in total or per method)
+if __name__ == "__main__":
+    scenario_names = option_value('--scenarios').split(',') if option_value('--scenarios') else list(SCENARIOS)
+    frames = int(option_value('--frames')) if option_value('--frames') else BENCHMARK_FRAMES
+
+    # Run every selected scenario with the timed methods measured
+    method_timer = MethodTimer(TIMED_METHODS)
+    method_timer.install()
+    benchmark_results = {
+        'frames': frames,
+        'python': platform.python_version(),
+        'pygame': pg.version.ver,
+        'scenarios': {}
+    }
+    for scenario_name in scenario_names:
+        benchmark_results['scenarios'][scenario_name] = run_scenario(SCENARIOS[scenario_name], frames, method_timer)
+        for method_label, method_summary in benchmark_results['scenarios'][scenario_name].items():
+            print(f"{scenario_name:<14} {method_label:<26} n={method_summary['count']:<7} "
+                  + ' '.join(f"p{percent}={method_summary[f'p{percent}']:.3f}ms" for percent in PERCENTILES))
+    method_timer.uninstall()
+
+    if option_value('--output'):
+        with open(option_value('--output'), 'w') as file:
+            json.dump(benchmark_results, file, indent=2)
+
+    # Compare the results against the baseline and fail if any method regressed
+    if option_value('--baseline'):
+        with open(option_value('--baseline')) as file:
+            baseline_results = json.load(file)
+
+        default_threshold = float(option_value('--threshold') or BENCHMARK_REGRESSION_THRESHOLD)
+        threshold_options = option_value('--thresholds').split(',') if option_value('--thresholds') else []
+        thresholds = {option.split('=')[0]: float(option.split('=')[1]) for option in threshold_options}
+
+        found_regressions = compare_results(benchmark_results, baseline_results, default_threshold, thresholds)
+        for scenario_name, method_label, key, baseline_ms, current_ms in found_regressions:
+            print(f"REGRESSION {scenario_name} {method_label} {key}: {baseline_ms:.3f}ms -> {current_ms:.3f}ms")
+        if found_regressions:
+            sys.exit(1)
+        print("No regressions against the baseline")
@@ -1,10 +1,19 @@
 # Bomberman/bomb.py
 import pygame as pg
 from settings import TILE_SIZE, BLACK, REDBROWN, RED
-from timer_utils import *
+from render_queue import LAYER_BOMBS
+from event_bus import BOMB_EXPLODED
 
 vec2d = pg.math.Vector2
 
+# Colors of the bomb's countdown frames (more than 2 seconds left, more than 1 second left, last second)
+BOMB_COUNTDOWN_COLORS = (BLACK, REDBROWN, RED)
+
+# Colors and radii of the explosion's pulse frames, each frame is displayed for the pulse duration (in ms)
+EXPLOSION_PULSES = ((RED, TILE_SIZE // 3), (REDBROWN, TILE_SIZE // 4), (RED, TILE_SIZE // 3),
+                    (REDBROWN, TILE_SIZE // 4), (RED, TILE_SIZE // 3))
+EXPLOSION_PULSE_DURATION = 200
+
 
 class Bomb:
     def __init__(self, game, player, row_index, column_index, explosion_radius):
@@ -18,6 +27,8 @@ class Bomb:
         # HITBOX (The definition of a (rect) represents the tangible presence of the object within the program))
         self.rect = pg.Rect(column_index * TILE_SIZE, row_index * TILE_SIZE, TILE_SIZE, TILE_SIZE)  # Bomb rect
         self.radius = TILE_SIZE // 2  # Bomb radius (for drawing purposes)
+        self.game.bomb_index.insert(self, self.rect)  # Add the bomb to the bomb spatial index
+        self.game.render_queue.add(self, LAYER_BOMBS)  # Add the bomb to the game's render queue
 
         # COUNTDOWN
         self.countdown_active = True  # The countdown is active when an instance of Bomb object is created
@@ -32,26 +43,18 @@ class Bomb:
             (1, 0)]  # Represents RIGHTWARD propagation
         self.explosion_radius = explosion_radius  # Range of the bomb's explosion (referenced inside Player class)
         self.explosion_active = False  # Explosion is not active when an instance of Bomb object is created
+        self.explosion_cells = frozenset()  # Cells affected by the explosion (computed once when the bomb detonates)
+        self.detonation_queued = False  # Flag used to indicate the bomb is queued to detonate (or has detonated)
 
-        # TIMER DATA
-        self.bomb_countdown_timers_dict = {
-            # BOMB COUNTDOWN TIMERS
-            'current_time': 0,
-            'start_time': pg.time.get_ticks(),
-            'duration': 3000,
-            'time_until_completion': 0,
-            'paused_time': 0}
-        self.bomb_explosion_timers_dict = {
-            # BOMB EXPLOSION TIMERS
-            'current_time': 0,
-            'start_time': 0,
-            'duration': 1000,
-            'time_until_completion': 0,
-            'paused_time': 0}
+        # TIMERS (Scheduled inside the game's timer scheduler, the bomb is woken up when their deadline passes)
+        self.countdown_duration = 3000  # Duration of the bomb's countdown portion in ms
+        self.explosion_duration = 1000  # Duration of the bomb's explosion portion in ms
+        self.countdown_timer = self.game.timers.schedule(self.countdown_duration, self.countdown_aftermath)
+        self.explosion_timer = None  # Timer of the explosion portion, scheduled when the countdown expires
 
         # BOMB OBJECT OVERALL
-        self.duration = self.bomb_countdown_timers_dict['duration'] + self.bomb_explosion_timers_dict['duration']
-        self.overall_start_time = pg.time.get_ticks() + self.duration  # Define (initial time + duration) start time
+        self.duration = self.countdown_duration + self.explosion_duration
+        self.overall_start_time = self.game.game_clock.get_ticks() + self.duration  # Define (init time + duration) start
         self.is_active = True  # Bomb object is active immediately upon initialization of the class
 
     # This function handles the drawing of the bomb object and updates dynamically
@@ -62,39 +65,7 @@ class Bomb:
 
         # DRAW EXPLOSION ANIMATION
         elif self.explosion_active:
-            # Get the row and column indices of the current bomb cell position
-            bomb_row, bomb_col = self.location
-
-            # Iterate over each viable explosion direction
-            for delta_row, delta_col in self.viable_explosion_directions:
-                # Iterate over each distance from the bomb cell position up to the explosion radius
-                for distance in range(1, self.explosion_radius + 1):
-                    # Calculate the row and column indices of the cell in the current explosion direction and distance
-                    row = bomb_row + delta_row * distance
-                    col = bomb_col + delta_col * distance
-
-                    # Get the value of the cell from the level matrix
-                    cell_value = self.game.level.level_matrix[row][col]
-
-                    # Iterate through every cell (row and col) in the level_matrix
-                    if 0 <= row < self.game.level_rows and 0 <= col < self.game.level_cols:
-
-                        # Do not draw explosion circles in following cells:
-                        # '0'=BORDER, '2'=PILLAR, '8'=E.PORTAL(AR), '10'=POWERUP(AR)
-                        if cell_value in {0, 2, 8, 10}:
-                            break
-
-                        # Draw an explosion circle on top of the following cells (but break from drawing elsewhere):
-                        # '5'=BRITTLE, '7'=E.PORTAL(BR), '9'=POWERUP(BR)
-                        if cell_value in {5, 7, 9}:
-                            self.explosion_animation(row, col)
-                            break
-
-                        # Draw the rest of the explosion circles where the explosion area rects are located
-                        self.explosion_animation(row, col)
-                        continue
-
-                    break
+            self.explosion_animation()
 
     # This function handles pushback physics that occur if a player collides with a bomb that's not that player's bomb
     def pushback_player(self):
@@ -134,17 +105,19 @@ class Bomb:
                 if not self.rect.colliderect(player_rect):
                     break  # when bomb and player recta are no longer colliding, exit loop
 
+            self.game.player_index.move(player, player_rect)  # keep the player spatial index up to date
+
     # This function handles the animation for the countdown portion of the bomb object
     def countdown_animation(self):
-        countdown_color = BLACK
-        countdown_timer = self.bomb_countdown_timers_dict['time_until_completion']
+        frame_index = 0
+        countdown_timer = self.game.timers.time_remaining(self.countdown_timer)
 
         # Cycle through the timer based on countdown 'time until completion'
         if countdown_timer > 2000:
-            countdown_color = BLACK
+            frame_index = 0
 
         elif countdown_timer > 1000:
-            countdown_color = REDBROWN
+            frame_index = 1
 
             # If the countdown tick sound hasn't been played yet, play it and mark it as played
             if not self.countdown_sound_played:
@@ -152,110 +125,86 @@ class Bomb:
                 self.countdown_sound_played = True
 
         elif 0 < countdown_timer <= 1000:
-            countdown_color = RED
+            frame_index = 2
 
             # If the countdown tick sound has been played, play it again and mark it as not played
             if self.countdown_sound_played:
                 self.game.audio.play_sfx('bomb_countdown_tick', volume=0.2)
                 self.countdown_sound_played = False
 
-        # Draw the circle that represents the bomb
-        pg.draw.circle(self.game.window, countdown_color, (self.rect.centerx, self.rect.centery), self.radius)
+        # Display the pre-rendered frame of the bomb and report the area drawn on the game window
+        countdown_frame = self.game.assets.bomb_frames['countdown'][frame_index]
+        self.game.dirty_rects.append(self.game.window.blit(
+            countdown_frame, countdown_frame.get_rect(center=self.game.camera.apply_point(self.rect.center))))
 
     # This function handles the aftermatch for the countdown portion of the bomb object
     def countdown_aftermath(self):
+        self.game.detonations.queue_detonation(self)  # detonate during the next propagation pass
+
+    # This function detonates the bomb, called by the game's detonation system once the bomb's turn in the queue comes
+    def detonate(self):
         self.countdown_active = False  # set countdown_active to False
         self.explosion_active = True  # set explosion_active to True (indicating start of explosion portion of the bomb)
-        self.bomb_explosion_timers_dict['start_time'] = pg.time.get_ticks()  # init timer as bomb explosion 'start_time'
+        self.compute_explosion_footprint()  # compute the cells affected by the explosion
+        self.revert_level_matrix_cell_value()  # change/revert the map value of the bomb's cell
+        self.explosion_timer = self.game.timers.schedule(self.explosion_duration, self.explosion_aftermath)
+        self.overall_start_time = self.game.game_clock.get_ticks() + self.explosion_duration  # earlier when chained
         self.game.audio.play_sfx('bomb_explosion', volume=0.3)
-
-    # This function sets up the timer for the countdown portion of the bomb object
-    def countdown_timer_setup(self):
-        # Set up the countdown timer and return a dictionary containing the time until completion
-        return {
-            'time_until_completion': adjust_bomb_timer(
-                start_time=self.bomb_countdown_timers_dict.get('start_time'),
-                duration=self.bomb_countdown_timers_dict.get('duration'),
-                init_timer=pg.time.get_ticks(),
-                on_expire_action=self.countdown_aftermath
-            )
-        }
-
-    # This function updates the timer for the countdown portion of the bomb object
-    def countdown_timer_update(self):
-        countdown_timer = self.countdown_timer_setup()
-        self.bomb_countdown_timers_dict['time_until_completion'] = countdown_timer['time_until_completion']
+        self.game.events.publish(BOMB_EXPLODED, self)
 
     # This function handles the animation for the explosion portion of the bomb object
-    def explosion_animation(self, row, col):
-        # Define explosion color and size patterns as a dictionary
-        EXPLOSION_PATTERN = {
-            800: (RED, TILE_SIZE // 3),
-            600: (REDBROWN, TILE_SIZE // 4),
-            400: (RED, TILE_SIZE // 3),
-            200: (REDBROWN, TILE_SIZE // 4),
-            0: (RED, TILE_SIZE // 3)
-        }
-
-        # Get x and y center coordinates from the row and column of the explosion rects
-        y_center = row * TILE_SIZE + TILE_SIZE // 2
-        x_center = col * TILE_SIZE + TILE_SIZE // 2
-
-        # Determine the appropriate color and size based on bomb explosion 'time until completion'
-        time_until_completion = self.bomb_explosion_timers_dict['time_until_completion']
-        for time in sorted(EXPLOSION_PATTERN.keys(), reverse=True):
-            if time_until_completion > time:
-                color, size = EXPLOSION_PATTERN[time]
-                break
-        else:
-            # If the loop completes without finding a suitable pattern, use default values
-            color, size = RED, TILE_SIZE // 3
-
-        # Draw explosion circle
-        pg.draw.circle(self.game.window, color, (x_center, y_center), size)
+    def explosion_animation(self):
+        # Select the pulse frame by the time elapsed since the explosion started (the last frame once it is over)
+        time_until_completion = self.game.timers.time_remaining(self.explosion_timer)
+        frame_index = len(EXPLOSION_PULSES) - 1
+        if time_until_completion > 0:
+            elapsed_time = max(0, int(self.explosion_duration - time_until_completion))
+            frame_index = min(frame_index, elapsed_time // EXPLOSION_PULSE_DURATION)
+
+        # Display the pre-rendered frame on top of every cell inside the explosion footprint in one batch and report
+        # the areas drawn on the game window
+        explosion_frame = self.game.assets.bomb_frames['explosion'][frame_index]
+        frame_offset = (TILE_SIZE - explosion_frame.get_width()) // 2  # centers the frame inside the cell
+        offset_x, offset_y = self.game.camera.apply_point((frame_offset, frame_offset))
+        self.game.dirty_rects.extend(self.game.window.blits(
+            [(explosion_frame, (col * TILE_SIZE + offset_x, row * TILE_SIZE + offset_y))
+             for row, col in self.explosion_cells]))
 
     # This function handles the aftermah for the explosion portion of the bomb object
     def explosion_aftermath(self):
         self.explosion_active = False  # set explosion_active to False
         self.is_active = False  # set bomb self.active flag to False (bomb object no longer active)
+        self.game.detonations.remove_blast(self)  # remove the explosion footprint from the blast mask
+        self.apply_explosion_impact()  # change the cells that were hit by the explosion
 
-    # This function handles the timer setup for the explosion portion of the bomb object
-    def explosion_timer_setup(self):
-        # Set up the explosion timer and return a dictionary containing the time until completion
-        return {
-            'time_until_completion': adjust_bomb_timer(
-                start_time=self.bomb_explosion_timers_dict.get('start_time'),
-                duration=self.bomb_explosion_timers_dict.get('duration'),
-                init_timer=pg.time.get_ticks(),
-                on_expire_action=self.explosion_aftermath
-            )
-        }
-
-    # This function handles the explosion logic of the bomb object
-    def explosion(self):
+    # This function changes the values of the cells hit by the explosion once the explosion is over
+    def apply_explosion_impact(self):
         level_matrix = self.game.level.level_matrix  # get the level matrix from the game
-        explosion_rects = []  # create a list to store rects representing areas affected by the explosion
-        explosion_affected_cells = set()  # create a set to store affected cells by the explosion
-        bomb_row, bomb_column = self.location  # get the current bomb position
 
-        # Check if explosion is not active, if so, return an empty list
-        if not self.explosion_active:
-            return explosion_rects
+        # Iterate through the explosion footprint and update the cell values based on explosion impact
+        for row, col in self.explosion_cells:
+            cell_value = level_matrix[row][col]
 
-        # Precompute explosion directions and distances
-        explosion_directions = [(delta_row, delta_col) for delta_row, delta_col in self.viable_explosion_directions]
-        explosion_max_distance = self.explosion_radius + 1
+            if cell_value == 5:
+                self.game.level.set_cell_value(row, col, 1)  # change: '5'=BRITTLE -> '1'=PATH
 
-        # EXPLOSION TIMER SETUP (Get the explosion timer and update the bomb explosion timers dictionary)
-        explosion_timer = self.explosion_timer_setup()
-        self.bomb_explosion_timers_dict['time_until_completion'] = explosion_timer['time_until_completion']
+            elif cell_value == 7:
+                self.game.audio.play_sfx('exit_portal_reveal', volume=0.8)
+                self.game.level.set_cell_value(row, col, 8)  # change: '7'=E.PORTAL(BR) -> '8'=E.PORTAL(AR)
 
-        # Batch cell value changes
-        cell_value_changes = []  # create a list to store cell value changes during the explosion
+            elif cell_value == 9:
+                self.game.audio.play_sfx('powerup_reveal', volume=0.8)
+                self.game.level.set_cell_value(row, col, 10)  # change: '9'=POWERUP(BR) -> '10'=POWERUP(AR)
+
+    # This function computes the cells affected by the explosion once, when the bomb detonates
+    def compute_explosion_footprint(self):
+        level_matrix = self.game.level.level_matrix  # get the level matrix from the game
+        explosion_affected_cells = set()  # create a set to store affected cells by the explosion
+        bomb_row, bomb_column = self.location  # get the current bomb position
 
         # Loop through each direction and distance to compute the explosion
-        for delta_row, delta_col in explosion_directions:
-            for distance in range(1, explosion_max_distance):
+        for delta_row, delta_col in self.viable_explosion_directions:
+            for distance in range(1, self.explosion_radius + 1):
                 row = bomb_row + delta_row * distance
                 col = bomb_column + delta_col * distance
 
@@ -273,42 +222,13 @@ class Bomb:
 
                 explosion_affected_cells.add((row, col))  # add cell to the set of affected cells
 
-                # Check if explosion propagation should stop ('5'=BRITTLE, '7'=E.PORTAL(BR), '9'=POWERUP(BR))
-                if self.explosion_active and cell_value in {5, 7, 9}:
-                    break
-
-                # Update cell value based on explosion impact
-                elif cell_value == 5:
-                    cell_value_changes.append((row, col, 1))  # change: '5'=BRITTLE -> '1'=PATH
-                    break
-
-                elif cell_value == 7:
-                    self.game.audio.play_sfx('exit_portal_reveal', volume=0.8)
-                    cell_value_changes.append((row, col, 8))  # change: '7'=E.PORTAL(BR) -> '8'=E.PORTAL(AR)
-                    break
-                elif cell_value == 9:
-                    self.game.audio.play_sfx('powerup_reveal', volume=0.8)
-                    cell_value_changes.append((row, col, 10))  # change: '9'=POWERUP(BR) -> '10'=POWERUP(AR)
+                # Check if explosion propagation should stop ('5'=BRITTLE, '7'=E.PORTAL(BR), '9'=POWERUP(BR)) or if
+                # it reached a bomb ('6'=BOMB, '66'=DROPPED BOMB), which carries the chain reaction on with its blast
+                if cell_value in {5, 6, 7, 9, 66}:
                     break
 
-        # Apply batch cell value changes (old value gets overwritten by new value at specific row & col in level_matrix)
-        for row, col, new_value in cell_value_changes:
-            level_matrix[row][col] = new_value
-
-        # Create explosion rectangles for affected cells (reuse single Rect object)
-        explosion_rect_template = pg.Rect(0, 0, TILE_SIZE // 2, TILE_SIZE // 2)
-
-        # Create explosion rectangles for affected cells
-        for row, col in explosion_affected_cells:
-            explosion_rect = explosion_rect_template.copy()  # copy to avoid reference issues
-            explosion_rect.center = (col * TILE_SIZE + TILE_SIZE // 2, row * TILE_SIZE + TILE_SIZE // 2)
-            explosion_rects.append(explosion_rect)
-
-        # Enact function that changes/reverts map values for areas affected by bomb
-        self.revert_level_matrix_cell_value()
-
-        # Return explosion_rects list
-        return explosion_rects
+        # Store the affected cells as an immutable set shared by the blast mask and the drawing logic
+        self.explosion_cells = frozenset(explosion_affected_cells)
 
     # This function changes the cell value of the bomb back to '1' ('1'=PATH)
     def revert_level_matrix_cell_value(self):
@@ -318,25 +238,7 @@ class Bomb:
 
         # If map cell value is not: ('3'=PLAYER POS., '4'=PLAYER ADJACENT POS., '7'=E.PORTAL(AR), '8'=E.PORTAL(BR))
         if current_lvl_matrix_value not in {3, 4, 7, 8}:
-            level_matrix[bomb_row][bomb_col] = 1  # change every other map cell value to '1'=PATH
+            self.game.level.set_cell_value(bomb_row, bomb_col, 1)  # change every other map cell value to '1'=PATH
 
         self.rect = None  # reset bomb self.rect back to None value
-
-    # This function starts a new timer count when the game is paused
-    def handle_timers_on_pause(self):
-        if self.game.paused:
-            self.game.paused_time = pg.time.get_ticks()
-
-    # This function updates the new start time for the bomb timers when the game is resumed
-    def handle_timers_on_resume(self):
-        if not self.game.paused:
-            current_time = pg.time.get_ticks()
-            paused_time = self.game.paused_time
-            start_time = 'start_time'
-            update_start_time(self.bomb_countdown_timers_dict, current_time, paused_time, start_time)
-            update_start_time(self.bomb_explosion_timers_dict, current_time, paused_time, start_time)
-
-    # This function handles dynamic updates for the bomb object
-    def update(self):
-        if self.countdown_active:
-            self.countdown_timer_update()
+        self.game.bomb_index.remove(self)  # remove the bomb from the bomb spatial index
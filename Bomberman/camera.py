@@ -0,0 +1,41 @@
+# Bomberman/camera.py
+import pygame as pg
+from settings import TILE_SIZE
+
+
+class Camera:
+    def __init__(self, game):
+        # REFERENCE
+        self.game = game  # Reference to the Game class to access its attributes & methods
+
+        # VIEWPORT (Area of the level, in level coordinates, that is displayed on the game window)
+        self.viewport = pg.Rect((0, 0), self.game.window.get_size())  # Viewport rect the size of the game window
+        self.drawn_viewport_topleft = None  # Position of the viewport when the game objects were last drawn
+        self.moved = False  # Flag used to indicate if the viewport moved since the game objects were last drawn
+
+    # This function centers the viewport on the players (keeping it inside the level)
+    def follow(self, players):
+        if players:
+            self.viewport.center = (sum(player.rect.centerx for player in players) // len(players),
+                                    sum(player.rect.centery for player in players) // len(players))
+
+        # A viewport larger than the level gets centered on the level instead
+        level_rect = pg.Rect(0, 0, self.game.level_cols * TILE_SIZE, self.game.level_rows * TILE_SIZE)
+        self.viewport.clamp_ip(level_rect)
+
+    # This function marks the start of a drawn frame and checks if the viewport moved since the last drawn frame
+    def begin_frame(self):
+        self.moved = self.viewport.topleft != self.drawn_viewport_topleft
+        self.drawn_viewport_topleft = self.viewport.topleft
+
+    # This function converts a rect from level coordinates into game window coordinates
+    def apply(self, rect):
+        return rect.move(-self.viewport.x, -self.viewport.y)
+
+    # This function converts a point from level coordinates into game window coordinates
+    def apply_point(self, point):
+        return point[0] - self.viewport.x, point[1] - self.viewport.y
+
+    # This function checks if a rect (in level coordinates) is at least partially inside the viewport
+    def is_visible(self, rect):
+        return self.viewport.colliderect(rect)
@@ -1,9 +1,8 @@
 # Ilijablaster/creep.py
-import random
 import pygame as pg
 from settings import join, TILE_SIZE, BASE_IMG_DIR, IMPASSABLE_CELLS
-from timer_utils import adjust_ice_tile_spawn_timer, adjust_ice_tile_remove_timer, update_start_time, \
-    update_timer_data_on_pause, update_timer_data_on_resume
+from render_queue import LAYER_ICE_TILES, LAYER_IMMUNE_CREEPS, LAYER_CREEPS
+from event_bus import CREEP_KILLED
 
 vec2d = pg.math.Vector2
 
@@ -20,23 +19,13 @@ creep_yellow_alert_imgpath = join(BASE_IMG_DIR, 'creeps', 'creep_yellow_alert.pn
 creep_yellow_tmutated_imgpath = join(BASE_IMG_DIR, 'creeps', 'creep_yellow_tmutated.png')
 creep_cyan_ice_tile_imgpath = join(BASE_IMG_DIR, 'creeps', 'creep_cyan_ice_tile.png')
 
-# A dictionary that is used as a cache with preloaded and scaled creep images
-creep_image_cache = {
-    creep_purple_imgpath: pg.transform.smoothscale(pg.image.load(creep_purple_imgpath), (TILE_SIZE, TILE_SIZE)),
-    creep_white_imgpath: pg.transform.smoothscale(pg.image.load(creep_white_imgpath), (TILE_SIZE, TILE_SIZE)),
-    creep_red_imgpath: pg.transform.smoothscale(pg.image.load(creep_red_imgpath), (TILE_SIZE, TILE_SIZE)),
-    creep_red_rage_imgpath: pg.transform.smoothscale(pg.image.load(creep_red_rage_imgpath), (TILE_SIZE, TILE_SIZE)),
-    creep_cyan_imgpath: pg.transform.smoothscale(pg.image.load(creep_cyan_imgpath), (TILE_SIZE, TILE_SIZE)),
-    creep_cyan_ice_tile_imgpath: pg.transform.smoothscale(pg.image.load(creep_cyan_ice_tile_imgpath),
-                                                          (TILE_SIZE, TILE_SIZE)),
-    creep_yellow_imgpath: pg.transform.smoothscale(pg.image.load(creep_yellow_imgpath), (TILE_SIZE, TILE_SIZE)),
-    creep_yellow_immune_imgpath: pg.transform.smoothscale(pg.image.load(creep_yellow_immune_imgpath),
-                                                          (TILE_SIZE, TILE_SIZE)),
-    creep_yellow_alert_imgpath: pg.transform.smoothscale(pg.image.load(creep_yellow_alert_imgpath),
-                                                         (TILE_SIZE, TILE_SIZE)),
-    creep_yellow_tmutated_imgpath: pg.transform.smoothscale(pg.image.load(creep_yellow_tmutated_imgpath),
-                                                            (TILE_SIZE, TILE_SIZE)),
-}
+# Creep sprite frames (Every state image of the creeps and the ice tile is converted once into a frame shared by every
+# instance, creeps and ice tiles reference their current frame by its index inside the asset manager's frame list)
+CREEP_FRAME_PATHS = (creep_purple_imgpath, creep_white_imgpath, creep_red_imgpath, creep_red_rage_imgpath,
+                     creep_cyan_imgpath, creep_yellow_imgpath, creep_yellow_immune_imgpath, creep_yellow_alert_imgpath,
+                     creep_yellow_tmutated_imgpath, creep_cyan_ice_tile_imgpath)
+CREEP_FRAME_INDICES = {image_path: frame_index for frame_index, image_path in enumerate(CREEP_FRAME_PATHS)}
+BLANK_FRAME_INDEX = len(CREEP_FRAME_PATHS)  # Index of the transparent frame displayed while a dying creep blinks
 
 
 class Creep:
@@ -45,6 +34,10 @@ class Creep:
         self.game = game  # Reference to the Game class to access its attributes & methods
         self.player = player  # Reference to the Player class to access its attributes & methods
 
+        # POOL (While the creep is inside a creep pool, its rect, direction and velocity live in the pool arrays)
+        self.pool = None  # Reference to the CreepPool class that stores the creep's movement state (if pooled)
+        self.pool_slot = None  # Index of the creep's slot inside the creep pool arrays
+
         # DESCRIPTION
         self.description = description  # Description of the creep type
 
@@ -55,9 +48,9 @@ class Creep:
         self.rect = None  # Creep rect object
 
         # IMAGE
-        self.image_path = image_path  # Variable that stores the current creep image path
-        self.image = None  # Variable that store the current creep display image
-        self.load_image()  # Loads creep image from cache inside self.image and makes a rect object from said image
+        self.image_path = image_path  # Variable that stores the creep type's image path
+        self.frame_index = None  # Index of the shared creep frame that is currently displayed
+        self.load_image()  # Selects the frame of the creep image and makes a rect object from said frame
 
         # MOVEMENT
         self.movement_directions = [
@@ -66,14 +59,13 @@ class Creep:
             vec2d(-1, 0),  # Left
             vec2d(1, 0),  # Right
         ]
-        self.direction = random.choice(self.movement_directions)  # The creep's current direction of movement
+        self.direction = self.game.rng.choice(self.movement_directions)  # The creep's current direction of movement
         self.velocity = 1  # The creep's default velocity of movement
         self.valid_adjacent_cells = set()  # A set of valid adjacent cells the creep can select to change direction
 
         # SPAWN MOVEMENT DELAY
         self.on_spawn_delay_duration = 1500  # Before a creep can move it has an on-spawn delay of 1.5 seconds
-        self.on_spawn_delay_start_time = pg.time.get_ticks()  # Initialize on-spawn start time
-        self.on_spawn_delay_started = False  # Flag indicating if on-spawn delay has been initiated
+        self.on_spawn_delay_start_time = self.game.game_clock.get_ticks()  # Initialize on-spawn start time
         self.set_velocity_to_default = True  # Flag to reset the creep's velocity to defaul value if need be
 
         # BOMB INTERACTION
@@ -82,6 +74,7 @@ class Creep:
         # RED CREEP ATTRIBUTES
         self.rage_active = False  # Flag used to indicate if red creep is in 'rage' mode
         self.red_creep_velocity_increased_after_hit = False  # Flag for red creep's velocity increase after hit
+        self.hunting = False  # Flag used to indicate if the creep hunts the closest player (red creep in 'rage' mode)
 
         # CYAN CREEP ATTIRBUTES
         self.valid_freeze_cells = set()
@@ -102,56 +95,93 @@ class Creep:
         # DEATH
         self.is_blinking_before_death = False  # Flag used to signal creep is in blinking state (before it dies)
 
-        # TIMER DATA
+        # TIMERS (Scheduled inside the game's timer scheduler, the creep is woken up when their deadline passes)
         # Death timer data
-        self.death_timers_dict = {
-            'start_time': 0,
-            'current_time': 0,
-            'time_until_completion': 0,
-            'blink_duration': 1000,
-            'rage_duration': 6000}
+        self.blink_duration = 1000  # Duration of the blinking before the creep dies in ms
+        self.rage_duration = 6000  # Duration of the red creep's rage state (ends with the blinking) in ms
+        self.death_timer = None  # Timer that removes the creep once it has been hit by a bomb explosion
         # Ice spawning timer data
-        self.spawn_ice_tiles_timers_dict = {
-            'start_time': 0,
-            'duration': 4000}
+        self.spawn_ice_tiles_duration = 4000  # Interval at which the cyan creep spawns ice tiles in ms
+        self.spawn_ice_tiles_timer = None  # Timer that spawns the next ice tiles (cyan creep only)
         # Yellow creep transmutation timer data
-        self.yellow_creep_timers_dict = {
-            'normal_start_time': 0,
-            'transmutation_start_time': 0,
-            'normal_duration': random.choice([7000, 8000, 9000, 10000, 11000, 12000, 13000, 14000]),
-            'transmutation_duration': random.choice([8000, 9000, 10000, 11000, 12000, 13000, 14000, 15000])}
-
-    # This function loads the image path of the creep object to create an image and defines a rect hitbox for it
+        self.normal_duration = self.game.rng.choice([7000, 8000, 9000, 10000, 11000, 12000, 13000, 14000])
+        self.transmutation_duration = self.game.rng.choice([8000, 9000, 10000, 11000, 12000, 13000, 14000, 15000])
+        self.normal_phase_timer = None  # Timer that ends the yellow creep's normal phase
+        self.transmutation_phase_timer = None  # Timer that ends the yellow creep's transmutation phase
+
+    # This function returns the creep's rect (while pooled, a new rect is built so assign a rect to move the creep)
+    @property
+    def rect(self):
+        return self.own_rect if self.pool is None else self.pool.get_rect(self.pool_slot)
+
+    # This function sets the creep's rect
+    @rect.setter
+    def rect(self, rect):
+        if self.pool is None:
+            self.own_rect = rect
+        else:
+            self.pool.set_rect(self.pool_slot, rect)
+
+    # This function returns the creep's direction of movement
+    @property
+    def direction(self):
+        return self.own_direction if self.pool is None else self.pool.get_direction(self.pool_slot)
+
+    # This function sets the creep's direction of movement
+    @direction.setter
+    def direction(self, direction):
+        if self.pool is None:
+            self.own_direction = direction
+        else:
+            self.pool.set_direction(self.pool_slot, direction)
+
+    # This function returns the creep's velocity of movement
+    @property
+    def velocity(self):
+        return self.own_velocity if self.pool is None else int(self.pool.velocity[self.pool_slot])
+
+    # This function sets the creep's velocity of movement
+    @velocity.setter
+    def velocity(self, velocity):
+        if self.pool is None:
+            self.own_velocity = velocity
+        else:
+            self.pool.velocity[self.pool_slot] = velocity
+
+    # This function attaches the creep to the slot of a creep pool that now stores its movement state
+    def attach_to_pool(self, pool, slot):
+        self.pool = pool
+        self.pool_slot = slot
+
+    # This function copies the movement state of the creep out of its pool slot and detaches it from the pool
+    def detach_from_pool(self):
+        rect, direction, velocity = self.rect, self.direction, self.velocity
+        self.pool = None
+        self.pool_slot = None
+        self.rect, self.direction, self.velocity = rect, direction, velocity
+
+    # This function schedules the timers of the creep when a new game starts
+    def start_timers(self):
+        if self.image_path == creep_cyan_imgpath:
+            self.spawn_ice_tiles_timer = self.game.timers.schedule(self.spawn_ice_tiles_duration, self.spawn_ice_tiles)
+        elif self.image_path == creep_yellow_imgpath:
+            self.normal_phase_timer = self.game.timers.schedule(self.normal_duration, self.start_transmutation_phase)
+
+    # This function cancels every timer of the creep
+    def cancel_timers(self):
+        for timer in (self.death_timer, self.spawn_ice_tiles_timer, self.normal_phase_timer,
+                      self.transmutation_phase_timer):
+            self.game.timers.cancel(timer)
+
+    # This function selects the shared frame of the creep's image path and defines a rect hitbox for it
     def load_image(self):
-        self.image = creep_image_cache.get(self.image_path).convert_alpha()
-        self.rect = self.image.get_rect()
+        self.frame_index = CREEP_FRAME_INDICES[self.image_path]
+        self.rect = self.game.assets.creep_frames[self.frame_index].get_rect()
 
     # This function handles the drawing of the creep object and updates dynamically
     def draw(self):
-        self.game.window.blit(self.image, self.rect)
-
-    # This function defines a short delay at the start of the game before the enemy creeps are allowed to move
-    def enact_short_movement_delay_at_spawn(self):
-        # Create a shor delay at the start of the round before the creeps can move by changing their velocity attribute
-
-        current_time = pg.time.get_ticks()
-        # Check if the instance of Creep class attribute 'initial_spawn_delay' has not been applied yet
-        if not hasattr(self, 'initial_spawn_delay') or not self.on_spawn_delay_started:
-            if current_time - self.on_spawn_delay_start_time < self.on_spawn_delay_duration:
-                for creep in self.game.creeps:
-                    creep.velocity = 0
-            else:
-                self.on_spawn_delay_started = True
-
-        # Check if the initial spawn delay has already been applied
-        if self.on_spawn_delay_started:
-            for creep in self.game.creeps:
-                # Check if 'set_velocity_to_default' boolean flag is set to True
-                if getattr(creep, 'set_velocity_to_default', True):
-                    creep.velocity = 1
-                else:
-                    if creep.red_creep_velocity_increased_after_hit:
-                        creep.velocity = 2
+        self.game.dirty_rects.append(self.game.window.blit(self.game.assets.creep_frames[self.frame_index],
+                                                           self.game.camera.apply(self.rect)))
 
     # This function iterates through the cells inside the matrix level and selects a viable spawn cell for the creep
     def select_viable_spawn_cells(self):
@@ -159,15 +189,14 @@ class Creep:
         used_creep_cells = []
 
         # Create a list of all possible cells where creeps can spawn (represented by value '1', aka path tile)
-        possible_creep_cells = [(row_index, col_index) for row_index, row in enumerate(self.game.level.level_matrix) for
-                                col_index, value in enumerate(row) if value == 1]
+        possible_creep_cells = self.game.level.find_cells({1})
 
         # If cell is a possible creep cell and not an already used cell, it becomes a valid cell to spawn creeps
         valid_creep_cells = [cell for cell in possible_creep_cells if cell not in used_creep_cells]
 
         # If there are valid cells to spawn creeps:
         if valid_creep_cells:
-            chosen_creep_cell = random.choice(valid_creep_cells)  # choose a random cell among all the valid cells
+            chosen_creep_cell = self.game.rng.choice(valid_creep_cells)  # choose a random valid cell
 
             # Extract row and column indices of the chosen cell
             row, col = chosen_creep_cell
@@ -237,7 +266,7 @@ class Creep:
 
         # Change direction based on collision
         if collision_detected and available_directions:
-            self.direction = random.choice(available_directions)
+            self.direction = self.game.rng.choice(available_directions)
 
         # // * PART 2: NON-COLLISION DIRECTION CHANGE BASED ALGORTIHM * //
 
@@ -245,11 +274,6 @@ class Creep:
         else:
             self.rect = next_self_rect  # update the creep's position to the next position
 
-            # Call function that toggles the normal and transmutation state of yellow creep
-            for creep in self.game.creeps:
-                if creep.image_path == creep_yellow_imgpath:
-                    creep.toggle_yellow_creep_state(creep)
-
             # Calculate the center coordinates of the next cell the creep is moving towards
             next_cell_centerx = int(next_self_rect.centerx // TILE_SIZE) * TILE_SIZE + TILE_SIZE // 2
             next_cell_centery = int(next_self_rect.centery // TILE_SIZE) * TILE_SIZE + TILE_SIZE // 2
@@ -264,6 +288,13 @@ class Creep:
                 # Update the creep's location to represent its current position inside the level matrix (row, column)
                 self.location = (int(next_self_rect.y // TILE_SIZE), int(next_self_rect.x // TILE_SIZE))
 
+                # A hunting creep takes the step towards the closest player instead of choosing a random direction
+                if self.hunting:
+                    next_cell = self.game.navigation.next_step(self.location)
+                    if next_cell is not None:
+                        self.direction = vec2d(next_cell[1] - self.location[1], next_cell[0] - self.location[0])
+                        return
+
                 # Define a list of offset vectors (directions) to find valid adjacent cells
                 offset_vectors = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # from first to last: LEFT, RIGHT, UP, DOWN
 
@@ -319,10 +350,10 @@ class Creep:
 
                     # Determine if and how the direction will be changed
                     if valid_dir == self.direction:
-                        if random.random() < 0.5:
+                        if self.game.rng.random() < 0.5:
                             self.direction = self.direction  # 50% to continue straight
                     else:
-                        if random.random() < 0.33:
+                        if self.game.rng.random() < 0.33:
                             self.direction = valid_dir  # 33% to choose every other valid direction
 
                     # Check if the current creep's image path matches the cyan creep image path
@@ -336,11 +367,9 @@ class Creep:
 
     # This function handles the collision logic for the creep
     def collision(self):
-        for player in self.game.players:
-            for bomb in player.bombs:
-                self.bomb_collision(bomb)
-
-        self.explosion_collision()
+        # Only check the bombs that cover the same cells as the creep
+        for bomb in self.game.bomb_index.query_rect(self.rect):
+            self.bomb_collision(bomb)
 
     # This function handles the bomb collision logic
     def bomb_collision(self, bomb):
@@ -366,7 +395,7 @@ class Creep:
                 if not new_x == self.rect.x or not new_y == self.rect.y:
                     # Define new movement directions for the creep and randomly shuffle the new directions list
                     new_directions = [vec2d(0, -1), vec2d(0, 1), vec2d(-1, 0), vec2d(1, 0)]
-                    random.shuffle(new_directions)
+                    self.game.rng.shuffle(new_directions)
 
                     # Assign the first direction from the shuffled list as the new direction for the creep
                     self.direction = new_directions[0]
@@ -375,120 +404,90 @@ class Creep:
                 creep_rect.topleft = (new_x, new_y)
                 self.rect = creep_rect
 
-    # This function handles the explosion collision logic
-    def explosion_collision(self):
-        # Collect the center points of explosion area rects from active bombs
-        explosion_centers = set()
-        for player in self.game.players:
-            for bomb in player.bombs:
-                if bomb.explosion_active:
-                    # Update the set with the center points of explosion areas from active bombs
-                    explosion_centers.update(rect.center for rect in bomb.explosion())
-
-        # Iterate over creeps and check for collision with explosion centers
-        for creep in self.game.creeps:
-            # Skip creeps already hit by bomb explosion or yellow creeps with transmutation active
-            if (creep.hit_by_bomb_explosion or (creep.image_path == creep_yellow_imgpath and creep.transmutation_active)
-                    or creep.ignore_explosion_collision):
-                continue
-
-            # Check for collision with explosion centers
-            for center in explosion_centers:
-                if creep.rect.collidepoint(center):
-                    # Set creep's flag 'hit by bomb explosion' as True and start its death timer
-                    creep.hit_by_bomb_explosion = True
-
-                    # Start death timer based on creep type (red creep death timer starts after rage duration expires)
-                    creep.death_timers_dict['start_time'] = pg.time.get_ticks() + (
-                        creep.death_timers_dict['rage_duration'] if creep.image_path == creep_red_imgpath
-                        else creep.death_timers_dict['blink_duration']
-                    )
-                    break  # No need to check further explosion centers for this creep
-
-        # // * HANDLE DEATH ANIMATION AFTER CREEP IS HIT BY BOMB EXPLOSION * //
-        for creep in self.game.creeps:
-            if creep.hit_by_bomb_explosion:
-                creep.death(creep)
-
-    # This function handles the death logic for the creep
-    def death(self, creep):
-        # Update the death timer current time and calculate the remaining time until completion
-        self.death_timers_dict['current_time'] = pg.time.get_ticks()
-        self.death_timers_dict['time_until_completion'] = creep.death_timers_dict[
-                                                              'start_time'] - self.death_timers_dict[
-                                                              'current_time']
+    # This function checks if the creep can be hit by a bomb explosion
+    def can_be_hit_by_explosion(self):
+        # Creeps already hit by bomb explosion and yellow creeps with transmutation active can not be hit
+        return not (self.hit_by_bomb_explosion or self.ignore_explosion_collision or
+                    (self.image_path == creep_yellow_imgpath and self.transmutation_active))
 
-        time_until_complete = self.death_timers_dict['time_until_completion']
+    # This function handles the aftermath of the creep being hit by a bomb explosion
+    def hit_by_explosion(self):
+        # Set creep's flag 'hit by bomb explosion' as True and start its death timer
+        self.hit_by_bomb_explosion = True
+        self.game.events.publish(CREEP_KILLED, self)
 
-        # Create a blank image to simulate a blink effect during the death animation
-        blank_image = pg.Surface((TILE_SIZE, TILE_SIZE), pg.SRCALPHA)  # create blank surface with alpha channel
-        blank_image.fill((0, 0, 0, 0))  # fill with fully transparent color
+        # Start death timer based on creep type (red creep death timer starts after rage duration expires)
+        self.death_timer = self.game.timers.schedule(
+            self.rage_duration if self.image_path == creep_red_imgpath else self.blink_duration,
+            self.remove_after_death
+        )
 
-        # Retrieve the creep's image from the cache
-        creep_image = creep_image_cache.get(creep.image_path)
+    # This function handles the death logic for the creep
+    def death(self):
+        # Calculate the remaining time until the death timer expires
+        time_until_complete = self.game.timers.time_remaining(self.death_timer)
 
         # Check if the remaining time until completion of the creep's death animation falls within the range
         # where the creep should exhibit a specific behavior, such as blinking or entering a rage state
-        if creep_image:
-            if self.death_timers_dict['blink_duration'] < time_until_complete <= self.death_timers_dict[
-                    'rage_duration']:
-
-                # If creep in rage state, adjust velocity and change image if creep is centered by its x and y coords
-                creep_current_row, creep_current_col = creep.location
-                creep_next_row, creep_next_col = int(creep_current_row + creep.direction[0]), int(
-                    creep_current_col + creep.direction[1])
-                creep_current_center_x = creep_current_col * TILE_SIZE + TILE_SIZE // 2
-                creep_current_center_y = creep_current_row * TILE_SIZE + TILE_SIZE // 2
-                creep_next_center_x = creep_next_col * TILE_SIZE + TILE_SIZE // 2
-                creep_next_center_y = creep_next_row * TILE_SIZE + TILE_SIZE // 2
-
-                if (creep.rect.centerx == creep_current_center_x and creep.rect.centery == creep_current_center_y) or \
-                        (creep.rect.centerx == creep_next_center_x and creep.rect.centery == creep_next_center_y) and \
-                        not creep.red_creep_velocity_increased_after_hit:
-                    # Increase red creep velocity after hit when rage state is initialized
-                    creep.set_velocity_to_default = False
-                    creep.red_creep_velocity_increased_after_hit = True
-
-                # Retrieve red creep rage state image from creep image cache
-                creep.image = creep_image_cache[creep_red_rage_imgpath]
+        if self.blink_duration < time_until_complete <= self.rage_duration:
+
+            # If creep in rage state, adjust velocity and change image if creep is centered by its x and y coords
+            creep_current_row, creep_current_col = self.location
+            creep_next_row, creep_next_col = int(creep_current_row + self.direction[0]), int(
+                creep_current_col + self.direction[1])
+            creep_current_center_x = creep_current_col * TILE_SIZE + TILE_SIZE // 2
+            creep_current_center_y = creep_current_row * TILE_SIZE + TILE_SIZE // 2
+            creep_next_center_x = creep_next_col * TILE_SIZE + TILE_SIZE // 2
+            creep_next_center_y = creep_next_row * TILE_SIZE + TILE_SIZE // 2
+
+            if (self.rect.centerx == creep_current_center_x and self.rect.centery == creep_current_center_y) or \
+                    (self.rect.centerx == creep_next_center_x and self.rect.centery == creep_next_center_y) and \
+                    not self.red_creep_velocity_increased_after_hit:
+                # Increase red creep velocity after hit when rage state is initialized
+                self.set_velocity_to_default = False
+                self.red_creep_velocity_increased_after_hit = True
+
+            # Switch to the red creep rage state frame and let the raging red creep hunt
+            self.frame_index = CREEP_FRAME_INDICES[creep_red_rage_imgpath]
+            self.hunting = True
 
+        else:
+            # If not in rage state, set normal death parameters
+            self.velocity = 0
+            self.set_velocity_to_default = False
+            self.red_creep_velocity_increased_after_hit = False
+            self.is_blinking_before_death = True
+            self.hunting = False
+
+            # Toggle between normal and blank images to create the blinking effect
+            if 800 < time_until_complete <= 1000 or 400 < time_until_complete \
+                    <= 600 or 0 < time_until_complete <= 200:
+                self.frame_index = CREEP_FRAME_INDICES[self.image_path]
             else:
-                # If not in rage state, set normal death parameters
-                creep.velocity = 0
-                creep.set_velocity_to_default = False
-                creep.red_creep_velocity_increased_after_hit = False
-                creep.is_blinking_before_death = True
-
-                # Toggle between normal and blank images to create the blinking effect
-                if 800 < time_until_complete <= 1000 or 400 < time_until_complete \
-                        <= 600 or 0 < time_until_complete <= 200:
-                    creep.image = creep_image_cache.get(creep.image_path)
-                else:
-                    creep.image = blank_image
+                self.frame_index = BLANK_FRAME_INDEX
 
-                # If the time until death animation completion is zero or less, remove the creep
-                if time_until_complete <= 0:
-                    self.game.creeps.remove(creep)
+    # This function removes the creep from the game once its death timer expires
+    def remove_after_death(self):
+        self.game.creep_system.remove(self)
 
     # This function iterates through the game's valid freeze cells and creates an ice tile object at that cell
     def create_ice_tiles(self):
+        ice_tile = None
         for cell in self.valid_freeze_cells:
             if cell not in IMPASSABLE_CELLS:
                 ice_tile = IceTile(self.game, cell, IceTile.current_cluster_id)
                 self.game.ice_tiles.append(ice_tile)
 
+        # Schedule a single timer that removes the whole cluster of created ice tiles
+        if ice_tile is not None:
+            self.game.timers.schedule(IceTile.remove_cluster_duration, ice_tile.remove_cluster)
+
         IceTile.current_cluster_id += 1  # increment the latest cluster ID after creating ice tiles
 
-    # This function handles the ice tile timer logic then executes the create_ice_tiles() function after timer expires
-    def ice_tiles_timer_setup(self):
-        return {
-            'start_time': adjust_ice_tile_spawn_timer(
-                start_time=self.spawn_ice_tiles_timers_dict['start_time'],
-                duration=self.spawn_ice_tiles_timers_dict['duration'],
-                init_timer=pg.time.get_ticks(),
-                on_expire_action=self.create_ice_tiles
-            )
-        }
+    # This function creates the ice tiles when the ice tiles spawn timer expires and schedules the next spawn
+    def spawn_ice_tiles(self):
+        self.create_ice_tiles()
+        self.spawn_ice_tiles_timer = self.game.timers.schedule(self.spawn_ice_tiles_duration, self.spawn_ice_tiles)
 
     # This function creates a new creep that represents the transmutated state of a yellow creep
     def create_transmutation_creep(self, creep):
@@ -501,19 +500,16 @@ class Creep:
 
             # Determine viable cells for spawning the transmutation creep.
             viable_transmutation_cells = [
-                (row, col)
-                for row in range(self.game.level_rows)
-                for col in range(self.game.level_cols)
+                cell for cell in self.game.level.find_cells({1, 3, 4})
                 if (
-                        self.game.level.level_matrix[row][col] in [1, 3, 4] and
-                        (row, col) not in creep_locations and  # cell not occupied by creep
-                        (row, col) not in player_locations  # cell not occupied by player
+                        cell not in creep_locations and  # cell not occupied by creep
+                        cell not in player_locations  # cell not occupied by player
                 )
             ]
 
             # Randomly select a one of the viable transmutation cell and create a new instance of the Creep class
             if viable_transmutation_cells:
-                transmutation_cell = random.choice(viable_transmutation_cells)
+                transmutation_cell = self.game.rng.choice(viable_transmutation_cells)
 
                 # Transmutated Yellow Creep instance
                 transmutation_creep = Creep(
@@ -536,8 +532,8 @@ class Creep:
                 else:
                     self.transmutation_mapping[creep] = [transmutation_creep]
 
-                # Append the transmutation creep into game creeps list
-                self.game.creeps.append(transmutation_creep)
+                # Add the transmutation creep to the game's creeps
+                self.game.creep_system.add(transmutation_creep)
 
             # Reset the flag indicating that the yellow creep has transmuted
             creep.has_yellow_creep_transmutated = False
@@ -550,160 +546,119 @@ class Creep:
 
             # Remove the transmutatation creep
             for transmutation_creep in transmutatation_creep_list:
-                if transmutation_creep in self.game.creeps:
-                    self.game.creeps.remove(transmutation_creep)
+                self.game.creep_system.remove(transmutation_creep)
 
             # Also remove the transmutation creep entry from the mapping by referencing its key pair
             del self.transmutation_mapping[creep]
 
-    # This function toggles between the normal and the transmutated state of a yellow creep
-    def toggle_yellow_creep_state(self, creep):
+    # This function switches the yellow creep into its transmutated state when its normal phase timer expires
+    def start_transmutation_phase(self):
+        # Do not transmutate if creep was hit by bomb explosion
+        if self.hit_by_bomb_explosion:
+            return
 
-        # Do not run code below if creep was hit by bomb explosion
-        if creep.hit_by_bomb_explosion:
+        # Switch to the transmutation phase
+        self.transmutation_active = True
+        self.has_yellow_creep_transmutated = True
+        self.frame_index = CREEP_FRAME_INDICES[creep_yellow_immune_imgpath]
+        self.game.render_queue.change_layer(self, LAYER_IMMUNE_CREEPS)  # drawn below the bombs while immune
+        self.transmutation_phase_timer = self.game.timers.schedule(self.transmutation_duration,
+                                                                   self.end_transmutation_phase)
+
+        # Create a transmutation creep
+        self.create_transmutation_creep(self)
+
+        # Mark normal phase is over
+        self.normal_phase_time_over = True
+        self.transmutation_phase_time_over = False
+
+    # This function switches the yellow creep back into its normal state when its transmutation phase timer expires
+    def end_transmutation_phase(self):
+        self.remove_transmutation_creep(self)  # remove the transmutation creep
+        self.transmutation_active = False  # reset the transmutation state for the yellow creep
+        self.set_velocity_to_default = True  # set the velocity back to default
+        self.frame_index = CREEP_FRAME_INDICES[creep_yellow_imgpath]  # reset to the default yellow creep frame
+        self.game.render_queue.change_layer(self, LAYER_CREEPS)
+        self.normal_phase_timer = self.game.timers.schedule(self.normal_duration, self.start_transmutation_phase)
+
+        # Mark the transmutation phase as over
+        self.transmutation_phase_time_over = True
+        self.normal_phase_time_over = False
+
+    # This function updates the transmutated state of a yellow creep (the phases are switched by their timers)
+    def update_yellow_creep_state(self):
+
+        # Do not run code below if creep was hit by bomb explosion or is not in the transmutation phase
+        if self.hit_by_bomb_explosion or not self.transmutation_active:
             return
 
-        # Get the current time and yellow creep timers inside __init__ method dict
-        current_time = pg.time.get_ticks()
-        timers = creep.yellow_creep_timers_dict
+        # Calculate the remaining time of the transmutation phase
+        transmutated_time = max(0, self.game.timers.time_remaining(self.transmutation_phase_timer))
 
-        # Calculate the remaining time for the normal and transmutation phases
-        normal_time = timers['normal_start_time'] + timers['normal_duration'] - current_time
-        transmutated_time = max(0, timers['transmutation_start_time'] - current_time)
+        # Calculate the center coordinates of the tile where the creep is located
+        tile_center_x = (self.location[1] * TILE_SIZE) + (TILE_SIZE // 2)
+        tile_center_y = (self.location[0] * TILE_SIZE) + (TILE_SIZE // 2)
 
-        # If the creep is not currently in the transmutation phase
-        if not creep.transmutation_active:
-            creep.normal_phase_time_over = False
+        # Check if the creep is at the center of its current tile
+        if self.rect.centerx == tile_center_x and self.rect.centery == tile_center_y:
+            self.set_velocity_to_default = False
+            self.velocity = 0  # the yellow creep stands still at the tile center while it is transmutated
 
-            # Check if the normal phase time has elapsed
-            if normal_time <= 0 and not creep.normal_phase_time_over:
-                # Switch to the transmutation phase
-                creep.transmutation_active = True
-                creep.has_yellow_creep_transmutated = True
-                creep.image = creep_image_cache[creep_yellow_immune_imgpath]
-                timers['transmutation_start_time'] = current_time + timers['transmutation_duration']
+        # Set alert duration for transmutation creep to alert player before the creep becomes tangible
+        alert_phase_duration = 2500
 
-                # Create a transmutation creep
-                self.create_transmutation_creep(creep)
+        # Determine the upper bound of time when the alert should be active
+        upper_alert_time_bound = self.transmutation_duration - alert_phase_duration
 
-                # Mark normal phase is over
-                creep.normal_phase_time_over = True
+        # Iterate through the mapping of yellow creeps and their transmutation creeps
+        for yellow_creep, transmutation_creeps in self.transmutation_mapping.items():
+            for tr_creep in transmutation_creeps:
+                # Check if the alert should be active based on the current transmutation time
+                alert_phase_active_condition = upper_alert_time_bound < transmutated_time < \
+                    self.transmutation_duration and not yellow_creep.transmutation_phase_time_over
 
-        else:
-            creep.transmutation_phase_time_over = False
-
-            # Calculate the center coordinates of the tile where the creep is located
-            tile_center_x = (creep.location[1] * TILE_SIZE) + (TILE_SIZE // 2)
-            tile_center_y = (creep.location[0] * TILE_SIZE) + (TILE_SIZE // 2)
-
-            # Check if the creep is at the center of its current tile
-            if creep.rect.centerx == tile_center_x and creep.rect.centery == tile_center_y \
-                    and not creep.transmutation_phase_time_over:
-                creep.set_velocity_to_default = False
-
-            # Set alert duration for transmutation creep to alert player before the creep becomes tangible
-            alert_phase_duration = 2500
-
-            # Determine the upper bound of time when the alert should be active
-            upper_alert_time_bound = timers['transmutation_duration'] - alert_phase_duration
-
-            # Iterate through the mapping of yellow creeps and their transmutation creeps
-            for yellow_creep, transmutation_creeps in self.transmutation_mapping.items():
-                for tr_creep in transmutation_creeps:
-                    # Check if the alert should be active based on the current transmutation time
-                    alert_phase_active_condition = upper_alert_time_bound < transmutated_time < timers[
-                        'transmutation_duration'] and not yellow_creep.transmutation_phase_time_over
-
-                    # Set the image of the transmutation creep accordingly
-                    tr_creep.image = creep_image_cache[
-                        creep_yellow_alert_imgpath] if alert_phase_active_condition else creep_image_cache[
-                        creep_yellow_tmutated_imgpath]
-
-                    # Set yellow creep flag indicating its alert condition is active as True
-                    yellow_creep.alert_phase_active = alert_phase_active_condition
-
-                    # Set transmutation creep ignore player and explosion collision flag as True
-                    tr_creep.ignore_explosion_collision = alert_phase_active_condition
-                    tr_creep.ignore_player_collision = alert_phase_active_condition
-
-                    # Set the velocity for the transmutation creep based on the alert condition
-                    tr_creep.set_velocity_to_default = not alert_phase_active_condition
-
-            if transmutated_time <= 0 and not creep.transmutation_phase_time_over:
-                self.remove_transmutation_creep(creep)  # remove the transmutation creep
-                creep.transmutation_active = False  # reset the transmutation state for the yellow creep
-                creep.set_velocity_to_default = True  # set the velocity back to default
-                creep.image = creep_image_cache[creep_yellow_imgpath]  # reset image to the default yellow creep image
-                timers['normal_start_time'] = current_time  # reset the start time for the normal phase
-
-                # Mark the transmutation phase as over
-                creep.transmutation_phase_time_over = True
-
-    # This function manages the spawn timer for the ice tiles
-    def manage_ice_tiles_spawn_timer(self):
-        # Set up timer and record the start time of the ice tiles spawn timer
-        ice_tiles_spawn_timer = self.ice_tiles_timer_setup()
-        self.spawn_ice_tiles_timers_dict['start_time'] = ice_tiles_spawn_timer['start_time']
-
-    # This function starts a new timer count when the game is paused
-    def handle_timers_on_pause(self):
-        # Record the time at which the game was paused
-        if self.game.paused:
-            self.game.paused_time = pg.time.get_ticks()
-
-    # This function updates the new start time for the bomb timers when the game is resumed
-    def handle_timers_on_resume(self):
-        if not self.game.paused:
-            current_time = pg.time.get_ticks()
-            paused_time = self.game.paused_time
-
-            # Update start times of various timers based on the time elapsed during pause
-            update_start_time(self.spawn_ice_tiles_timers_dict, current_time, paused_time, 'start_time')
-            update_start_time(self.death_timers_dict, current_time, paused_time, 'start_time')
-            update_start_time(self.yellow_creep_timers_dict, current_time, paused_time, 'normal_start_time')
-            update_start_time(self.yellow_creep_timers_dict, current_time, paused_time, 'transmutation_start_time')
+                # Set the frame of the transmutation creep accordingly
+                tr_creep.frame_index = CREEP_FRAME_INDICES[
+                    creep_yellow_alert_imgpath if alert_phase_active_condition else creep_yellow_tmutated_imgpath]
 
+                # Set yellow creep flag indicating its alert condition is active as True
+                yellow_creep.alert_phase_active = alert_phase_active_condition
+
+                # Set transmutation creep ignore player and explosion collision flag as True
+                tr_creep.ignore_explosion_collision = alert_phase_active_condition
+                tr_creep.ignore_player_collision = alert_phase_active_condition
+
+                # Set the velocity for the transmutation creep based on the alert condition
+                tr_creep.set_velocity_to_default = not alert_phase_active_condition
+
+    # This function handles the per-creep updates (the creep system handles the updates shared by every creep)
     def update(self):
-        if not self.game.in_menu:
-            self.enact_short_movement_delay_at_spawn()
-            self.pathfind()
-            self.collision()
-            self.manage_ice_tiles_spawn_timer()
+        self.pathfind()
+        self.collision()
+        self.game.creep_index.move(self, self.rect)  # keep the creep spatial index up to date
 
 
 class IceTile:
-    remove_cluster_timers = {}  # Dictionary to store timers for removing ice clusters
+    remove_cluster_duration = 15000  # Duration in ms after which a cluster of ice tiles is removed
     current_cluster_id = 0  # Variable to keep track of the current cluster ID
 
     def __init__(self, game, cell, cluster_id):
         self.game = game  # Reference to the Game class to access its attributes & methods
         self.row, self.column = cell  # Row and column indices of the ice tile cell
         self.image_path = creep_cyan_ice_tile_imgpath  # Path to the image file for the ice tile
-        self.image = None  # Variable that stores the current ice tile image path
+        self.frame_index = None  # Index of the shared frame of the ice tile image
         self.rect = None  # Ice tile rect object
         self.cluster_id = cluster_id  # Unique identifier for the ice cluster to which this tile belongs
 
-        # Initialize timer data for the current cluster ID if it's not already in the dictionary
-        if cluster_id not in IceTile.remove_cluster_timers:
-            IceTile.remove_cluster_timers[cluster_id] = {
-                'start_time': 0,
-                'remaining_time_at_pause': 0,
-                'new_start_time': 0,
-                'duration': 15000,
-                'new_duration': None}
-
-        # Retrieve timer data for the current cluster ID
-        self.remove_cluster_timer_data = IceTile.remove_cluster_timers[self.cluster_id]
-        # Record the start time of the removal process for this ice tile
-        self.remove_cluster_timer_data['start_time'] = pg.time.get_ticks()
-
-        self.load_image()  # Loads ice tile image from cache inside self.image and makes a rect object from said image
+        self.load_image()  # Selects the frame of the ice tile image and makes a rect object from said frame
         self.position(cell)  # Defines the ice tile position inside the level matrix
+        self.game.ice_tile_index.insert(self, self.rect)  # Adds the ice tile to the ice tile spatial index
+        self.game.render_queue.add(self, LAYER_ICE_TILES)  # Adds the ice tile to the game's render queue
 
-    # This function loads the ice tile image from cache inside the self.image variable and makes a rect object from it
+    # This function selects the shared frame of the ice tile image and makes a rect object from it
     def load_image(self):
-        self.image = creep_image_cache[creep_cyan_ice_tile_imgpath].convert_alpha()
-        self.rect = self.image.get_rect()
+        self.frame_index = CREEP_FRAME_INDICES[self.image_path]
+        self.rect = self.game.assets.creep_frames[self.frame_index].get_rect()
 
     # This function sets the position of the ice tile inside the level matrix
     def position(self, cell):
@@ -711,34 +666,16 @@ class IceTile:
 
     # This function draws the ice tile image on the game's display window
     def draw(self):
-        self.game.window.blit(self.image, self.rect)
+        self.game.dirty_rects.append(self.game.window.blit(self.game.assets.creep_frames[self.frame_index],
+                                                           self.game.camera.apply(self.rect)))
 
     # This function removes a set cluster of ice tiles (based on their id) from the game's ice tile list
     def remove_cluster(self):
+        # Remove the ice tiles of the cluster from the ice tile spatial index and the render queue
+        for ice_tile in self.game.ice_tiles:
+            if ice_tile.cluster_id == self.cluster_id:
+                self.game.ice_tile_index.remove(ice_tile)
+                self.game.render_queue.remove(ice_tile)
+
         self.game.ice_tiles = [ice_tile for ice_tile in self.game.ice_tiles if
                                ice_tile.cluster_id != self.cluster_id]
-
-    # This function tracks elapsed time and cotrasts it with the duration of the ice tile then executes an action
-    def manage_timers(self):
-        adjust_ice_tile_remove_timer(timers_dict=self.remove_cluster_timer_data,
-                                     init_timer=pg.time.get_ticks(),
-                                     duration=self.remove_cluster_timer_data.get('duration'),
-                                     start_time=self.remove_cluster_timer_data.get('start_time'),
-                                     new_duration=self.remove_cluster_timer_data.get('new_duration'),
-                                     new_start_time=self.remove_cluster_timer_data.get('new_start_time'),
-                                     on_expire_action=self.remove_cluster)
-
-    # This function saves the remaining time at pause and sets it as the new duration for the ice tile
-    def handle_timers_on_pause(self):
-        update_timer_data_on_pause(timers_dict=self.remove_cluster_timer_data,
-                                   paused=self.game.paused)
-
-    # This function sets a new start time for the ice tile spawn timer when the game is resumed
-    def handle_timers_on_resume(self):
-        update_timer_data_on_resume(timers_dict=self.remove_cluster_timer_data,
-                                    init_timer=pg.time.get_ticks(),
-                                    resumed=self.game.resumed)
-
-    # This function handles dynamic updates for the ice tile object
-    def update(self):
-        self.manage_timers()
@@ -0,0 +1,162 @@
+# Bomberman/creep_pool.py
+import numpy as np
+import pygame as pg
+from settings import TILE_SIZE, IMPASSABLE_CELLS
+from creep import creep_purple_imgpath, creep_white_imgpath, creep_red_imgpath, creep_cyan_imgpath, \
+    creep_yellow_imgpath, creep_yellow_alert_imgpath
+
+vec2d = pg.math.Vector2
+
+# Creep type codes (by index inside the tuple of creep image paths)
+CREEP_TYPE_IMGPATHS = (creep_purple_imgpath, creep_white_imgpath, creep_red_imgpath, creep_cyan_imgpath,
+                       creep_yellow_imgpath, creep_yellow_alert_imgpath)
+WHITE_CREEP_TYPE_CODE = CREEP_TYPE_IMGPATHS.index(creep_white_imgpath)
+
+# Lookup tables of impassable cell values (row 0 for every creep, row 1 for the white creep that passes through
+# brittle, hidden portal and hidden powerup cells)
+IMPASSABLE_CELL_LOOKUP = np.zeros((2, 256), dtype=bool)
+IMPASSABLE_CELL_LOOKUP[0, list(IMPASSABLE_CELLS)] = True
+IMPASSABLE_CELL_LOOKUP[1, list(IMPASSABLE_CELLS - {5, 7, 9})] = True
+
+
+class CreepPool:
+    def __init__(self, capacity=64):
+        # SLOTS (Every pooled creep owns one slot, which is the index of its movement state inside the pool arrays)
+        self.creeps = [None] * capacity  # List that maps a slot to the creep occupying it
+        self.free_slots = []  # List of slots freed by removed creeps that are reused before new slots are opened
+        self.size = 0  # Number of slots opened so far (every slot past this number is unused)
+
+        # ARRAYS (Struct of arrays holding the movement state of every pooled creep)
+        self.x = np.zeros(capacity, dtype=np.int32)  # Rect 'x' coordinate of each creep
+        self.y = np.zeros(capacity, dtype=np.int32)  # Rect 'y' coordinate of each creep
+        self.width = np.zeros(capacity, dtype=np.int32)  # Rect width of each creep
+        self.height = np.zeros(capacity, dtype=np.int32)  # Rect height of each creep
+        self.direction_x = np.zeros(capacity, dtype=np.int8)  # Horizontal component of each creep's direction
+        self.direction_y = np.zeros(capacity, dtype=np.int8)  # Vertical component of each creep's direction
+        self.velocity = np.zeros(capacity, dtype=np.int8)  # Velocity of movement of each creep
+        self.type_code = np.zeros(capacity, dtype=np.int8)  # Creep type code of each creep
+        self.active = np.zeros(capacity, dtype=bool)  # Flag used to indicate if a slot is occupied by a creep
+
+    # This function doubles the capacity of the pool arrays
+    def grow(self):
+        capacity = len(self.creeps)
+        self.creeps.extend([None] * capacity)
+        for name in ('x', 'y', 'width', 'height', 'direction_x', 'direction_y', 'velocity', 'type_code', 'active'):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate((array, np.zeros(capacity, dtype=array.dtype))))
+
+    # This function moves the movement state of a creep into a pool slot, the creep then reads and writes the slot
+    def add(self, creep):
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.size == len(self.creeps):
+                self.grow()
+            slot = self.size
+            self.size += 1
+
+        rect = creep.rect
+        self.x[slot], self.y[slot] = rect.x, rect.y
+        self.width[slot], self.height[slot] = rect.width, rect.height
+        self.direction_x[slot], self.direction_y[slot] = int(creep.direction[0]), int(creep.direction[1])
+        self.velocity[slot] = creep.velocity
+        self.type_code[slot] = CREEP_TYPE_IMGPATHS.index(creep.image_path)
+        self.active[slot] = True
+        self.creeps[slot] = creep
+
+        creep.attach_to_pool(self, slot)
+
+    # This function moves the movement state of a creep out of its pool slot and back into the creep
+    def remove(self, creep):
+        slot = creep.pool_slot
+        creep.detach_from_pool()
+
+        self.active[slot] = False
+        self.creeps[slot] = None
+        self.free_slots.append(slot)
+
+    # This function removes every creep from the pool
+    def clear(self):
+        for creep in self.creeps[:self.size]:
+            if creep is not None:
+                creep.detach_from_pool()
+        self.creeps = [None] * len(self.creeps)
+        self.free_slots.clear()
+        self.size = 0
+        self.active[:] = False
+
+    # This function returns a new rect built from the position and size stored inside a slot
+    def get_rect(self, slot):
+        return pg.Rect(self.x[slot], self.y[slot], self.width[slot], self.height[slot])
+
+    # This function stores the position and size of a rect inside a slot
+    def set_rect(self, slot, rect):
+        self.x[slot], self.y[slot] = rect.x, rect.y
+        self.width[slot], self.height[slot] = rect.width, rect.height
+
+    # This function returns the direction stored inside a slot as a vector
+    def get_direction(self, slot):
+        return vec2d(int(self.direction_x[slot]), int(self.direction_y[slot]))
+
+    # This function stores a direction vector inside a slot
+    def set_direction(self, slot, direction):
+        self.direction_x[slot], self.direction_y[slot] = int(direction[0]), int(direction[1])
+
+    # This function returns the cells covered by the rects at the given positions as their corner rows and columns
+    # (a creep is never larger than a tile, so the corner cells are all the cells its rect covers)
+    @staticmethod
+    def covered_cell_bounds(x, y, width, height):
+        return y // TILE_SIZE, (y + height - 1) // TILE_SIZE, x // TILE_SIZE, (x + width - 1) // TILE_SIZE
+
+    # This function advances every creep moving straight through the middle of a tile in one batch operation and
+    # returns the slots of the advanced creeps and the slots of the advanced creeps that crossed into other cells
+    # The remaining creeps (standing still, reaching a tile center, colliding or near a bomb) need their own pathfind
+    def advance(self, level_grid, bomb_cells):
+        slots = np.flatnonzero(self.active[:self.size] & (self.velocity[:self.size] != 0))
+        if not slots.size:
+            return set(), []
+
+        x, y = self.x[slots], self.y[slots]
+        width, height = self.width[slots], self.height[slots]
+        velocity = self.velocity[slots].astype(np.int32)
+
+        # Position of every creep after a straight step in its current direction
+        next_x = x + self.direction_x[slots] * velocity
+        next_y = y + self.direction_y[slots] * velocity
+
+        # Creeps whose next position is aligned with the center of a tile choose their next direction there
+        at_tile_center = ((next_x + width // 2) % TILE_SIZE == TILE_SIZE // 2) & \
+                         ((next_y + height // 2) % TILE_SIZE == TILE_SIZE // 2)
+
+        # Corner cells of the next positions (creeps larger than a tile or leaving the level take their own pathfind)
+        top, bottom, left, right = self.covered_cell_bounds(next_x, next_y, width, height)
+        rows, cols = level_grid.shape
+        in_level = (top >= 0) & (left >= 0) & (bottom < rows) & (right < cols) & \
+                   (width <= TILE_SIZE) & (height <= TILE_SIZE)
+        top, bottom = np.clip(top, 0, rows - 1), np.clip(bottom, 0, rows - 1)
+        left, right = np.clip(left, 0, cols - 1), np.clip(right, 0, cols - 1)
+
+        # Mark the cells covered by a bomb, creeps about to touch a bomb have to handle the bomb collision themselves
+        bomb_grid = np.zeros((rows, cols), dtype=bool)
+        if bomb_cells:
+            bomb_rows, bomb_cols = zip(*bomb_cells)
+            bomb_grid[list(bomb_rows), list(bomb_cols)] = True
+
+        # Check the corner cells of the next positions for impassable cells and bombs
+        lookup = IMPASSABLE_CELL_LOOKUP[(self.type_code[slots] == WHITE_CREEP_TYPE_CODE).astype(np.intp)]
+        blocked = np.zeros(slots.size, dtype=bool)
+        for row, col in ((top, left), (top, right), (bottom, left), (bottom, right)):
+            blocked |= lookup[np.arange(slots.size), level_grid[row, col]] | bomb_grid[row, col]
+
+        # Advance the creeps that keep moving straight and find the ones that crossed into other cells
+        advancing = in_level & ~at_tile_center & ~blocked
+        advanced_slots = slots[advancing]
+        self.x[advanced_slots] = next_x[advancing]
+        self.y[advanced_slots] = next_y[advancing]
+
+        previous_top, previous_bottom, previous_left, previous_right = self.covered_cell_bounds(
+            x[advancing], y[advancing], width[advancing], height[advancing])
+        crossed = (previous_top != top[advancing]) | (previous_bottom != bottom[advancing]) | \
+                  (previous_left != left[advancing]) | (previous_right != right[advancing])
+
+        return set(advanced_slots.tolist()), advanced_slots[crossed].tolist()
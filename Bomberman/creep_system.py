@@ -0,0 +1,174 @@
+# Bomberman/creep_system.py
+from settings import TILE_SIZE, CREEP_POOL_MIN_CREEPS
+from render_queue import LAYER_CREEPS
+from creep import Creep, creep_purple_imgpath, creep_white_imgpath, creep_red_imgpath, creep_cyan_imgpath, \
+    creep_yellow_imgpath
+
+# The creep pool needs NumPy, without it every creep runs its own pathfind
+try:
+    from creep_pool import CreepPool
+except ImportError:
+    CreepPool = None
+
+
+class CreepSystem:
+    def __init__(self, game):
+        # REFERENCE
+        self.game = game  # Reference to the Game class to access its attributes & methods
+
+        # CREEPS
+        self.creeps = []  # List of every creep in the game (the game's creeps list references this list)
+        self.pool = None  # Array-backed store of the creeps' movement state (only used for large creep counts)
+
+    # This function adds a creep to the game and to the creep spatial index
+    def add(self, creep):
+        self.creeps.append(creep)
+        self.game.creep_index.insert(creep, creep.rect)
+        self.game.render_queue.add(creep, LAYER_CREEPS)
+        if self.pool is not None:
+            self.pool.add(creep)
+
+    # This function removes a creep from the game and from the creep spatial index and cancels its timers
+    def remove(self, creep):
+        if creep in self.creeps:
+            self.creeps.remove(creep)
+            self.game.creep_index.remove(creep)
+            self.game.render_queue.remove(creep)
+            creep.cancel_timers()
+            if self.pool is not None:
+                self.pool.remove(creep)
+
+    # This function removes every creep from the game
+    def clear(self):
+        for creep in self.creeps:
+            self.game.render_queue.remove(creep)
+        self.creeps.clear()
+        self.game.creep_index.clear()
+        if self.pool is not None:
+            self.pool.clear()
+            self.pool = None
+
+    # This function creates instances of the Creep class based on total creeps in the game
+    def create_creeps(self, total_creeps, creep_path, creep_type):
+        # Iterate over the specified number of total creeps passed as an arguement
+        for i in range(total_creeps):
+            # Create a new instance of the Creep class
+            creep = Creep(self.game, self.game.players, f"{creep_type} {i + 1}", creep_path)
+            creep.select_viable_spawn_cells()  # select viable cells for the creeps to spawn in
+            self.add(creep)  # add the newly created creep instance to the game's creeps
+
+    # This function sets up the creeps
+    def setup(self):
+        # Define creep types dictionary with corresponding creep parameters
+        creep_types = {
+            'Purple Creep': {'i': 2, 'path': creep_purple_imgpath},
+            'White Creep': {'i': 3, 'path': creep_white_imgpath},
+            'Red Creep': {'i': 4, 'path': creep_red_imgpath},
+            'Cyan Creep': {'i': 5, 'path': creep_cyan_imgpath},
+            'Yellow Creep': {'i': 6, 'path': creep_yellow_imgpath}}
+
+        creep_counts = {}  # initialize dictionary to store creep counts
+
+        # Check if 'Default' option is present in the custom options menu section
+        if 'Default' in self.game.menu.custom_options[0]:
+            creep_counts['Purple Creep'] = 6  # number of purple creeps in default mode
+            special_creeps_count = {'White Creep': 0, 'Red Creep': 0, 'Cyan Creep': 0, 'Yellow Creep': 0}
+            remaining_special_creeps = 7  # number of other 'special' creeps in default mode
+
+            # While special creeps counter is greater than 0
+            while remaining_special_creeps > 0:
+                # Randomly select a special creep type out of the list
+                special_creep = self.game.rng.choice(['White Creep', 'Red Creep', 'Cyan Creep', 'Yellow Creep'])
+
+                # If the creep is a white creep, the maximum amount of white creeps in default mode is 2
+                if special_creep == 'White Creep' and special_creeps_count['White Creep'] >= 2:
+                    continue
+
+                # If the creep are other special type, the maximum amount of these creeps in default mode is 3
+                if special_creep in ['Red Creep', 'Cyan Creep',
+                                     'Yellow Creep'] and special_creeps_count[special_creep] >= 3:
+                    continue
+
+                # Increment the count for the chosen special creep
+                special_creeps_count[special_creep] += 1
+
+                # Update the total count
+                creep_counts[special_creep] = creep_counts.get(special_creep, 0) + 1
+                remaining_special_creeps -= 1
+
+        # Check if 'Custom' option is present in the custom options menu section
+        elif 'Custom' in self.game.menu.custom_options[0]:
+            # If it is, iterate through the creep name and their data in creep_types dict
+            for creep_name, data in creep_types.items():
+                # Get the number inside the '<' '>' arrows
+                creep_count_key_str = self.game.menu.custom_options[data["i"]].split('<')[-1].split('>')[0].strip()
+                total_creeps = int(creep_count_key_str)  # convert the numeric string into an int
+                creep_counts[creep_name] = total_creeps  # update the creep count with the number of total creeps
+
+        # Store the movement state of large creep counts inside a creep pool, so the creeps can be advanced in batches
+        if CreepPool is not None and sum(creep_counts.values()) >= CREEP_POOL_MIN_CREEPS:
+            self.pool = CreepPool()
+
+        # Iterate through the creep count dictionary and create a creep for each creep present
+        for creep_name, count in creep_counts.items():
+            self.create_creeps(count, creep_types[creep_name]['path'], creep_name)
+
+        # Iterate through all existing creeps and schedule their timers
+        for creep in self.creeps:
+            creep.start_timers()
+
+    # This function sets the velocity of every creep once per frame (creeps stand still during their on-spawn delay)
+    def apply_velocities(self):
+        current_time = self.game.game_clock.get_ticks()
+        for creep in self.creeps:
+            if current_time - creep.on_spawn_delay_start_time < creep.on_spawn_delay_duration:
+                creep.velocity = 0
+            elif creep.set_velocity_to_default:
+                creep.velocity = 1
+            elif creep.red_creep_velocity_increased_after_hit:
+                creep.velocity = 2
+
+    # This function updates the transmutation state of every yellow creep once per frame
+    def update_yellow_creep_states(self):
+        for creep in self.creeps:
+            if creep.image_path == creep_yellow_imgpath:
+                creep.update_yellow_creep_state()
+
+    # This function checks the blast mask of the active explosions against the creeps covering its cells once per frame
+    def handle_explosion_hits(self):
+        # Only the creeps covering a cell inside the blast mask (every active explosion combined) can be hit
+        for row, col in self.game.detonations.blast_cells:
+            cell_center = (col * TILE_SIZE + TILE_SIZE // 2, row * TILE_SIZE + TILE_SIZE // 2)
+            for creep in self.game.creep_index.query_cell((row, col)):
+                if creep.can_be_hit_by_explosion() and creep.rect.collidepoint(cell_center):
+                    creep.hit_by_explosion()
+
+    # This function handles the death animation of every creep that was hit by a bomb explosion once per frame
+    def handle_deaths(self):
+        for creep in self.creeps:
+            if creep.hit_by_bomb_explosion:
+                creep.death()
+
+    # This function runs every creep phase once per frame
+    def update(self):
+        if self.game.in_menu:
+            return
+
+        self.apply_velocities()
+
+        # Advance the creeps moving straight through the middle of a tile in one batch (with the creep pool)
+        advanced_slots = set()
+        if self.pool is not None:
+            advanced_slots, crossed_slots = self.pool.advance(self.game.level.level_grid, self.game.bomb_index.cells)
+            for slot in crossed_slots:
+                creep = self.pool.creeps[slot]
+                self.game.creep_index.move(creep, creep.rect)
+
+        # Per-creep work (movement and bomb collision) for every creep that was not advanced in the batch
+        for creep in self.creeps:
+            if creep.pool_slot not in advanced_slots:
+                creep.update()
+
+        self.update_yellow_creep_states()
+        self.handle_explosion_hits()
+        self.handle_deaths()
@@ -0,0 +1,65 @@
+# Bomberman/detonation_system.py
+from collections import deque
+import pygame as pg
+from settings import TILE_SIZE
+
+
+class DetonationSystem:
+    def __init__(self, game):
+        # REFERENCE
+        self.game = game  # Reference to the Game class to access its attributes & methods
+
+        # DETONATION QUEUE
+        self.queue = deque()  # Bombs waiting to detonate, resolved in order by one propagation pass per frame
+
+        # BLAST MASK (Combined footprint of every active explosion, checked by the player and creep collisions)
+        self.blast_cells = {}  # Dictionary that maps a cell to the number of active explosions covering it
+        self.blast_rects = {}  # Dictionary that maps a cell to the rect (half a tile in size) centered inside it
+
+    # This function removes the queued bombs and the blast mask of the previous game
+    def clear(self):
+        self.queue.clear()
+        self.blast_cells.clear()
+        self.blast_rects.clear()
+
+    # This function queues a bomb to detonate during the next propagation pass (every bomb is queued only once)
+    def queue_detonation(self, bomb):
+        if bomb.detonation_queued:
+            return
+        bomb.detonation_queued = True
+        self.game.timers.cancel(bomb.countdown_timer)  # a bomb set off by another bomb skips the rest of its countdown
+        self.queue.append(bomb)
+
+    # This function detonates every queued bomb in order, bombs inside the footprint of a detonated bomb are queued
+    # behind it, so the whole chain reaction resolves within the same frame
+    # Every bomb detonates once and every cell of its footprint is visited once, so a pass stays linear in the number
+    # of cells affected by the chained explosions
+    def update(self):
+        while self.queue:
+            bomb = self.queue.popleft()
+            bomb.detonate()
+
+            for cell in bomb.explosion_cells:
+                # Set off the bombs that are still counting down inside the explosion footprint
+                for other_bomb in self.game.bomb_index.query_cell(cell):
+                    if other_bomb.countdown_active:
+                        self.queue_detonation(other_bomb)
+
+                # Merge the explosion footprint into the blast mask
+                self.add_blast_cell(cell)
+
+    # This function adds an explosion covering a cell to the blast mask
+    def add_blast_cell(self, cell):
+        if cell not in self.blast_cells:
+            blast_rect = pg.Rect(0, 0, TILE_SIZE // 2, TILE_SIZE // 2)
+            blast_rect.center = (cell[1] * TILE_SIZE + TILE_SIZE // 2, cell[0] * TILE_SIZE + TILE_SIZE // 2)
+            self.blast_rects[cell] = blast_rect
+        self.blast_cells[cell] = self.blast_cells.get(cell, 0) + 1
+
+    # This function removes the footprint of a finished explosion from the blast mask
+    def remove_blast(self, bomb):
+        for cell in bomb.explosion_cells:
+            self.blast_cells[cell] -= 1
+            if not self.blast_cells[cell]:
+                del self.blast_cells[cell]
+                del self.blast_rects[cell]
@@ -0,0 +1,52 @@
+# Bomberman/event_bus.py
+from collections import deque
+
+# Game state transitions published on the event bus (the arguments passed to the handlers are listed after each)
+GAME_STARTED = 'game_started'  # a new match was set up
+GAME_PAUSED = 'game_paused'
+GAME_RESUMED = 'game_resumed'
+MENU_OPENED = 'menu_opened'  # the main menu was opened (when the program starts or the user leaves a match)
+MATCH_ENDED = 'match_ended'  # a player was removed at the end of the match and the end menu was opened
+END_SCREEN_SHOWN = 'end_screen_shown'  # outcome ('victory', 'defeat' or 'tie') displayed on the end screen
+PLAYER_DIED = 'player_died'  # player, hit by a bomb explosion or collided with a creep
+PLAYER_EXITED = 'player_exited'  # player, collided with the exit portal
+PORTAL_REVEALED = 'portal_revealed'  # exit portal
+BOMB_EXPLODED = 'bomb_exploded'  # bomb
+CREEP_KILLED = 'creep_killed'  # creep, hit by a bomb explosion
+
+
+class EventBus:
+    def __init__(self):
+        # SUBSCRIBERS
+        self.handlers = {}  # Dictionary that maps an event to the list of functions handling it
+        self.listeners = []  # List of functions receiving every event (e.g. for telemetry), called with the event
+
+        # QUEUE (Events are delivered once per frame, after the game has been updated)
+        self.queue = deque()  # Published (event, arguments) pairs waiting to be delivered
+
+    # This function registers a function to be called every time an event is delivered
+    def subscribe(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    # This function stops calling a function when an event is delivered
+    def unsubscribe(self, event, handler):
+        if handler in self.handlers.get(event, ()):
+            self.handlers[event].remove(handler)
+
+    # This function registers a function to be called with every delivered event (a single stream of every event)
+    def subscribe_all(self, listener):
+        self.listeners.append(listener)
+
+    # This function queues an event to be delivered together with its arguments
+    def publish(self, event, *args):
+        self.queue.append((event, args))
+
+    # This function delivers the queued events in the order they were published (events published by a handler are
+    # delivered within the same call)
+    def dispatch(self):
+        while self.queue:
+            event, args = self.queue.popleft()
+            for listener in self.listeners:
+                listener(event, *args)
+            for handler in tuple(self.handlers.get(event, ())):
+                handler(*args)
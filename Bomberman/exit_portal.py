@@ -12,7 +12,7 @@ class ExitPortal:
         self.location = location  # Current exit portal location based on row and column indices
 
         # HITBOX (The definition of a (rect) represents the tangible presence of the object within the program))
-        self.rect = None  # Exit portal rect object
+        self.rect = pg.Rect(location[1] * TILE_SIZE, location[0] * TILE_SIZE, TILE_SIZE, TILE_SIZE)  # Exit portal rect
 
         # IMAGE PATH FILES
         self.exit_portal_image_paths = {
@@ -24,19 +24,15 @@ class ExitPortal:
         # IMAGE
         self.image_path = None  # Define variable that stores the path to the image file for the exit portal
         self.image = None  # Define variable for the exit portal's display image
+        self.assign_image_path()  # Assign the image path for the exit portal at class init
 
     # This function renders the drawing of the exit portal image dynamically
     def draw(self):
-        self.assign_image_path()  # assign the image path for the exit portal
-
         if self.image_path:
-            # Retrieve the image corresponding to the image path from the EXIT_PORTAL_IMAGES dictionary
-            self.image = pg.transform.smoothscale(pg.image.load(self.exit_portal_image_paths[self.image_path]),
-                                                  (TILE_SIZE, TILE_SIZE)).convert_alpha()
-
-            # Get the rect for the exit portal image from self.image
-            self.rect = self.image.get_rect(topleft=(self.location[1] * TILE_SIZE, self.location[0] * TILE_SIZE))
-            self.game.window.blit(self.image, self.rect)  # blit the exit portal image onto the game window
+            # Retrieve the preloaded image corresponding to the image path from the game's assets
+            self.image = self.game.assets.images[self.exit_portal_image_paths[self.image_path]]
+            # Blit image on game window at the exit portal's position inside the camera's viewport
+            self.game.dirty_rects.append(self.game.window.blit(self.image, self.game.camera.apply(self.rect)))
 
     # This function assigns the exit portal's image path based on the status of creeps in the game
     def assign_image_path(self):
@@ -46,7 +42,7 @@ class ExitPortal:
 
         # If there are NO creeps present in the game
         else:
-            current_time = pg.time.get_ticks()  # get current time
+            current_time = self.game.game_clock.get_ticks()  # get current time
             blink_time_interval = 1000  # define the interval for the portal blinking effect
 
             # Check if current time falls within the first half of the blink time interval
@@ -54,3 +50,7 @@ class ExitPortal:
                 self.image_path = 'open1'  # if yes, set image path to the first open exit portal image
             else:
                 self.image_path = 'open2'  # if no, set image path to the second open exit portal image
+
+    # This function handles dynamic updates for the exit portal object
+    def update(self):
+        self.assign_image_path()  # assign the image path for the exit portal
@@ -0,0 +1,56 @@
+# Bomberman/game_clock.py
+import pygame as pg
+
+
+class GameClock:
+    def __init__(self, fixed_timestep=None):
+        # TIMESTEP
+        self.fixed_timestep = fixed_timestep  # Duration of one simulation step in ms (None follows the real time)
+        self.virtual = fixed_timestep is not None  # Flag used to indicate if the clock follows the virtual time
+        self.virtual_time = 0  # Virtual time in ms that gets advanced by the fixed timestep after each step
+        self.latched_ticks = None  # Real time latched at the start of the current frame (None reads the live time)
+
+        # PAUSE
+        self.paused_at = None  # Source time at which the clock was paused, None while the clock is running
+        self.paused_duration = 0  # Total amount of source time the clock has spent paused
+
+    # This function returns the time the game time is derived from (real time or virtual time)
+    def get_source_ticks(self):
+        # Without a virtual time, the source time is the real time since pygame was initialized (latched per frame)
+        if not self.virtual:
+            return self.latched_ticks if self.latched_ticks is not None else pg.time.get_ticks()
+
+        # Otherwise the source time is the virtual time advanced by the simulation steps (or set by a replay)
+        return int(self.virtual_time)
+
+    # This function latches the real time at the start of a frame, so every game object reads the same time within it
+    def latch(self):
+        if not self.virtual:
+            self.latched_ticks = pg.time.get_ticks()
+
+    # This function makes the clock follow a virtual time that is set directly (used to replay recorded game times)
+    def set_virtual_time(self, virtual_time):
+        self.virtual = True
+        self.virtual_time = virtual_time
+
+    # This function returns the current game time in milliseconds (the game time stands still while paused)
+    def get_ticks(self):
+        if self.paused_at is not None:
+            return self.paused_at - self.paused_duration
+        return self.get_source_ticks() - self.paused_duration
+
+    # This function advances the virtual time by one fixed timestep
+    def step(self):
+        if self.fixed_timestep is not None:
+            self.virtual_time += self.fixed_timestep
+
+    # This function stops the game time from advancing
+    def pause(self):
+        if self.paused_at is None:
+            self.paused_at = self.get_source_ticks()
+
+    # This function lets the game time advance again, the time spent paused is skipped over by every game timer
+    def resume(self):
+        if self.paused_at is not None:
+            self.paused_duration += self.get_source_ticks() - self.paused_at
+            self.paused_at = None
@@ -0,0 +1,38 @@
+# Bomberman/input_router.py
+import pygame as pg
+
+
+class InputRouter:
+    def __init__(self, game):
+        # REFERENCE
+        self.game = game  # Reference to the Game class to access its attributes & methods
+
+        # HANDLERS
+        self.global_handlers = []  # List of the functions handling every event, whatever scene is displayed
+        self.scene_handlers = {}  # Dictionary that maps a scene (menu, end, paused, game) to the function handling it
+
+    # This function registers a function handling the events of the given scenes (or of every scene if None)
+    def register(self, handler, scenes=None):
+        if scenes is None:
+            self.global_handlers.append(handler)
+        else:
+            for scene in scenes:
+                self.scene_handlers[scene] = handler
+
+    # This function pulls the events of the current frame once and routes each event to the global handlers and to
+    # the handler of the scene that is displayed when the event is handled (handlers may switch the scene)
+    def route(self):
+        for event in self.coalesce(pg.event.get()):
+            for handler in self.global_handlers:
+                handler(event)
+
+            scene_handler = self.scene_handlers.get(self.game.current_scene())
+            if scene_handler is not None:
+                scene_handler(event)
+
+    # This function drops every mouse motion event that is directly followed by another mouse motion event, only the
+    # latest cursor position of each uninterrupted movement gets handled
+    @staticmethod
+    def coalesce(events):
+        return [event for event, next_event in zip(events, events[1:] + [None]) if
+                not (event.type == pg.MOUSEMOTION and next_event is not None and next_event.type == pg.MOUSEMOTION)]
@@ -0,0 +1,25 @@
+# Bomberman/level_generator.py
+import random
+
+
+# This function generates a level matrix of any size with a border ('0') around paths ('1') and a grid of pillars
+# ('2') on every cell with an even row and column index, just like the hard-coded level layout
+# The same seed always generates the same level, a share of the pillars is left out to vary the layout
+def generate_level_matrix(rows, cols, seed=None, pillar_removal_chance=0.1):
+    # Levels need an odd number of rows and columns, so the player starting cells in the corners are paths
+    if rows < 5 or cols < 5 or rows % 2 == 0 or cols % 2 == 0:
+        raise ValueError(f"Level size must be odd and at least 5x5, got {rows}x{cols}")
+
+    rng = random.Random(seed)  # random number generator used only by this level
+
+    # Start with the border around a level full of paths
+    level_matrix = [[0] * cols] + [[0] + [1] * (cols - 2) + [0] for _ in range(rows - 2)] + [[0] * cols]
+
+    # Place the pillars on every cell with an even row and column index inside the border
+    for row in range(2, rows - 2, 2):
+        for col in range(2, cols - 2, 2):
+            if rng.random() >= pillar_removal_chance:
+                level_matrix[row][col] = 2
+
+    # Return the generated level matrix
+    return level_matrix
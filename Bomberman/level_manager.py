@@ -1,5 +1,15 @@
 # Ilijablaster/level_manager.py
-import random
+import pygame as pg
+from settings import TILE_SIZE, LEVEL_CHUNK_SIZE, BG, BLACK, GREY, COFFEE
+from exit_portal import ExitPortal
+from render_queue import LAYER_EXIT_PORTAL
+from event_bus import PORTAL_REVEALED
+
+# NumPy is optional, without it the level grid queries fall back to plain Python loops
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class LevelManager:
@@ -10,30 +20,98 @@ class LevelManager:
         # LEVEL (Define the original state of the level and make a deep working copy of it for further modifications)
         self.level_matrix_initial_state = level_matrix  # Store the initial state of the level matrix
         self.level_matrix = [row[:] for row in self.level_matrix_initial_state]  # Deep copy
+        self.version = 0  # Counter incremented on every change of the level matrix (used to detect outdated data)
+        self.cell_changes = []  # Cell changed by every version of the level matrix (None when the level was reset)
+
+        # LEVEL GRID (Optional NumPy copy of the level matrix kept in sync with it, used for vectorized cell queries)
+        self.level_grid_initial_state = None  # NumPy array of the initial state of the level matrix
+        self.level_grid = None  # NumPy array that mirrors the working copy of the level matrix
+        if np is not None:
+            self.level_grid_initial_state = np.array(self.level_matrix_initial_state, dtype=np.int16)
+            self.level_grid = self.level_grid_initial_state.copy()
+
+        # BRITTLES (The hard-coded 13x29 level has 75 brittles by default, other level sizes keep the same density)
+        self.default_num_of_brittles = max(1, round(75 * len(level_matrix) * len(level_matrix[0]) / (13 * 29)))
+
+        # LEVEL CHUNKS (The level is split into square chunks of tiles, each rendered once on its own surface when it
+        # first becomes visible, afterwards only the tiles of changed cells get redrawn)
+        self.chunk_surfaces = {}  # Dictionary that maps a (chunk row, chunk column) to its rendered chunk surface
+        self.dirty_cells = set()  # Set of (row, col) cells whose cell value changed since their tile was last drawn
+
+    # This function changes the value of a cell inside the level matrix and marks its tile to be redrawn
+    def set_cell_value(self, row_index, col_index, value):
+        if self.level_matrix[row_index][col_index] != value:
+            self.level_matrix[row_index][col_index] = value
+            self.dirty_cells.add((row_index, col_index))
+            self.version += 1
+            self.cell_changes.append((row_index, col_index))
+
+            # Keep the NumPy level grid in sync with the level matrix
+            if self.level_grid is not None:
+                self.level_grid[row_index, col_index] = value
+
+            # Create the exit portal once its cell gets revealed ('8'=E.PORTAL(AR))
+            if value == 8:
+                self.game.exit_portal = ExitPortal(self.game, (row_index, col_index))
+                self.game.render_queue.add(self.game.exit_portal, LAYER_EXIT_PORTAL)
+                self.game.events.publish(PORTAL_REVEALED, self.game.exit_portal)
+
+    # This function returns the (row, col) cells whose value is one of the values, in row by row order
+    # Optionally, the cells must (or must NOT) have an adjacent cell (left, right, up, down) with one of the values
+    def find_cells(self, values, required_neighbour_values=None, excluded_neighbour_values=None):
+        if self.level_grid is not None:
+            return self.find_cells_vectorized(values, required_neighbour_values, excluded_neighbour_values)
+
+        # Without NumPy, iterate through every cell inside the level matrix
+        rows, cols = len(self.level_matrix), len(self.level_matrix[0])
+        found_cells = []
+        for row in range(rows):
+            for col in range(cols):
+                if self.level_matrix[row][col] not in values:
+                    continue
+
+                # Get the values of the adjacent cells that are within the bounds of the level matrix
+                neighbour_values = {self.level_matrix[row + x][col + y] for x, y in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+                                    if 0 <= row + x < rows and 0 <= col + y < cols}
+
+                if required_neighbour_values is not None and neighbour_values.isdisjoint(required_neighbour_values):
+                    continue
+                if excluded_neighbour_values is not None and not neighbour_values.isdisjoint(excluded_neighbour_values):
+                    continue
+                found_cells.append((row, col))
+
+        # Return the list of found cells
+        return found_cells
+
+    # This function does the same as find_cells() with boolean masks over the NumPy level grid
+    def find_cells_vectorized(self, values, required_neighbour_values=None, excluded_neighbour_values=None):
+        mask = np.isin(self.level_grid, list(values))
+
+        if required_neighbour_values is not None:
+            mask &= self.neighbour_mask(required_neighbour_values)
+        if excluded_neighbour_values is not None:
+            mask &= ~self.neighbour_mask(excluded_neighbour_values)
+
+        # Return the list of found cells (nonzero returns them in row by row order)
+        rows, cols = np.nonzero(mask)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    # This function returns a boolean mask of the cells that have an adjacent cell with one of the values
+    def neighbour_mask(self, values):
+        padded_mask = np.pad(np.isin(self.level_grid, list(values)), 1)
+        return padded_mask[:-2, 1:-1] | padded_mask[2:, 1:-1] | padded_mask[1:-1, :-2] | padded_mask[1:-1, 2:]
 
     # This function labels the positions inside the level matrix where the player/s in game will start
     def label_player_starting_cell(self, row_index, col_index):
         # Check if the indices are within the bounds of the matrix
         if 0 <= row_index < len(self.level_matrix) and 0 <= col_index < len(self.level_matrix[0]):
-            self.level_matrix[row_index][col_index] = 3  # assign value to '3' ('3'=PLAYER STARTING POSITION)
+            self.set_cell_value(row_index, col_index, 3)  # assign value to '3' ('3'=PLAYER STARTING POSITION)
 
     # This function labels the position inside the level matrix ajacent to the player/s starting position
     def label_player_adjacent_cells(self):
-        # Define the directions to check for adjacent cells (left, right, up, down)
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-        # Iterate through the game map to find player starting position (assigned value '3')
-        for row in range(len(self.level_matrix)):
-            for col in range(len(self.level_matrix[row])):
-                # Check if cell value is '3'
-                if self.level_matrix[row][col] == 3:
-                    # Check adjacent cells in each direction
-                    for x_direction, y_direction in directions:
-                        new_row, new_col = row + x_direction, col + y_direction
-                        # Check if the adjacent cell is within bounds and has a clear cell (value '1')
-                        if 0 <= new_row < len(self.level_matrix) and 0 <= new_col < len(self.level_matrix[row]) \
-                                and self.level_matrix[new_row][new_col] == 1:
-                            self.level_matrix[new_row][new_col] = 4  # set value to '4' ('4'=PLAYER ADJACENT POSITION)
+        # Find every clear cell (value '1') adjacent to a player starting position (value '3')
+        for row, col in self.find_cells({1}, required_neighbour_values={3}):
+            self.set_cell_value(row, col, 4)  # set value to '4' ('4'=PLAYER ADJACENT POSITION)
 
         # Return the updates to the self.level_matrix
         return self.level_matrix
@@ -41,25 +119,16 @@ class LevelManager:
     # This function iterates through cells inside the matrix level and selects viable spawn cells for brittle objects
     def select_viable_brittle_cells(self, num_of_brittles):
         # Define a list for valid brittle cells (only cells that have value '1' in level matrix are valid)
-        valid_brittle_cell_positions = []
-
-        # Iterate through the level matrix rows and columns
-        for row in range(len(self.level_matrix)):
-            for col in range(len(self.level_matrix[row])):
-                # Check if cell value is path ('1')
-                if self.level_matrix[row][col] == 1:
-                    # Check if adjacent cells of path (value '1') are NOT player starting pos (value '3')
-                    # This prevents brittle objects from being placed at player starting position
-                    if all(self.level_matrix[row + x][col + y] not in {3}
-                           for x, y in [(-1, 0), (1, 0), (0, -1), (0, 1)]):
-                        valid_brittle_cell_positions.append((row, col))
+        # Adjacent cells of path (value '1') must NOT be player starting pos (value '3')
+        # This prevents brittle objects from being placed at player starting position
+        valid_brittle_cell_positions = self.find_cells({1}, excluded_neighbour_values={3})
 
         # Randomly populate specified number of cells with brittle objects
-        brittle_cells = random.sample(valid_brittle_cell_positions, num_of_brittles)
+        brittle_cells = self.game.rng.sample(valid_brittle_cell_positions, num_of_brittles)
 
         # Update the level matrix to represent 'brittles' at the selected positions
         for row, col in brittle_cells:
-            self.level_matrix[row][col] = 5  # assign value to '5' ('5'=BRITTLE)
+            self.set_cell_value(row, col, 5)  # assign value to '5' ('5'=BRITTLE)
 
         # Return the updates to the self.level_matrix
         return self.level_matrix
@@ -67,15 +136,13 @@ class LevelManager:
     # This function iterates through cells inside the matrix level and selects viable spawn cells for brittle objects
     def select_exit_portal_location_cell(self):
         # Get all available brittle cells to select as potential locations for the exit portal
-        valid_exit_portal_cells = [(row, col) for row in range(len(self.level_matrix))
-                                   for col in range(len(self.level_matrix[row])) if
-                                   self.level_matrix[row][col] == 5]
+        valid_exit_portal_cells = self.find_cells({5})
 
         # If there are available brittle cells
         if valid_exit_portal_cells:
-            exit_portal = random.choice(valid_exit_portal_cells)  # randomly select one to set as exit portal cell
+            exit_portal = self.game.rng.choice(valid_exit_portal_cells)  # randomly select the exit portal cell
             row, col = exit_portal
-            self.level_matrix[row][col] = 7  # assign value to '7' ('7'=EXIT_PORTAL(BR))
+            self.set_cell_value(row, col, 7)  # assign value to '7' ('7'=EXIT_PORTAL(BR))
         else:
             # In case of no available brittle cells
             print("No location found for exit portal. Number of brittle objects:", len(valid_exit_portal_cells))
@@ -90,14 +157,15 @@ class LevelManager:
             self.label_player_starting_cell(1, 1)  # player 1 starting cell
         elif self.game.game_mode_2player:
             self.label_player_starting_cell(1, 1)  # player 1 starting cell
-            self.label_player_starting_cell(11, 27)  # player 2 starting cell
+            self.label_player_starting_cell(len(self.level_matrix) - 2,
+                                            len(self.level_matrix[0]) - 2)  # player 2 starting cell (opposite corner)
 
         # Label the cells adjacent to the players starting positions
         self.label_player_adjacent_cells()
 
         # Determine the number of brittle objects based on the selected custom options
         if 'Default' in self.game.menu.custom_options[0]:
-            self.select_viable_brittle_cells(num_of_brittles=75)  # default num of brittles (hardcoded)
+            self.select_viable_brittle_cells(num_of_brittles=self.default_num_of_brittles)  # default num of brittles
         elif 'Custom' in self.game.menu.custom_options[0]:
             num_of_brittles_key_str = self.game.menu.custom_options[1].split('<')[-1].split('>')[0].strip()
             custom_num_of_brittles = int(num_of_brittles_key_str)
@@ -107,6 +175,149 @@ class LevelManager:
         # Select the location of the exit portal
         self.select_exit_portal_location_cell()
 
+        # Discard the chunks rendered for the previous level, they get rendered again once they become visible
+        self.chunk_surfaces.clear()
+        self.dirty_cells.clear()
+
+    # This function returns the rect (in level coordinates) of a chunk, chunks at the level's edges can be smaller
+    def chunk_rect(self, chunk):
+        chunk_row, chunk_col = chunk
+        rows = min(LEVEL_CHUNK_SIZE, len(self.level_matrix) - chunk_row * LEVEL_CHUNK_SIZE)
+        cols = min(LEVEL_CHUNK_SIZE, len(self.level_matrix[0]) - chunk_col * LEVEL_CHUNK_SIZE)
+        return pg.Rect(chunk_col * LEVEL_CHUNK_SIZE * TILE_SIZE, chunk_row * LEVEL_CHUNK_SIZE * TILE_SIZE,
+                       cols * TILE_SIZE, rows * TILE_SIZE)
+
+    # This function returns the chunks that are at least partially inside the camera's viewport
+    def visible_chunks(self, viewport):
+        chunk_pixel_size = LEVEL_CHUNK_SIZE * TILE_SIZE
+        max_chunk_row = (len(self.level_matrix) - 1) // LEVEL_CHUNK_SIZE
+        max_chunk_col = (len(self.level_matrix[0]) - 1) // LEVEL_CHUNK_SIZE
+        return [(chunk_row, chunk_col)
+                for chunk_row in range(max(0, viewport.top // chunk_pixel_size),
+                                       min(max_chunk_row, (viewport.bottom - 1) // chunk_pixel_size) + 1)
+                for chunk_col in range(max(0, viewport.left // chunk_pixel_size),
+                                       min(max_chunk_col, (viewport.right - 1) // chunk_pixel_size) + 1)]
+
+    # This function creates the surface of a chunk and renders every cell inside the chunk as a tile onto it
+    def render_chunk(self, chunk):
+        chunk_rect = self.chunk_rect(chunk)
+        chunk_surface = pg.Surface(chunk_rect.size).convert()  # create the chunk surface in the display pixel format
+        chunk_surface.fill(BG)  # fill the background with the BG color
+        self.chunk_surfaces[chunk] = chunk_surface
+
+        # Iterate through each row and each column inside the chunk and render the cell as a tile
+        for row in range(chunk_rect.top // TILE_SIZE, chunk_rect.bottom // TILE_SIZE):
+            for column in range(chunk_rect.left // TILE_SIZE, chunk_rect.right // TILE_SIZE):
+                self.render_tile(row, column)
+
+        # Return the rendered chunk surface
+        return chunk_surface
+
+    # This function renders only the tiles of the cells whose values changed since they were last drawn
+    def redraw_dirty_tiles(self):
+        redrawn_tile_rects = [self.render_tile(row, column) for row, column in self.dirty_cells]
+        self.dirty_cells.clear()
+
+        # Return the rects (in level coordinates) of the redrawn tiles
+        return redrawn_tile_rects
+
+    # This function takes a cell inside the level matrix and draws it as a tile on its chunk surface at its position
+    # Tiles of chunks that have not been rendered yet are skipped, they get drawn once their chunk is rendered
+    def render_tile(self, row, column):
+        cell_value = self.level_matrix[row][column]
+
+        # Create a tile rect object in level coordinates
+        tile_rect = pg.Rect((column * TILE_SIZE, row * TILE_SIZE), (TILE_SIZE, TILE_SIZE))
+
+        chunk_surface = self.chunk_surfaces.get((row // LEVEL_CHUNK_SIZE, column // LEVEL_CHUNK_SIZE))
+        if chunk_surface is not None:
+            # Move the tile rect into the chunk surface's coordinates and clear the tile area with the BG color
+            chunk_tile_rect = tile_rect.move(-(column // LEVEL_CHUNK_SIZE) * LEVEL_CHUNK_SIZE * TILE_SIZE,
+                                             -(row // LEVEL_CHUNK_SIZE) * LEVEL_CHUNK_SIZE * TILE_SIZE)
+            pg.draw.rect(chunk_surface, BG, chunk_tile_rect)
+
+            if cell_value == 0:  # Border tile
+                self.draw_border_tile(chunk_surface, chunk_tile_rect)
+
+            elif cell_value == 2:  # Pillar tile
+                self.draw_pillar_tile(chunk_surface, chunk_tile_rect)
+
+            elif cell_value in {5, 7, 9}:  # Brittle tiles
+                self.draw_brittle_tile(chunk_surface, chunk_tile_rect, cell_value)
+
+        # Return the rect of the rendered tile
+        return tile_rect
+
+    # This function draws the black border tiles around the edges of the screen
+    def draw_border_tile(self, surface, tile_rect):
+        pg.draw.rect(surface, BLACK, tile_rect)
+        pg.draw.rect(surface, GREY, tile_rect, 1)
+
+    # This function draws the gray pillar tiles
+    def draw_pillar_tile(self, surface, tile_rect):
+        pg.draw.rect(surface, GREY, tile_rect)
+        pg.draw.rect(surface, BLACK, tile_rect, 2)
+
+    # This function draws the brittle objects (breakable walls) tiles
+    def draw_brittle_tile(self, surface, tile_rect, cell_value):
+        colors = {5: COFFEE, 7: COFFEE, 9: COFFEE}  # ('5'=REGULAR BRITTLE, '7'=E.PORTAL(BR), '9'=POWERUP(BR))
+        color = colors[cell_value]
+
+        pg.draw.rect(surface, color, tile_rect)
+        self.draw_brittle_tile_stripes(surface, tile_rect)
+        pg.draw.rect(surface, BG, tile_rect, 1)
+
+    # This function draws the black stripes for the brittle objects (breakable walls) tiles
+    def draw_brittle_tile_stripes(self, surface, tile_rect):
+        num_horizontal_stripes = 4
+        stripe_height = tile_rect.height // num_horizontal_stripes
+
+        num_vertical_stripes = 3
+        stripe_width = tile_rect.width // num_vertical_stripes
+
+        for i in range(1, num_horizontal_stripes):
+            y = tile_rect.top + i * stripe_height
+            pg.draw.line(surface, BLACK, (tile_rect.left, y), (tile_rect.right - 1, y), 2)
+
+        for i in range(1, num_vertical_stripes):
+            x = tile_rect.left + i * stripe_width
+            pg.draw.line(surface, BLACK, (x, tile_rect.top), (x, tile_rect.bottom - 1), 2)
+
+    # This function redraws the changed tiles and displays the chunks inside the camera's viewport onto the window
+    def draw(self, window, camera):
+        redrawn_tile_rects = self.redraw_dirty_tiles()
+
+        # Clear the window first if the level does not cover the entire viewport
+        level_rect = pg.Rect(0, 0, len(self.level_matrix[0]) * TILE_SIZE, len(self.level_matrix) * TILE_SIZE)
+        if not level_rect.contains(camera.viewport):
+            window.fill(BG)
+
+        # Display only the visible chunks, rendering the chunks that become visible for the first time
+        for chunk in self.visible_chunks(camera.viewport):
+            chunk_surface = self.chunk_surfaces.get(chunk)
+            if chunk_surface is None:
+                chunk_surface = self.render_chunk(chunk)
+            window.blit(chunk_surface, camera.apply(self.chunk_rect(chunk)))
+
+        # Return the rects (in game window coordinates) of the visible tiles that changed since the last draw
+        return [camera.apply(tile_rect) for tile_rect in redrawn_tile_rects if camera.is_visible(tile_rect)]
+
+    # This function returns the set of cells changed since a version of the level matrix, or None if the level was
+    # reset since then (every cell may have changed)
+    def changed_cells_since(self, version):
+        cell_changes = self.cell_changes[version:]
+        if None in cell_changes:
+            return None
+        return set(cell_changes)
+
     # This function resets the level back to its initial state before the function-based modifications
     def reset(self):
-        self.level_matrix = [row[:] for row in self.level_matrix_initial_state]
+        # With NumPy, copy the initial level grid and convert it into the level matrix in one go
+        if self.level_grid is not None:
+            self.level_grid = self.level_grid_initial_state.copy()
+            self.level_matrix = self.level_grid.tolist()
+        else:
+            self.level_matrix = [row[:] for row in self.level_matrix_initial_state]
+        self.dirty_cells.clear()
+        self.version += 1
+        self.cell_changes.append(None)
@@ -1,24 +1,66 @@
 # Ilijablaster/main.py
+import os
 import sys
+import random
 from settings import *
 from creep import *
 from level_layout import level_matrix
 from level_manager import LevelManager
+from level_generator import generate_level_matrix
+from camera import Camera
+from input_router import InputRouter
+from event_bus import EventBus, GAME_STARTED, GAME_PAUSED, GAME_RESUMED, MENU_OPENED, MATCH_ENDED, PLAYER_DIED, \
+    PLAYER_EXITED
+from render_queue import RenderQueue, LAYER_POWERUPS, LAYER_PLAYERS
+from asset_manager import AssetManager
 from audio_manager import AudioManager
+from game_clock import GameClock
+from timer_utils import TimerScheduler
 from menu import Menu
+from render_utils import merge_rects
+from spatial_index import SpatialIndex
+from creep_system import CreepSystem
+from detonation_system import DetonationSystem
+from navigation import Navigation
 from player import Player
+from replay import MatchRecorder
+from profiler import FrameProfiler
 from powerup import PowerUp
-from exit_portal import ExitPortal
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, level_size=LEVEL_SIZE, level_seed=LEVEL_SEED):
+        # HEADLESS
+        self.headless = headless  # flag used to run the game without a display, drawing or audio output
+        if self.headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'  # use the SDL dummy video driver (no window is opened)
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'  # use the SDL dummy audio driver (no sound is played)
+
         # SETTINGS
         pg.init()  # initialize Pygame
         self.window = pg.display.set_mode(WINDOW_SIZE)  # create the game window
         pg.display.set_caption("Ilijablaster | By Ilija ©")  # set the window title
-        pg.display.set_icon(pg.image.load(join(BASE_ICON_DIR, 'ibicon.png')))  # set the window icon
         self.clock = pg.time.Clock()  # create a pygame clock to control the frame rate
+        self.game_clock = GameClock(HEADLESS_TIMESTEP if headless else None)  # clock every game timer reads from
+        self.timers = TimerScheduler(self.game_clock)  # scheduler that wakes game objects when their timers expire
+
+        # DISPLAY UPDATES
+        self.dirty_rects = []  # create a list to store the rects of the areas drawn on the window in the current frame
+        self.previous_dirty_rects = []  # create a list to store the rects of the areas drawn in the previous frame
+        self.previous_scene = None  # create a placeholder for the scene (menu, paused, end, game) of the previous frame
+
+        # EVENTS
+        self.events = EventBus()  # create an event bus to notify the game's systems about game state transitions
+
+        # ASSETS
+        self.assets = AssetManager(self)  # initialize instance of AssetManager class to load the game's assets once
+        self.loading_screen_time = None  # stores the time the loading screen was last displayed at
+        pg.display.set_icon(self.assets.load_icon())  # set the window icon
+        self.assets.load_fonts()  # load every font used in the game
+        self.assets.load_images_and_sound_effects(
+            None if headless else self.render_loading_screen)  # load every image and soundeffect in parallel
+        self.assets.load_creep_frames()  # share the creep and ice tile frames between every instance
+        self.assets.render_bomb_frames()  # pre-render the frames of the bomb animations
 
         # MENU
         self.menu = Menu(self)  # initialize instance of Menu class as the game menu
@@ -32,14 +74,37 @@ class Game:
         # INPUT KEYS MAPPING
         self.available_input_keys = self.define_dict_of_available_input_keys()  # maps available input keys
 
+        # INPUT ROUTING (Each event is handled by the global handlers and by the handler of the displayed scene)
+        self.input = InputRouter(self)  # instance of InputRouter class to pass the events of each frame to handlers
+        self.input.register(self.handle_global_event)
+        self.input.register(self.menu.handle_section_event, scenes=('menu', 'end'))
+        self.input.register(self.handle_pause_event, scenes=('game', 'paused'))
+
         # AUDIO
         self.audio = AudioManager(self)  # initialize instance of AudioManager class to manage the game's audio
+        self.audio.sound_effects_enabled = not headless  # soundeffects are muted in headless mode
 
         # LEVEL
-        self.level = LevelManager(self, level_matrix)  # instance of LevelManager class to manage the game's level
+        # Play the hard-coded level layout, or generate a level of the given size
+        self.level_size = level_size  # stores the size (rows, columns) of the generated level (None if hard-coded)
+        # A generated level without a seed gets a random one, so recorded matches can rebuild the same level
+        if level_size is not None and level_seed is None:
+            level_seed = random.randrange(2 ** 32)
+        self.level_seed = level_seed  # stores the seed of the generated level (None if hard-coded)
+        layout = level_matrix if level_size is None else generate_level_matrix(*level_size, seed=level_seed)
+        self.level = LevelManager(self, layout)  # instance of LevelManager class to manage the game's level
         self.level_rows = len(self.level.level_matrix)  # stores the number of rows inside the level's matrix
         self.level_cols = len(self.level.level_matrix[0])  # stores the number of columsn inside the level's matrix
 
+        # CAMERA
+        self.camera = Camera(self)  # instance of Camera class to follow the players across the level
+
+        # RENDER QUEUE
+        self.render_queue = RenderQueue(self)  # instance of RenderQueue class to draw the game objects layer by layer
+
+        # NAVIGATION
+        self.navigation = Navigation(self)  # instance of Navigation class to guide the creeps hunting the players
+
         # POWERUP
         self.powerups = []  # create an empty list to store all the powerups in the game
 
@@ -48,29 +113,73 @@ class Game:
         self.player_end_info_dict = {}  # create empty dict to store the info of each player when the game ends
 
         # CREEP
-        self.creeps = []  # create an empty list to store all the creeps in the game
+        self.creep_system = CreepSystem(self)  # initialize instance of CreepSystem class to manage the creeps
+        self.creeps = self.creep_system.creeps  # reference the list of all the creeps in the game
         self.ice_tiles = []  # create an empty list to store all the ice tile objects in the game
 
+        # BOMB
+        self.detonations = DetonationSystem(self)  # instance of DetonationSystem class to chain the bomb explosions
+
         # EXIT PORTAL
         self.exit_portal = None  # create a placeholder for the exit portal object, initialized as None
 
+        # SPATIAL INDEX (Each index maps the level cells to the game objects covering them for collision queries)
+        self.creep_index = SpatialIndex()  # create a spatial index for the creeps
+        self.bomb_index = SpatialIndex()  # create a spatial index for the bombs
+        self.player_index = SpatialIndex()  # create a spatial index for the players
+        self.ice_tile_index = SpatialIndex()  # create a spatial index for the ice tiles
+
+        # RANDOMNESS (Every random choice of a match is drawn from the game's RNG, seeded when a new game starts)
+        self.rng = random.Random()  # create the random number generator of the game
+        self.rng_seed = None  # stores the seed the RNG was seeded with for the current match
+
+        # REPLAY
+        self.recorder = None  # placeholder for the MatchRecorder that records the matches (None if not recording)
+        self.replay = None  # placeholder for the MatchReplay that feeds the recorded ticks (None if not replaying)
+
+        # PROFILER
+        self.profiler = FrameProfiler(self)  # instance of FrameProfiler class to time the phases of every frame
+
         # PAUSE
         self.pause_surface = None  # create a placeholder for the pause window surface, initialized as None
-        self.paused_time = 0  # create a variable to tracks the amount of time the game has been paused
         self.paused = False  # flag used to track if the game is paused
         self.resumed = False  # flag used to track if the game has resumed
 
-    # This function is used to initialize a new game
-    def new_game(self):
+        # EVENT HANDLERS
+        self.events.subscribe(PLAYER_DIED, self.stop_updating_players)  # freeze the players once the match is ending
+        self.events.subscribe(PLAYER_EXITED, self.stop_updating_players)
+        self.events.subscribe(MATCH_ENDED, self.finish_recording)  # save the recording once the match has ended
+        if self.in_menu:
+            self.events.publish(MENU_OPENED)  # the program starts inside the main menu
+
+    # This function is used to initialize a new game (a random seed is chosen for the match if none is given)
+    def new_game(self, seed=None):
+        # Save the recording of the previous match and seed the game's RNG for the new match
+        self.finish_recording()
+        self.game_clock.latch()  # the whole match setup reads the same game time
+        self.rng_seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng.seed(self.rng_seed)
+
         # Clears game objects lists
         self.players.clear()
-        self.creeps.clear()
+        self.creep_system.clear()
         self.powerups.clear()
         self.ice_tiles.clear()
+        self.navigation.clear()
+        self.detonations.clear()
+        self.render_queue.clear()
+
+        # Clear the spatial indexes of the game objects
+        for spatial_index in (self.creep_index, self.bomb_index, self.player_index, self.ice_tile_index):
+            spatial_index.clear()
 
         # Clear the dictionary with the end game player information
         self.player_end_info_dict.clear()
 
+        # Remove the timers of the previous game and make sure the game clock is running
+        self.timers.clear()
+        self.game_clock.resume()
+
         # Reset Ice Tile cluser id counter to zero
         IceTile.current_cluster_id = 0
 
@@ -81,20 +190,19 @@ class Game:
         # Reset exit portal back to None
         self.exit_portal = None
 
-        # Set the end game soundeffects boolean flags back to False
-        self.audio.victory_sfx_playing = False
-        self.audio.defeat_sfx_playing = False
-
         # Set up the powerups, players and creeps
         self.powerups_setup()
         self.player_setup()
-        self.creeps_setup()
+        self.creep_system.setup()
+
+        # Move the camera onto the players
+        self.camera.follow(self.players)
+
+        # Start recording the new match
+        if self.recorder is not None:
+            self.recorder.start(self)
 
-        # Iterate through all existing creeps and reset their timer data
-        for creep in self.creeps:
-            if creep.image_path == creep_yellow_imgpath or creep_cyan_imgpath:
-                creep.spawn_ice_tiles_timers_dict['start_time'] = pg.time.get_ticks()
-                creep.yellow_creep_timers_dict['normal_start_time'] = pg.time.get_ticks()
+        self.events.publish(GAME_STARTED)
 
     # This function defines all the available input keys the user can use to play the game
     @staticmethod
@@ -141,6 +249,7 @@ class Game:
         # iterate through the powerups and select a viable cell for spawning them
         for powerup in self.powerups:
             powerup.select_viable_spawn_cell(self.powerups)
+            self.render_queue.add(powerup, LAYER_POWERUPS)
 
     # This function sets up the players and their controls
     def player_setup(self):
@@ -159,229 +268,72 @@ class Game:
                          [player_control_keys['Player 1'][key] for key in ['up', 'down', 'left', 'right']],
                          player_control_keys['Player 1']['drop_bomb'])
         self.players.append(player1)
+        self.player_index.insert(player1, player1.rect)
+        self.render_queue.add(player1, LAYER_PLAYERS)
 
         # If 2 Player mode is selected; also create instance of Player 2 and append into players list
         if self.game_mode_2player:
-            player2 = Player(self, "Player 2", 11, 27, BLUE,
+            player2 = Player(self, "Player 2", self.level_rows - 2, self.level_cols - 2, BLUE,
                              [player_control_keys['Player 2'][key] for key in ['up', 'down', 'left', 'right']],
                              player_control_keys['Player 2']['drop_bomb'])
             self.players.append(player2)
+            self.player_index.insert(player2, player2.rect)
+            self.render_queue.add(player2, LAYER_PLAYERS)
 
-    # This function creates instances of the Creep class based on total creeps in the game
-    def create_creeps(self, total_creeps, creep_path, creep_type):
-        # Iterate over the specified number of total creeps passed as an arguement
-        for i in range(total_creeps):
-            # Create a new instance of the Creep class
-            creep = Creep(self, self.players, f"{creep_type} {i + 1}", creep_path)
-            self.creeps.append(creep)  # append the newly created creep instance to the game's creeps list
-            creep.select_viable_spawn_cells()  # select viable cells for the creeps to spawn in
-
-    # This function sets up the creeps
-    def creeps_setup(self):
-        # Define creep types dictionary with corresponding creep parameters
-        creep_types = {
-            'Purple Creep': {'i': 2, 'path': creep_purple_imgpath},
-            'White Creep': {'i': 3, 'path': creep_white_imgpath},
-            'Red Creep': {'i': 4, 'path': creep_red_imgpath},
-            'Cyan Creep': {'i': 5, 'path': creep_cyan_imgpath},
-            'Yellow Creep': {'i': 6, 'path': creep_yellow_imgpath}}
-
-        creep_counts = {}  # initialize dictionary to store creep counts
-
-        # Check if 'Default' option is present in the custom options menu section
-        if 'Default' in self.menu.custom_options[0]:
-            creep_counts['Purple Creep'] = 6  # number of purple creeps in default mode
-            special_creeps_count = {'White Creep': 0, 'Red Creep': 0, 'Cyan Creep': 0, 'Yellow Creep': 0}
-            remaining_special_creeps = 7  # number of other 'special' creeps in default mode
-
-            # While special creeps counter is greater than 0
-            while remaining_special_creeps > 0:
-                # Randomly select a special creep type out of the list
-                special_creep = random.choice(['White Creep', 'Red Creep', 'Cyan Creep', 'Yellow Creep'])
-
-                # If the creep is a white creep, the maximum amount of white creeps in default mode is 2
-                if special_creep == 'White Creep' and special_creeps_count['White Creep'] >= 2:
-                    continue
-
-                # If the creep are other special type, the maximum amount of these creeps in default mode is 3
-                if special_creep in ['Red Creep', 'Cyan Creep',
-                                     'Yellow Creep'] and special_creeps_count[special_creep] >= 3:
-                    continue
-
-                # Increment the count for the chosen special creep
-                special_creeps_count[special_creep] += 1
-
-                # Update the total count
-                creep_counts[special_creep] = creep_counts.get(special_creep, 0) + 1
-                remaining_special_creeps -= 1
-
-        # Check if 'Custom' option is present in the custom options menu section
-        elif 'Custom' in self.menu.custom_options[0]:
-            # If it is, iterate through the creep name and their data in creep_types dict
-            for creep_name, data in creep_types.items():
-                # Get the number inside the '<' '>' arrows
-                creep_count_key_str = self.menu.custom_options[data["i"]].split('<')[-1].split('>')[0].strip()
-                total_creeps = int(creep_count_key_str)  # convert the numeric string into an int
-                creep_counts[creep_name] = total_creeps  # update the creep count with the number of total creeps
-
-        # Iterate through the creep count dictionary and create a creep for each creep present
-        for creep_name, count in creep_counts.items():
-            self.create_creeps(count, creep_types[creep_name]['path'], creep_name)
-
-    # This function takes each cell inside the level matrix and draws them as tiles on screen at their grid position
+    # This function displays the visible level chunks (with their pre-rendered tiles) on the game window
     def render_cells_into_level_tiles(self):
-        self.window.fill(BG)  # fill the background with the BG color
-
-        # Iterate through each row inside the level matrix
-        for row, row_values in enumerate(self.level.level_matrix):
-            # Iterate through each column of a row value
-            for column, cell_value in enumerate(row_values):
-                # Create a tile rect object
-                tile_rect = pg.Rect((column * TILE_SIZE, row * TILE_SIZE), (TILE_SIZE, TILE_SIZE))
-
-                if cell_value == 0:  # Border tile
-                    self.draw_border_tile(tile_rect)
-
-                elif cell_value in {1, 3, 4}:  # Passable tiles
-                    pg.draw.rect(self.window, BG, tile_rect)
-
-                elif cell_value == 2:  # Pillar tile
-                    self.draw_pillar_tile(tile_rect)
-
-                elif cell_value in {5, 7, 9}:  # Brittle tiles
-                    self.draw_brittle_tile(tile_rect, cell_value)
-
-                elif cell_value == 8:  # Portal tile
-                    self.exit_portal = ExitPortal(self, (row, column))
-
-    # This function draws the black border tiles around the edges of the screen
-    def draw_border_tile(self, tile_rect):
-        pg.draw.rect(self.window, BLACK, tile_rect)
-        pg.draw.rect(self.window, GREY, tile_rect, 1)
-
-    # This function draws the gray pillar tiles
-    def draw_pillar_tile(self, tile_rect):
-        pg.draw.rect(self.window, GREY, tile_rect)
-        pg.draw.rect(self.window, BLACK, tile_rect, 2)
-
-    # This function draws the brittle objects (breakable walls) tiles
-    def draw_brittle_tile(self, tile_rect, cell_value):
-        colors = {5: COFFEE, 7: COFFEE, 9: COFFEE}  # ('5'=REGULAR BRITTLE, '7'=E.PORTAL(BR), '9'=POWERUP(BR))
-        color = colors[cell_value]
-
-        pg.draw.rect(self.window, color, tile_rect)
-        self.draw_brittle_tile_stripes(tile_rect)
-        pg.draw.rect(self.window, BG, tile_rect, 1)
-
-    # This function draws the black stripes for the brittle objects (breakable walls) tiles
-    def draw_brittle_tile_stripes(self, tile_rect):
-        num_horizontal_stripes = 4
-        stripe_height = tile_rect.height // num_horizontal_stripes
-
-        num_vertical_stripes = 3
-        stripe_width = tile_rect.width // num_vertical_stripes
-
-        for i in range(1, num_horizontal_stripes):
-            y = tile_rect.top + i * stripe_height
-            pg.draw.line(self.window, BLACK, (tile_rect.left, y), (tile_rect.right - 1, y), 2)
-
-        for i in range(1, num_vertical_stripes):
-            x = tile_rect.left + i * stripe_width
-            pg.draw.line(self.window, BLACK, (x, tile_rect.top), (x, tile_rect.bottom - 1), 2)
+        self.dirty_rects.extend(self.level.draw(self.window, self.camera))  # report the rects of the redrawn tiles
 
     # This function handles the logic for drawing the game objects on the game window
     def render_game_objects(self):
+        self.camera.begin_frame()  # check if the camera moved since the last drawn frame
         self.render_cells_into_level_tiles()  # render the cells into tiles
+        self.profiler.lap('draw.level')
 
-        # Create a dictionary that maps the name of the object with its corresponding objects to draw
-        game_objects_to_draw = {
-            'ice_tiles': self.ice_tiles,
-            'exit_portal': [self.exit_portal] if self.exit_portal else [],
-            'death_sigils': None,
-            'powerups': self.powerups,
-            'players': self.players,
-            'bombs': [bomb for player in self.players for bomb in player.bombs],
-            'yellow_immune_creep': [creep for creep in self.creeps if
-                                    creep.image_path == creep_yellow_imgpath and creep.transmutation_active],
-            'other_creeps': [creep for creep in self.creeps if
-                             not (creep.image_path == creep_yellow_imgpath and creep.transmutation_active)]
-        }
-
-        # Iterate through each object type and its corresponding objects to draw
-        for obj_type, objects in game_objects_to_draw.items():
-
-            # If object type is 'death sigils', call the death sigils render function
-            if obj_type == 'death_sigils':
-                self.render_death_sigils()
-
-            # If object type is 'yellow_immune_creep'
-            elif obj_type == 'yellow_immune_creep':
-                # iterate through all such objects and rraw the object normally
-                for obj in objects:
-                    obj.draw()
-                    # Iterate through every player's bomb object and daw it on top of the yellow immune creep
-                    for player in self.players:
-                        for bomb in player.bombs:
-                            bomb.draw()
-
-            # If object type is 'other_creeps'
-            elif obj_type == 'other_creeps':
-                # iterate through all such objects and rraw the object normally
-                for obj in objects:
-                    obj.draw()
-
-            # If object type is 'bombs'
-            elif obj_type == 'bombs':
-                # iterate through all such objects and rraw the object normally
-                for obj in objects:
-                    obj.draw()
-
-            # Else draw every other object with players being drawn above them
-            else:
-                for obj in objects:
-                    if obj_type == 'players':
-                        obj.draw()
-                    else:
-                        obj.draw()
-
-    # This function handles the logic for creating and displaying the death sigils when a player dies
-    def render_death_sigils(self):
-        # Define a dictionary mapping a player color to its corresponding death sigil image of same color
-        death_sigils = {
-            GREEN: pg.image.load(join(BASE_IMG_DIR, 'death_sigils', 'death_sigil_green.png')).convert_alpha(),
-            BLUE: pg.image.load(join(BASE_IMG_DIR, 'death_sigils', 'death_sigil_blue.png')).convert_alpha()
-        }
+        # Draw the game objects inside the camera's viewport layer by layer
+        self.render_queue.draw()
 
-        # Iterate through each player's end information
-        for player_name, player_info in self.player_end_info_dict.items():
-            player_color = player_info.get('color')
-            center_coords = player_info.get('center_coords')
-            collided_with_creep = player_info.get('collided_with_creep')
-            hit_by_bomb_explosion = player_info.get('hit_by_bomb_explosion')
+    # This function creates the pause surface once and renders it on the game window when the game is paused
+    def render_pause_screen(self):
+        if self.pause_surface is None:
+            self.pause_surface = pg.Surface((self.window.get_width(), self.window.get_height()))
+            self.pause_surface.fill(DARKBLUE)
+            text_surface = self.assets.fonts['pause_screen'].render('GAME PAUSED', True, WHITE)
 
-            # If the player color is valid and the player collided with a creep or was hit by a bomb explosion
-            if player_color and (collided_with_creep or hit_by_bomb_explosion):
-                death_sigil = death_sigils.get(player_color)  # get the corresponding death sigil image
+            # Position the text in the middle
+            text_width = self.window.get_width() // 2
+            text_height = self.window.get_height() // 2
+            text_rect = text_surface.get_rect(center=(text_width, text_height - 20))
 
-                # If the death sigil image exists create a rect object around it and display on game window
-                if death_sigil:
-                    death_sigil_rect = death_sigil.get_rect(center=center_coords)  # obtain coords from end_info_dict
-                    self.window.blit(death_sigil, death_sigil_rect)
+            self.pause_surface.blit(text_surface, text_rect)  # display the text surface onto the pause screen surface
 
-    # This function creates a new surface and renders it on the game window when the game is paused
-    def render_pause_screen(self):
-        self.pause_surface = pg.Surface((self.window.get_width(), self.window.get_height()))
-        self.pause_surface.fill(DARKBLUE)
-        font = pg.font.Font(join(BASE_FONT_DIR, 'pause_screen(kindlyrewind).ttf'), 60)
-        text_surface = font.render('GAME PAUSED', True, WHITE)
+        self.window.blit(self.pause_surface, (0, 0))  # display the pause surface onto the game window
 
-        # Position the text in the middle
-        text_width = self.window.get_width() // 2
-        text_height = self.window.get_height() // 2
-        text_rect = text_surface.get_rect(center=(text_width, text_height - 20))
+    # This function displays the progress of the asset loading at startup (the menu is shown once every asset loaded)
+    def render_loading_screen(self, num_of_loaded_assets, num_of_assets):
+        # Display the loading screen at most once per frame
+        current_time = pg.time.get_ticks()
+        if self.loading_screen_time is not None and current_time - self.loading_screen_time < 1000 / FPS:
+            return
+        self.loading_screen_time = current_time
+
+        self.window.fill(BLACK)
+
+        # Draw the outline of the progress bar and fill it by the share of loaded assets
+        bar_rect = pg.Rect(0, 0, self.window.get_width() // 3, 24)
+        bar_rect.center = (self.window.get_width() // 2, self.window.get_height() // 2)
+        filled_rect = bar_rect.inflate(-8, -8)
+        filled_rect.width = filled_rect.width * num_of_loaded_assets // num_of_assets
+        pg.draw.rect(self.window, WHITE, bar_rect, 2)
+        pg.draw.rect(self.window, BLUE, filled_rect)
+
+        # Display the text above the progress bar
+        text_surface = self.assets.fonts['profiler'].render(f"LOADING {num_of_loaded_assets}/{num_of_assets}", True,
+                                                            WHITE)
+        self.window.blit(text_surface, text_surface.get_rect(midbottom=(bar_rect.centerx, bar_rect.top - 8)))
 
-        self.pause_surface.blit(text_surface, text_rect)  # display the text surface onto the pause screen surface
-        self.window.blit(self.pause_surface, (0, 0))  # display the pause surface onto the game window
+        pg.display.flip()
+        pg.event.pump()  # keep the window responsive while the assets load
 
     # This function handles the logic for when the game is in paused state
     def pause_game(self):
@@ -392,18 +344,9 @@ class Game:
             self.paused = True  # set flag used to indicate game is paused to True
             self.resumed = False  # set flag used to indicate game has resumed to False
 
-            # Iterate through all the creeps in the game and handle their timers on pause
-            for creep in self.creeps:
-                creep.handle_timers_on_pause()
-
-            # Iterate through all the ice tile objects in the game and handle their timers on pause
-            for ice_tile in self.ice_tiles:
-                ice_tile.handle_timers_on_pause()
-
-            # Iterate through all the players and all the players bombs in the game and handle the bomb timers on pause
-            for player in self.players:
-                for bomb in player.bombs:
-                    bomb.handle_timers_on_pause()
+            # Stop the game clock, every scheduled timer waits until the game clock is resumed
+            self.game_clock.pause()
+            self.events.publish(GAME_PAUSED)
 
             # Play the pause game soundeffect when this function is called
             self.audio.play_sfx('pause_game', volume=0.2)
@@ -416,27 +359,20 @@ class Game:
             self.paused = False  # set flag used to indicate game is paused to False
             self.resumed = True  # set flag used to indicate game has resumed to True
 
-            # Iterate through all the creeps in the game and handle their timers on resume
-            for creep in self.creeps:
-                creep.handle_timers_on_resume()
-
-            # Iterate through all the ice tile objects in the game and handle their timers on resume
-            for ice_tile in self.ice_tiles:
-                ice_tile.handle_timers_on_resume()
-
-            # Iterate through all the players and their bombs in the game and handle the bomb timers on resume
-            for player in self.players:
-                for bomb in player.bombs:
-                    bomb.handle_timers_on_resume()
+            # Let the game clock advance again (the time spent paused is skipped over by every scheduled timer)
+            self.game_clock.resume()
+            self.events.publish(GAME_RESUMED)
 
     # This function handles the drawing for the entire game and updates dynamically
     def draw(self):
         # If game is in menu, draw the menu
         if self.in_menu:
             self.menu.draw()
+            self.profiler.lap('draw.menu')
         # If game is paused, display the pause screen
         elif self.paused:
             self.render_pause_screen()
+            self.profiler.lap('draw.pause_screen')
         # Every other state, render game objects
         else:
             self.render_game_objects()
@@ -445,103 +381,223 @@ class Game:
         if not self.in_menu and self.menu.in_end:
             # Draw the menu again on top
             self.menu.draw()
+            self.profiler.lap('draw.end_screen')
         # When user exists the end section, reset end surface delay start time to None
         else:
             self.menu.end_surface_delay_start_time = None
 
+        # Display the profiler overlay on top of everything else
+        profiler_overlay_rect = self.profiler.draw()
+        if profiler_overlay_rect:
+            self.dirty_rects.append(profiler_overlay_rect)
+            self.profiler.lap('draw.profiler')
+
     # This function handles the events for the entire game and updates dynamically
     def event_handler(self):
-        events = pg.event.get()
-        for event in events:
-
-            # When the user clicks the 'X' in the top-right corner of the program's window, exit the program
-            if event.type == pg.QUIT:
-                pg.quit()
-                sys.exit()
-
-            # When a key is pressed down
-            if event.type == pg.KEYDOWN:
-                # If the key is ESCAPE
-                if event.key == pg.K_ESCAPE:
-
-                    # If the game is paused, resume the game
-                    if self.paused:
-                        self.resume_game()
-
-                    # If the user is in menu settings or in a game, switch back to main menu
-                    elif self.menu.in_settings or self.game_mode_1player or self.game_mode_2player:
-                        self.menu.switch_to_main_menu()
-
-                    # If the user is in the custom, audio or controls section, switch back to settings
-                    elif self.menu.in_custom or self.menu.in_audio or self.menu.in_controls:
-                        self.menu.switch_to_settings()
-
-                # If the key is 'P'
-                if event.key == pg.K_p:
-                    # If the game is not paused or the game is not in the end game section
-                    if not self.paused and not self.menu.in_end:
-                        self.pause_game()  # pause the game
-                    else:
-                        self.resume_game()  # else, resume the game
-
-            # Handle the specific events for each individual menu section
-            if self.menu.in_main_menu:
-                self.menu.handle_events(events=events,
-                                        rects=self.menu.main_menu_rects,
-                                        options=self.menu.main_menu_options)
-
-            elif self.menu.in_settings:
-                self.menu.handle_events(events=events,
-                                        rects=self.menu.settings_rects,
-                                        options=self.menu.settings_options)
-
-            elif self.menu.in_custom:
-                self.menu.handle_events(events=events,
-                                        rects=self.menu.custom_rects,
-                                        options=self.menu.custom_options)
-
-            elif self.menu.in_audio:
-                self.menu.handle_events(events=events,
-                                        rects=self.menu.audio_rects,
-                                        options=self.menu.audio_options)
-
-            elif self.menu.in_controls:
-                self.menu.handle_events(events=events,
-                                        rects=self.menu.controls_rects,
-                                        options=self.menu.controls_options)
-
-            elif self.menu.in_end:
-                self.menu.handle_events(events=events,
-                                        rects=self.menu.end_rects,
-                                        options=self.menu.end_options)
+        self.input.route()  # pull the events of this frame once and pass each to the handlers of the current scene
+        self.profiler.lap('events')
+
+    # This function handles the events that apply to every scene (closing the window, navigating back and profiling)
+    def handle_global_event(self, event):
+        # When the user clicks the 'X' in the top-right corner of the program's window, exit the program
+        if event.type == pg.QUIT:
+            self.finish_recording()
+            pg.quit()
+            sys.exit()
+
+        # When a key is pressed down
+        if event.type == pg.KEYDOWN:
+            # If the key is ESCAPE
+            if event.key == pg.K_ESCAPE:
+
+                # If the game is paused, resume the game
+                if self.paused:
+                    self.resume_game()
+
+                # If the user is in menu settings or in a game, switch back to main menu
+                elif self.menu.in_settings or self.game_mode_1player or self.game_mode_2player:
+                    self.menu.switch_to_main_menu()
+
+                # If the user is in the custom, audio or controls section, switch back to settings
+                elif self.menu.in_custom or self.menu.in_audio or self.menu.in_controls:
+                    self.menu.switch_to_settings()
+
+            # If the key is 'F3', show or hide the frame profiler overlay
+            if event.key == pg.K_F3:
+                self.profiler.toggle()
+
+            # If the key is 'F4' while the frame profiler is on, export its frame timings to a CSV file
+            if event.key == pg.K_F4 and self.profiler.enabled:
+                self.profiler.export_csv()
+
+    # This function pauses or resumes the game when the key 'P' is pressed during a match
+    def handle_pause_event(self, event):
+        if event.type == pg.KEYDOWN and event.key == pg.K_p:
+            # If the game is not paused, pause the game
+            if not self.paused:
+                self.pause_game()
+            else:
+                self.resume_game()  # else, resume the game
 
     # This function handles the updating for the entire game and updates dynamically
     def update(self):
-        self.menu.update()  # update the menu
-        self.audio.update()  # update the audio
+        # Store the soundeffects that finished loading in the background since the last frame
+        self.assets.store_loaded_sound_effects()
+        self.profiler.lap('update.assets')
+
+        # The menu, audio and display are only updated when the game runs with a display
+        if not self.headless:
+            self.menu.update()  # update the menu
+            self.profiler.lap('update.menu')
+            self.audio.update()  # update the audio
+            self.profiler.lap('update.audio')
 
         # If the game is not in menu, in pause state or in end game section, keep updating all the game objects
         if not self.in_menu and (not self.paused or self.menu.in_end):
 
-            for player in self.players:
+            # Set the input of every player for this tick (and the game time when replaying)
+            self.capture_player_inputs()
+            self.profiler.lap('update.inputs')
+
+            # Wake up the game objects whose timers have expired
+            self.timers.update()
+            self.profiler.lap('update.timers')
+
+            # Detonate the bombs whose countdown expired together with every bomb caught in their blasts
+            self.detonations.update()
+            self.profiler.lap('update.detonations')
+
+            if self.exit_portal:
+                self.exit_portal.update()
+                self.profiler.lap('update.exit_portal')
+
+            # Iterate over a copy of the players list, players get removed once their end game animation finishes
+            for player in list(self.players):
                 player.update()
+            self.profiler.lap('update.players')
 
-                for bomb in player.bombs:
-                    if not player.stop_updating:
-                        bomb.update()
+            # Keep the players inside the camera's viewport
+            self.camera.follow(self.players)
+            self.profiler.lap('update.camera')
 
-            for ice_tile in self.ice_tiles:
-                ice_tile.update()
+            self.creep_system.update()
+            self.profiler.lap('update.creeps')
 
-            for creep in self.creeps:
-                creep.update()
+        # Deliver the game state transitions published during this frame to the subscribed systems
+        self.events.dispatch()
+        self.profiler.lap('update.events')
 
-        pg.display.flip()
+        if not self.headless:
+            self.update_display()
+            self.profiler.lap('update.display')
+
+    # This function stops updating every player once a player starts dying or leaving through the exit portal (the
+    # players are then immobile and invulnerable, only their death and exit portal animations keep running)
+    def stop_updating_players(self, player):
+        if len(self.players) <= 2:
+            for other_player in self.players:
+                other_player.stop_updating = True
+
+    # This function returns the name of the scene that is currently displayed on the game window
+    def current_scene(self):
+        if self.in_menu:
+            return 'menu'
+        elif self.menu.in_end:
+            return 'end'
+        elif self.paused:
+            return 'paused'
+        return 'game'
+
+    # This function pushes the drawn frame to the display, only the areas that changed are updated during gameplay
+    def update_display(self):
+        scene = self.current_scene()
+
+        # Flip the entire display on menu, pause and end screens, whenever the scene has changed and the camera moved
+        if not DIRTY_RECT_RENDERING or scene != 'game' or scene != self.previous_scene or self.camera.moved:
+            pg.display.flip()
+        # Otherwise update the areas drawn in this frame and the areas drawn in the previous frame (to erase them)
+        else:
+            pg.display.update(merge_rects(self.dirty_rects + self.previous_dirty_rects))
+
+        # Store the drawn areas and the scene of the current frame for the next frame
+        self.previous_dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        self.previous_scene = scene
 
     # This function creates a while loop which runs the game continously until the program is terminated
     def run(self):
         while True:
+            self.game_clock.latch()  # every game object reads the same game time during a frame
+            self.profiler.begin_frame()
             self.draw()
             self.event_handler()
             self.update()
             self.clock.tick(FPS)
+            self.profiler.lap('idle')  # time spent waiting for the next frame
+            self.profiler.end_frame()
+
+    # This function runs a match without the menu and without drawing, advancing the game by a fixed virtual timestep
+    def run_headless(self, game_mode_2player=False, max_steps=HEADLESS_MAX_STEPS):
+        # Skip the menu and start a new game in the selected game mode
+        self.start_match(game_mode_2player)
+
+        # Update the game as fast as possible until the match ends or the maximum number of steps is reached
+        steps = 0
+        while not self.menu.in_end and steps < max_steps:
+            self.update()
+            self.game_clock.step()
+            steps += 1
+
+        # Return the number of steps that were simulated
+        return steps
+
+    # This function skips the menu and starts a new game in the selected game mode
+    def start_match(self, game_mode_2player=False, seed=None):
+        self.in_menu = False
+        self.menu.in_main_menu = False
+        self.menu.in_end = False
+        self.game_mode_1player = not game_mode_2player
+        self.game_mode_2player = game_mode_2player
+        self.new_game(seed)
+
+    # This function sets the input bits of every player for the current game tick and records them if recording
+    def capture_player_inputs(self):
+        # When replaying, the recorded tick sets the players input bits and the game time
+        if self.replay is not None:
+            self.replay.apply_next_tick(self)
+        # Otherwise, read the input bits of every player from the keyboard
+        else:
+            keys = pg.key.get_pressed()
+            for player in self.players:
+                player.input_bits = player.read_input_bits(keys)
+
+        if self.recorder is not None:
+            self.recorder.record_tick(self)
+
+    # This function starts recording every match to a replay file (each new match overwrites the previous one)
+    def start_recording(self, path):
+        self.recorder = MatchRecorder(path)
+
+    # This function saves the recording of the current match (if a match is being recorded)
+    def finish_recording(self):
+        if self.recorder is not None:
+            self.recorder.finish()
+
+    # This function replays a recorded match (as fast as possible when headless) and returns the replayed ticks
+    def run_replay(self, replay):
+        self.replay = replay
+        replay.start(self)
+
+        # Replay the recorded ticks until the match ends, the replay runs out of ticks or the user leaves the game
+        while not self.menu.in_end and not replay.finished() and not self.in_menu:
+            if not self.headless:
+                self.draw()
+                self.event_handler()
+            self.update()
+            if not self.headless:
+                self.clock.tick(FPS)
+
+        self.replay = None
+
+        # Return the number of replayed ticks
+        return replay.tick_index
@@ -1,7 +1,10 @@
 # Ilijablaster/menu.py
 import sys
 import pygame as pg
-from settings import join, BASE_IMG_DIR, BASE_FONT_DIR, ALPHABET_INPUT_KEYS, OTHER_INPUT_KEYS, BLACK, WHITE, GREEN, BLUE
+from settings import join, BASE_IMG_DIR, ALPHABET_INPUT_KEYS, OTHER_INPUT_KEYS, BLACK, WHITE, GREEN, BLUE
+from settings import MENU_TEXT_CACHE_SIZE
+from render_utils import TextCache
+from event_bus import GAME_STARTED, MENU_OPENED, MATCH_ENDED, END_SCREEN_SHOWN
 
 
 class Menu:
@@ -14,15 +17,17 @@ class Menu:
         self.window_surface.fill(BLACK)  # Fill menu surface with a black background
 
         # BANNER
-        self.banner_img = pg.image.load(join(BASE_IMG_DIR, 'menu', 'banner.png')).convert_alpha()
-        self.select_marker_bomb_img = pg.image.load(join(BASE_IMG_DIR, 'menu',
-                                                         'select_marker_bomb.png')).convert_alpha()
-        self.defeat_face_img = pg.image.load(join(BASE_IMG_DIR, 'menu', 'defeat_face.png')).convert_alpha()
-        self.defeat_face_img = pg.transform.smoothscale(self.defeat_face_img, (125, 125))
+        self.banner_img = game.assets.images[join(BASE_IMG_DIR, 'menu', 'banner.png')]
+        self.select_marker_bomb_img = game.assets.images[join(BASE_IMG_DIR, 'menu', 'select_marker_bomb.png')]
+        self.defeat_face_img = game.assets.images[join(BASE_IMG_DIR, 'menu', 'defeat_face.png')]
 
         # FONT
-        self.menu_font = pg.font.Font(join(BASE_FONT_DIR, 'menu(upheaval-tt-brk).ttf'), 48)
-        self.end_font = pg.font.Font(join(BASE_FONT_DIR, 'end(arkkos-gmimi).ttf'), 90)
+        self.menu_font = game.assets.fonts['menu']
+        self.end_font = game.assets.fonts['end']
+
+        # TEXT CACHE
+        self.text_cache = TextCache(MENU_TEXT_CACHE_SIZE)  # Rendered option and end screen texts, reused every frame
+        self.option_layouts = {}  # Dictionary that maps the options list of a section to its (key, cached layout)
 
         # COLOR
         self.menu_colors = [WHITE, BLUE]  # Colors used throughout the menu
@@ -83,6 +88,8 @@ class Menu:
         self.end_surface_delay_duration = 20  # Use a delay b4 displaying end surf on screen to avoid complications
         self.end_surface_delay_start_time = None  # Initialize a start time for the end surface delay
         self.in_end = False  # Flag used to signal user in end section of the menu
+        self.shown_end_outcomes = set()  # Outcomes (victory, defeat, tie) already displayed on the end surface
+        self.game.events.subscribe(GAME_STARTED, self.shown_end_outcomes.clear)  # every match shows its own outcome
 
         # SELECTED ACTION INDEX
         self.selected_action_index = 0  # Index of the currently selected menu action
@@ -242,12 +249,13 @@ class Menu:
                 self.victorious_player_color = WHITE
 
         # Render "VICTORY" text string in WHTIE with end font as a surface
-        text_victory_surface = self.end_font.render("VICTORY", True, WHITE)
+        text_victory_surface = self.text_cache.render(self.end_font, "VICTORY", WHITE)
 
         # Render the victorious color in a text string in appropriate color with end font as a surface
-        text_victorious_color_surface = self.end_font.render(
+        text_victorious_color_surface = self.text_cache.render(
+            self.end_font,
             color_mapping.get(self.victorious_player_color) if self.victorious_player_color != WHITE else "VICTORY",
-            True, self.victorious_player_color if self.victorious_player_color != WHITE else WHITE)
+            self.victorious_player_color if self.victorious_player_color != WHITE else WHITE)
 
         # Create rect objects for both texts surfaces
         text_victory_rect = text_victory_surface.get_rect(
@@ -259,16 +267,14 @@ class Menu:
         self.game.window.blit(text_victory_surface, text_victory_rect)
         self.game.window.blit(text_victorious_color_surface, text_victorious_color_rect)
 
-        # Play the end game victory soundeffect
-        if not self.game.audio.victory_sfx_playing:
-            self.game.audio.play_sfx('end_game_victory', volume=0.5)
-            self.game.audio.victory_sfx_playing = True
+        # Announce the victory (the end game victory soundeffect is played once)
+        self.show_end_outcome('victory')
 
     # This function renders the defeat screen, displaying "DEFEAT" text along with a defeat emoji
     def render_defeat_screen(self):
 
         # Render "DEFEAT" text string in WHTIE with end font as a surface and create a rect object for it
-        text_defeat_surface = self.end_font.render("DEFEAT", True, WHITE)
+        text_defeat_surface = self.text_cache.render(self.end_font, "DEFEAT", WHITE)
         text_defeat_rect = text_defeat_surface.get_rect(
             center=(self.game.window.get_width() // 2, (self.game.window.get_height() // 3) - 40))
 
@@ -280,15 +286,13 @@ class Menu:
         self.game.window.blit(text_defeat_surface, text_defeat_rect)
         self.game.window.blit(self.defeat_face_img, defeat_face_rect)
 
-        # Play the end game defeat soundeffect
-        if not self.game.audio.defeat_sfx_playing:
-            self.game.audio.play_sfx('end_game_defeat', volume=0.5)
-            self.game.audio.defeat_sfx_playing = True
+        # Announce the defeat (the end game defeat soundeffect is played once)
+        self.show_end_outcome('defeat')
 
     # This function renders the tie screen, indicating a tie game.
     def render_tie_screen(self):
         # Render the text "TIE !" using the end font and white color
-        text_tie_surface = self.end_font.render("TIE !", True, WHITE)
+        text_tie_surface = self.text_cache.render(self.end_font, "TIE !", WHITE)
 
         # Get the rect object representing the text surface and center it horizontally
         text_tie_rect = text_tie_surface.get_rect(
@@ -297,6 +301,15 @@ class Menu:
         # Display the text surface onto the game window at the specified rect position
         self.game.window.blit(text_tie_surface, text_tie_rect)
 
+        # Announce the tie
+        self.show_end_outcome('tie')
+
+    # This function publishes the outcome displayed on the end surface the first time it is displayed during a match
+    def show_end_outcome(self, outcome):
+        if outcome not in self.shown_end_outcomes:
+            self.shown_end_outcomes.add(outcome)
+            self.game.events.publish(END_SCREEN_SHOWN, outcome)
+
     # This function applies a fade effect to the end surface black background in order to make it see-through
     def apply_fade_effect_to_end_surface(self):
         # If mouse is hovered over the end surface
@@ -326,10 +339,10 @@ class Menu:
         # MAIN MENU SECTION
         if self.in_main_menu:
             # Retrieve the main menu rects from main menu options
-            self.main_menu_rects = self.render_option_text_with_rect_and_layout(self.game.window,
-                                                                                self.main_menu_options,
-                                                                                self.menu_font,
-                                                                                self.selected_action_index)
+            self.main_menu_rects = self.option_rects(self.game.window,
+                                                     self.main_menu_options,
+                                                     self.menu_font,
+                                                     self.selected_action_index)
             # Clear all text rect objects except the current section ones
             for rects_list in all_rects_lists:
                 if rects_list is not self.main_menu_rects:
@@ -338,10 +351,10 @@ class Menu:
         # SETTINGS MENU SECTION
         elif self.in_settings:
             # Retrieve the settings rects from settings options
-            self.settings_rects = self.render_option_text_with_rect_and_layout(self.game.window,
-                                                                               self.settings_options,
-                                                                               self.menu_font,
-                                                                               self.selected_action_index)
+            self.settings_rects = self.option_rects(self.game.window,
+                                                    self.settings_options,
+                                                    self.menu_font,
+                                                    self.selected_action_index)
 
             # Reset all mouse nav arrow flags when going back to settings from either custom, audio or controls sections
             self.rects_for_custom_arrows_added = False
@@ -356,8 +369,8 @@ class Menu:
         # CUSTOM MENU SECTION
         elif self.in_custom:
             # Retrieve the custom rects from custom options
-            self.custom_rects = self.render_option_text_with_rect_and_layout(self.game.window, self.custom_options,
-                                                                             self.menu_font, self.selected_action_index)
+            self.custom_rects = self.option_rects(self.game.window, self.custom_options,
+                                                  self.menu_font, self.selected_action_index)
 
             # Clear all text rect objects except the current section ones
             for rects_list in all_rects_lists:
@@ -383,8 +396,8 @@ class Menu:
         # AUDIO MENU SECTION
         elif self.in_audio:
             # Retrieve the audio rects from audio options
-            self.audio_rects = self.render_option_text_with_rect_and_layout(self.game.window, self.audio_options,
-                                                                            self.menu_font, self.selected_action_index)
+            self.audio_rects = self.option_rects(self.game.window, self.audio_options,
+                                                 self.menu_font, self.selected_action_index)
 
             # Clear all text rect objects except the current section ones
             for rects_list in all_rects_lists:
@@ -403,9 +416,9 @@ class Menu:
         # CONTROLS MENU SECTION
         elif self.in_controls:
             # Retrieve the controls rects from controls options
-            self.controls_rects = self.render_option_text_with_rect_and_layout(self.game.window, self.controls_options,
-                                                                               self.menu_font,
-                                                                               self.selected_action_index)
+            self.controls_rects = self.option_rects(self.game.window, self.controls_options,
+                                                    self.menu_font,
+                                                    self.selected_action_index)
 
             # Clear all text rect objects except the current section ones
             for rects_list in all_rects_lists:
@@ -448,8 +461,8 @@ class Menu:
         # END MENU SECTION
         elif self.in_end:
             # Retrieve the end rects from end options
-            self.end_rects = self.render_option_text_with_rect_and_layout(self.game.window, self.end_options,
-                                                                          self.menu_font, self.selected_action_index)
+            self.end_rects = self.option_rects(self.game.window, self.end_options,
+                                               self.menu_font, self.selected_action_index)
             # Apply the face effect to the background of the end surface
             self.apply_fade_effect_to_end_surface()
 
@@ -460,6 +473,21 @@ class Menu:
 
     # This function renders each option of a section together w/ its rect and determines the color and layout
     def render_option_text_with_rect_and_layout(self, window, options, font, selected_index):
+        layout = self.layout_options(window, options, font, selected_index)
+
+        # Display every option text surface onto the menu window surface at its position (one blit per option)
+        window.blits(layout, doreturn=False)
+
+        # Return the list of rectangles for each option text
+        return [text_rect for _, text_rect in layout]
+
+    # This function returns the rect of each option of a section without displaying the options
+    def option_rects(self, window, options, font, selected_index):
+        return [text_rect for _, text_rect in self.layout_options(window, options, font, selected_index)]
+
+    # This function returns the (text surface, rect) pair of each option of a section, the layout of a section is
+    # cached and only recomputed when its options, the selected option or its vertical position change
+    def layout_options(self, window, options, font, selected_index):
         banner_height = self.banner_img.get_height()  # get the height of the banner image
         font_height = font.get_height()  # get the height of the font used for options text
         menu_options_height = len(options) * font_height  # determine total height occupied by all options
@@ -477,28 +505,32 @@ class Menu:
         elif self.in_end:
             starting_vert_pos = ((vertical_space - menu_options_height) // 2)
 
-        # Define a list used to store the rect objects of each rendered option text
-        text_rects = []
+        # Reuse the cached layout of the section if nothing it depends on has changed
+        layout_key = (tuple(options), font, selected_index, starting_vert_pos, window.get_width())
+        cached_key, cached_layout = self.option_layouts.get(id(options), (None, None))
+        if cached_key == layout_key:
+            return cached_layout
+
+        # Define a list used to store the text surface and rect object of each option text
+        layout = []
 
         # Iterate through the number of available options in any given menu section
         for i, option in enumerate(options):
             # Determine color based on whether the option is selected or not
             color = self.menu_colors[1] if i == selected_index else self.menu_colors[0]
 
-            # Render the option text surface using the slected font and color
-            text_surface = font.render(option, True, color)
+            # Get the option text surface rendered with the slected font and color (from the text cache)
+            text_surface = self.text_cache.render(font, option, color)
 
             # Calculate the rect object for the rendered text, centered horizontally and vertically positioned
             text_rect = text_surface.get_rect(center=(window.get_width() // 2,
                                                       banner_height + starting_vert_pos + i *
                                                       (font_height + between_spacing)))
+            layout.append((text_surface, text_rect))
 
-            # Display the text surface onto the menu window surface at the calculated position
-            window.blit(text_surface, text_rect)
-            text_rects.append(text_rect)  # append the text rectangle to the list
-
-        # Return the list of rectangles for each option text
-        return text_rects
+        # Store the layout of the section (keyed by its options list)
+        self.option_layouts[id(options)] = (layout_key, layout)
+        return layout
 
     # This function replaces a string in an individual option with another string when left or right key is pressed
     def replace_string_in_option(self, option, key_pressed=None):
@@ -756,320 +788,331 @@ class Menu:
             pg.mouse.set_cursor(pg.SYSTEM_CURSOR_ARROW)
             return None
 
+    # This function passes an event to the event handler together with the rects and options of the current section
+    def handle_section_event(self, event):
+        if self.in_main_menu:
+            self.handle_event(event, self.main_menu_rects, self.main_menu_options)
+        elif self.in_settings:
+            self.handle_event(event, self.settings_rects, self.settings_options)
+        elif self.in_custom:
+            self.handle_event(event, self.custom_rects, self.custom_options)
+        elif self.in_audio:
+            self.handle_event(event, self.audio_rects, self.audio_options)
+        elif self.in_controls:
+            self.handle_event(event, self.controls_rects, self.controls_options)
+        elif self.in_end:
+            self.handle_event(event, self.end_rects, self.end_options)
+
     # This function handles all the main events like (mouse and keyboard interactions) inside the menu class
-    def handle_events(self, events, rects, options):
-
-        # Check for events
-        for event in events:
-
-            # LEFT MOUSE BUTTON CLICK (DOWN)
-            if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
-                mouse_action_index = self.check_cursor_collision(event.pos)  # check cursor collision
-                # Set the mouse selected action index to the current selected action index
-                if mouse_action_index is not None:
-                    self.selected_action_index = mouse_action_index
-                    self.mouse_selecting = True  # set flag used to indicate mouse is selecting to True
-
-                    # Check the current menu state and execute corresponding actions
-                    if self.in_main_menu:
-                        self.main_menu_actions(self.selected_action_index)
-                    elif self.in_settings:
-                        self.settings_actions(self.selected_action_index)
-                    elif self.in_custom:
-                        self.custom_actions(self.selected_action_index)
-
-                        # Extract left and right arrow rects from the custom mouse nav arrows rects list
-                        for left_arrow_rect, right_arrow_rect in self.custom_mouse_nav_arrows_rects:
-                            # Check if the cursor collides with any of the arrow rects
-                            if left_arrow_rect.collidepoint(event.pos) or right_arrow_rect.collidepoint(event.pos):
-
-                                # Determine the index of the arrow being clicked
-                                arrow_index = self.custom_mouse_nav_arrows_rects.index(
-                                    (left_arrow_rect, right_arrow_rect))
-
-                                # Determine the scroll direction based on which arrow is clicked
-                                scroll_direction = pg.K_LEFT if left_arrow_rect.collidepoint(event.pos) else pg.K_RIGHT
-
-                                # Determine the scroll amount
-                                scroll_amount = -1 if scroll_direction == pg.K_LEFT else 1
-
-                                # Update the corresponding custom option based on the arrow index
-                                if arrow_index == 0:
-                                    # If it's the first arrow, update the option directly by replacing strings
-                                    self.custom_options[0] = self.replace_string_in_option(self.custom_options[0],
-                                                                                           scroll_direction)
-                                else:
-                                    # If it's any other arrow, scroll the custom option
-                                    self.custom_options[arrow_index] = self.scroll_custom_option(arrow_index,
-                                                                                                 scroll_amount,
-                                                                                                 scroll_direction)
-                                # Play the menu adjust soundeffect
-                                self.game.audio.play_sfx('menu_adjust', volume=0.9)
-
-                    elif self.in_audio:
-                        self.audio_actions(self.selected_action_index)
-
-                        # Extract left and right arrow rects from the audio mouse nav arrows rects list
-                        for left_arrow_rect, right_arrow_rect in self.audio_mouse_nav_arrows_rects:
-                            # Check if the cursor collides with any of the arrow rects
-                            if left_arrow_rect.collidepoint(event.pos) or right_arrow_rect.collidepoint(event.pos):
-
-                                # Determine the index of the arrow being clicked
-                                arrow_index = self.audio_mouse_nav_arrows_rects.index(
-                                    (left_arrow_rect, right_arrow_rect))
-
-                                # Determine the scroll direction based on the arrow clicked
-                                scroll_direction = pg.K_LEFT if left_arrow_rect.collidepoint(
-                                    event.pos) else pg.K_RIGHT
-
-                                # Determine the scroll amount
-                                scroll_amount = -10 if scroll_direction == pg.K_RIGHT else 10
-
-                                # If it's the first arrow, adjust the volume option
-                                if arrow_index == 0:
-                                    self.audio_options[0] = self.adjust_volume_option(arrow_index, scroll_amount,
-                                                                                      scroll_direction)
-                                # Else replace the string in option
-                                elif arrow_index == 1:
-                                    self.audio_options[1] = self.replace_string_in_option(self.audio_options[1],
-                                                                                          scroll_direction)
-                                # Play the menu adjust soundeffect
-                                self.game.audio.play_sfx('menu_adjust', volume=0.9)
-
-                    elif self.in_controls:
-                        self.controls_actions(self.selected_action_index)
-
-                        # Extract left and right arrow rects from the controls mouse nav arrows rects list
-                        for left_arrow_rect, right_arrow_rect in self.controls_mouse_nav_arrows_rects:
-                            # Check if the cursor collides with any of the arrow rects
-                            if left_arrow_rect.collidepoint(event.pos) or right_arrow_rect.collidepoint(event.pos):
-
-                                # Determine the index of the arrow being clicked
-                                arrow_index = self.controls_mouse_nav_arrows_rects.index(
-                                    (left_arrow_rect, right_arrow_rect))
-
-                                # Determine the scroll direction
-                                scroll_direction = pg.K_LEFT if left_arrow_rect.collidepoint(event.pos) else pg.K_RIGHT
-
-                                # If index in arrows list equals 0, replace string in option with new string
-                                if arrow_index == 0:
-                                    self.controls_options[0] = self.replace_string_in_option(self.controls_options[0],
+    def handle_event(self, event, rects, options):
+        # LEFT MOUSE BUTTON CLICK (DOWN)
+        if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
+            mouse_action_index = self.check_cursor_collision(event.pos)  # check cursor collision
+            # Set the mouse selected action index to the current selected action index
+            if mouse_action_index is not None:
+                self.selected_action_index = mouse_action_index
+                self.mouse_selecting = True  # set flag used to indicate mouse is selecting to True
+
+                # Check the current menu state and execute corresponding actions
+                if self.in_main_menu:
+                    self.main_menu_actions(self.selected_action_index)
+                elif self.in_settings:
+                    self.settings_actions(self.selected_action_index)
+                elif self.in_custom:
+                    self.custom_actions(self.selected_action_index)
+
+                    # Extract left and right arrow rects from the custom mouse nav arrows rects list
+                    for left_arrow_rect, right_arrow_rect in self.custom_mouse_nav_arrows_rects:
+                        # Check if the cursor collides with any of the arrow rects
+                        if left_arrow_rect.collidepoint(event.pos) or right_arrow_rect.collidepoint(event.pos):
+
+                            # Determine the index of the arrow being clicked
+                            arrow_index = self.custom_mouse_nav_arrows_rects.index(
+                                (left_arrow_rect, right_arrow_rect))
+
+                            # Determine the scroll direction based on which arrow is clicked
+                            scroll_direction = pg.K_LEFT if left_arrow_rect.collidepoint(event.pos) else pg.K_RIGHT
+
+                            # Determine the scroll amount
+                            scroll_amount = -1 if scroll_direction == pg.K_LEFT else 1
+
+                            # Update the corresponding custom option based on the arrow index
+                            if arrow_index == 0:
+                                # If it's the first arrow, update the option directly by replacing strings
+                                self.custom_options[0] = self.replace_string_in_option(self.custom_options[0],
+                                                                                       scroll_direction)
+                            else:
+                                # If it's any other arrow, scroll the custom option
+                                self.custom_options[arrow_index] = self.scroll_custom_option(arrow_index,
+                                                                                             scroll_amount,
                                                                                              scroll_direction)
-                                # Else use the method to scroll through controsl option
-                                else:
-                                    self.scroll_controls_option(arrow_index, scroll_direction)
+                            # Play the menu adjust soundeffect
+                            self.game.audio.play_sfx('menu_adjust', volume=0.9)
+
+                elif self.in_audio:
+                    self.audio_actions(self.selected_action_index)
+
+                    # Extract left and right arrow rects from the audio mouse nav arrows rects list
+                    for left_arrow_rect, right_arrow_rect in self.audio_mouse_nav_arrows_rects:
+                        # Check if the cursor collides with any of the arrow rects
+                        if left_arrow_rect.collidepoint(event.pos) or right_arrow_rect.collidepoint(event.pos):
+
+                            # Determine the index of the arrow being clicked
+                            arrow_index = self.audio_mouse_nav_arrows_rects.index(
+                                (left_arrow_rect, right_arrow_rect))
+
+                            # Determine the scroll direction based on the arrow clicked
+                            scroll_direction = pg.K_LEFT if left_arrow_rect.collidepoint(
+                                event.pos) else pg.K_RIGHT
+
+                            # Determine the scroll amount
+                            scroll_amount = -10 if scroll_direction == pg.K_RIGHT else 10
+
+                            # If it's the first arrow, adjust the volume option
+                            if arrow_index == 0:
+                                self.audio_options[0] = self.adjust_volume_option(arrow_index, scroll_amount,
+                                                                                  scroll_direction)
+                            # Else replace the string in option
+                            elif arrow_index == 1:
+                                self.audio_options[1] = self.replace_string_in_option(self.audio_options[1],
+                                                                                      scroll_direction)
+                            # Play the menu adjust soundeffect
+                            self.game.audio.play_sfx('menu_adjust', volume=0.9)
 
-                                # Play the menu adjust soundeffect
-                                self.game.audio.play_sfx('menu_adjust', volume=0.9)
+                elif self.in_controls:
+                    self.controls_actions(self.selected_action_index)
 
-                    elif self.in_end:
-                        self.end_actions(self.selected_action_index)
+                    # Extract left and right arrow rects from the controls mouse nav arrows rects list
+                    for left_arrow_rect, right_arrow_rect in self.controls_mouse_nav_arrows_rects:
+                        # Check if the cursor collides with any of the arrow rects
+                        if left_arrow_rect.collidepoint(event.pos) or right_arrow_rect.collidepoint(event.pos):
 
-            # LEFT MOUSE BUTTON CLICK (UP)
-            elif event.type == pg.MOUSEBUTTONUP and event.button == 1:
-                self.mouse_selecting = False  # set flag indicating that the mouse is selecting to False
+                            # Determine the index of the arrow being clicked
+                            arrow_index = self.controls_mouse_nav_arrows_rects.index(
+                                (left_arrow_rect, right_arrow_rect))
 
-            # MOUSE ON HOVER (Handle in event of mouse cursor hovering over target)
-            elif event.type == pg.MOUSEMOTION:
+                            # Determine the scroll direction
+                            scroll_direction = pg.K_LEFT if left_arrow_rect.collidepoint(event.pos) else pg.K_RIGHT
 
-                # Check cursor collision to obtain index based on mouse position
-                mouse_action_index = self.check_cursor_collision(event.pos)
-                mouse_pos = pg.mouse.get_pos()  # get current mouse position
+                            # If index in arrows list equals 0, replace string in option with new string
+                            if arrow_index == 0:
+                                self.controls_options[0] = self.replace_string_in_option(self.controls_options[0],
+                                                                                         scroll_direction)
+                            # Else use the method to scroll through controsl option
+                            else:
+                                self.scroll_controls_option(arrow_index, scroll_direction)
 
-                # Initialize colors list with the same length as rects
-                colors = [WHITE] * len(rects)
+                            # Play the menu adjust soundeffect
+                            self.game.audio.play_sfx('menu_adjust', volume=0.9)
+
+                elif self.in_end:
+                    self.end_actions(self.selected_action_index)
+
+        # LEFT MOUSE BUTTON CLICK (UP)
+        elif event.type == pg.MOUSEBUTTONUP and event.button == 1:
+            self.mouse_selecting = False  # set flag indicating that the mouse is selecting to False
+
+        # MOUSE ON HOVER (Handle in event of mouse cursor hovering over target)
+        elif event.type == pg.MOUSEMOTION:
+
+            # Check cursor collision to obtain index based on mouse position
+            mouse_action_index = self.check_cursor_collision(event.pos)
+            mouse_pos = pg.mouse.get_pos()  # get current mouse position
 
-                # Iterate through each rect object in menu section and update the text color if hovered by mouse
-                for i, rect in enumerate(rects):
-                    if rect.collidepoint(event.pos):
-                        colors[i] = BLUE  # if hovered, set the color to blue
+            # Initialize colors list with the same length as rects
+            colors = [WHITE] * len(rects)
 
-                # Update selected action index if mouse action index is valid
-                if mouse_action_index is not None and 0 <= mouse_action_index < len(colors):
-                    self.selected_action_index = mouse_action_index
+            # Iterate through each rect object in menu section and update the text color if hovered by mouse
+            for i, rect in enumerate(rects):
+                if rect.collidepoint(event.pos):
+                    colors[i] = BLUE  # if hovered, set the color to blue
 
-                # Update previous action index and color
-                if 0 <= self.selected_action_index < len(colors):
-                    if self.selected_action_index != self.prev_action_index:  # check if the selected index has changed
-                        self.on_mouse_hover_sound_played = False
+            # Update selected action index if mouse action index is valid
+            if mouse_action_index is not None and 0 <= mouse_action_index < len(colors):
+                self.selected_action_index = mouse_action_index
 
-                self.prev_action_index = self.selected_action_index  # update previous action index
+            # Update previous action index and color
+            if 0 <= self.selected_action_index < len(colors):
+                if self.selected_action_index != self.prev_action_index:  # check if the selected index has changed
+                    self.on_mouse_hover_sound_played = False
 
-                if 0 <= self.selected_action_index < len(colors):
-                    self.prev_action_color = colors[self.selected_action_index]  # store olor of the selected action
+            self.prev_action_index = self.selected_action_index  # update previous action index
 
-                    if colors[self.selected_action_index] == BLUE:  # check if the selected action is blue (hovered)
-                        current_time = pg.time.get_ticks()  # get the current time
-                        if (
-                                mouse_pos != self.last_mouse_pos
-                                and not self.sound_played_for_moused_rect
-                                and current_time - self.last_select_sound_time >= 100
-                        ):
-                            self.game.audio.play_sfx('menu_nav', volume=0.3)
+            if 0 <= self.selected_action_index < len(colors):
+                self.prev_action_color = colors[self.selected_action_index]  # store olor of the selected action
 
-                            self.sound_played_for_moused_rect = True  # set sound flag for the current rect as True
-                            self.last_select_sound_time = current_time  # update the last select sound time
+                if colors[self.selected_action_index] == BLUE:  # check if the selected action is blue (hovered)
+                    current_time = pg.time.get_ticks()  # get the current time
+                    if (
+                            mouse_pos != self.last_mouse_pos
+                            and not self.sound_played_for_moused_rect
+                            and current_time - self.last_select_sound_time >= 100
+                    ):
+                        self.game.audio.play_sfx('menu_nav', volume=0.3)
+
+                        self.sound_played_for_moused_rect = True  # set sound flag for the current rect as True
+                        self.last_select_sound_time = current_time  # update the last select sound time
+                else:
+                    self.sound_played_for_moused_rect = False  # reset sound flag when text is not orange
+
+                self.last_mouse_pos = mouse_pos  # update the last mouse position
+
+        # KEYBOARD KEYS PRESSED (DOWN)
+        elif event.type == pg.KEYDOWN:
+
+            # RETURN/ENTER
+            if event.key == pg.K_RETURN:
+                # Execute the following action methods based on the menu section's selected action index
+                if self.in_main_menu:
+                    self.main_menu_actions(self.selected_action_index)
+                elif self.in_settings:
+                    self.settings_actions(self.selected_action_index)
+                elif self.in_custom:
+                    self.custom_actions(self.selected_action_index)
+                elif self.in_audio:
+                    self.audio_actions(self.selected_action_index)
+                elif self.in_controls:
+                    self.controls_actions(self.selected_action_index)
+                elif self.in_end:
+                    self.end_actions(self.selected_action_index)
+
+            # LEFT KEY
+            elif event.key == pg.K_LEFT:
+                # If in custom section of the menu
+                if self.in_custom:
+                    # If in custom portion of custom menu, create a list with scroll indices
+                    if self.customize_mode:
+                        scroll_indices = [0, 1, 2, 3, 4, 5, 6]
+                    # Else, if default portion, only index is 0
                     else:
-                        self.sound_played_for_moused_rect = False  # reset sound flag when text is not orange
-
-                    self.last_mouse_pos = mouse_pos  # update the last mouse position
-
-            # KEYBOARD KEYS PRESSED (DOWN)
-            elif event.type == pg.KEYDOWN:
-
-                # RETURN/ENTER
-                if event.key == pg.K_RETURN:
-                    # Execute the following action methods based on the menu section's selected action index
-                    if self.in_main_menu:
-                        self.main_menu_actions(self.selected_action_index)
-                    elif self.in_settings:
-                        self.settings_actions(self.selected_action_index)
-                    elif self.in_custom:
-                        self.custom_actions(self.selected_action_index)
-                    elif self.in_audio:
-                        self.audio_actions(self.selected_action_index)
-                    elif self.in_controls:
-                        self.controls_actions(self.selected_action_index)
-                    elif self.in_end:
-                        self.end_actions(self.selected_action_index)
-
-                # LEFT KEY
-                elif event.key == pg.K_LEFT:
-                    # If in custom section of the menu
-                    if self.in_custom:
-                        # If in custom portion of custom menu, create a list with scroll indices
-                        if self.customize_mode:
-                            scroll_indices = [0, 1, 2, 3, 4, 5, 6]
-                        # Else, if default portion, only index is 0
-                        else:
-                            scroll_indices = [0]
-
-                        # Iterate through all the indices in scroll indices
-                        for index in scroll_indices:
-                            # If index equals the current selection action index
-                            if self.selected_action_index == index:
-                                # When it equals 0, replace string in custom options (default/custom)
-                                if index == 0:
-                                    self.custom_options[index] = self.replace_string_in_option(
-                                        self.custom_options[index], pg.K_LEFT)
-                                # Else, run the function that scrolls through custom options
-                                else:
-                                    self.custom_options[index] = self.scroll_custom_option(index, -1, pg.K_LEFT)
-
-                                # Play menu adjust soundeffect
-                                self.game.audio.play_sfx('menu_adjust', volume=0.9)
-
-                    # Else, If in audio section of the menu
-                    elif self.in_audio:
-                        # If audio options index 0 is equal to current selected action index
-                        if self.selected_action_index == 0:
-                            # Run function that adjust the game volume
-                            self.audio_options[0] = self.adjust_volume_option(self.selected_action_index, 10, pg.K_LEFT)
+                        scroll_indices = [0]
+
+                    # Iterate through all the indices in scroll indices
+                    for index in scroll_indices:
+                        # If index equals the current selection action index
+                        if self.selected_action_index == index:
+                            # When it equals 0, replace string in custom options (default/custom)
+                            if index == 0:
+                                self.custom_options[index] = self.replace_string_in_option(
+                                    self.custom_options[index], pg.K_LEFT)
+                            # Else, run the function that scrolls through custom options
+                            else:
+                                self.custom_options[index] = self.scroll_custom_option(index, -1, pg.K_LEFT)
 
                             # Play menu adjust soundeffect
                             self.game.audio.play_sfx('menu_adjust', volume=0.9)
 
-                        # Else, if audio options index 1 is equal to current selected action index
-                        elif self.selected_action_index == 1:
-                            # Replace string at audio options index 1 (yes/no)
-                            self.audio_options[1] = self.replace_string_in_option(self.audio_options[1], pg.K_LEFT)
+                # Else, If in audio section of the menu
+                elif self.in_audio:
+                    # If audio options index 0 is equal to current selected action index
+                    if self.selected_action_index == 0:
+                        # Run function that adjust the game volume
+                        self.audio_options[0] = self.adjust_volume_option(self.selected_action_index, 10, pg.K_LEFT)
+
+                        # Play menu adjust soundeffect
+                        self.game.audio.play_sfx('menu_adjust', volume=0.9)
+
+                    # Else, if audio options index 1 is equal to current selected action index
+                    elif self.selected_action_index == 1:
+                        # Replace string at audio options index 1 (yes/no)
+                        self.audio_options[1] = self.replace_string_in_option(self.audio_options[1], pg.K_LEFT)
+
+                        # Play menu adjust soundeffect
+                        self.game.audio.play_sfx('menu_adjust', volume=0.9)
+
+                # Else, if in controls menu section
+                elif self.in_controls:
+                    scroll_indices = [0, 1, 2, 3, 4, 5]
+
+                    # Iterate through the indices in the controls menu options
+                    for index in scroll_indices:
+                        if self.selected_action_index == index:
+                            # If selected action index is 0
+                            if index == 0:
+                                # Replace controls option stsring (player 1/player 2)
+                                self.controls_options[index] = self.replace_string_in_option(
+                                    self.controls_options[index], pg.K_LEFT)
+                            # Other indices, run function that scrolls through controls options
+                            else:
+                                self.scroll_controls_option(index, pg.K_LEFT)
 
                             # Play menu adjust soundeffect
                             self.game.audio.play_sfx('menu_adjust', volume=0.9)
 
-                    # Else, if in controls menu section
-                    elif self.in_controls:
-                        scroll_indices = [0, 1, 2, 3, 4, 5]
-
-                        # Iterate through the indices in the controls menu options
-                        for index in scroll_indices:
-                            if self.selected_action_index == index:
-                                # If selected action index is 0
-                                if index == 0:
-                                    # Replace controls option stsring (player 1/player 2)
-                                    self.controls_options[index] = self.replace_string_in_option(
-                                        self.controls_options[index], pg.K_LEFT)
-                                # Other indices, run function that scrolls through controls options
-                                else:
-                                    self.scroll_controls_option(index, pg.K_LEFT)
-
-                                # Play menu adjust soundeffect
-                                self.game.audio.play_sfx('menu_adjust', volume=0.9)
-
-                # RIGHT KEY
-                elif event.key == pg.K_RIGHT:
-                    # If in custom menu section
-                    if self.in_custom:
-                        # If in customize portion of custom menu, create a list with scroll indices
-                        if self.customize_mode:
-                            scroll_indices = [0, 1, 2, 3, 4, 5, 6]
-                        # Else in default portion of custom menu
-                        else:
-                            scroll_indices = [0]
-
-                        # Iterate through the indices in the custom menu options
-                        for index in scroll_indices:
-                            if self.selected_action_index == index:
-                                # If index equals 0, replace string in option (switch between default/custom)
-                                if index == 0:
-                                    self.custom_options[index] = self.replace_string_in_option(
-                                        self.custom_options[index], pg.K_RIGHT)
-                                # Else, scroll through custom option
-                                else:
-                                    self.custom_options[index] = self.scroll_custom_option(index, 1, pg.K_RIGHT)
-
-                                # Play menu adjust soundeffect
-                                self.game.audio.play_sfx('menu_adjust', volume=0.9)
-
-                    # Else, if in audio menu section
-                    elif self.in_audio:
-                        # If selected action index is 0
-                        if self.selected_action_index == 0:
-                            # Adjust music volume
-                            self.audio_options[0] = self.adjust_volume_option(self.selected_action_index,
-                                                                              -10, pg.K_RIGHT)
+            # RIGHT KEY
+            elif event.key == pg.K_RIGHT:
+                # If in custom menu section
+                if self.in_custom:
+                    # If in customize portion of custom menu, create a list with scroll indices
+                    if self.customize_mode:
+                        scroll_indices = [0, 1, 2, 3, 4, 5, 6]
+                    # Else in default portion of custom menu
+                    else:
+                        scroll_indices = [0]
+
+                    # Iterate through the indices in the custom menu options
+                    for index in scroll_indices:
+                        if self.selected_action_index == index:
+                            # If index equals 0, replace string in option (switch between default/custom)
+                            if index == 0:
+                                self.custom_options[index] = self.replace_string_in_option(
+                                    self.custom_options[index], pg.K_RIGHT)
+                            # Else, scroll through custom option
+                            else:
+                                self.custom_options[index] = self.scroll_custom_option(index, 1, pg.K_RIGHT)
 
                             # Play menu adjust soundeffect
                             self.game.audio.play_sfx('menu_adjust', volume=0.9)
 
-                        # Else, if selected action index is 1
-                        elif self.selected_action_index == 1:
-                            # Replace string in option (yes/no to enable soundeffects)
-                            self.audio_options[1] = self.replace_string_in_option(self.audio_options[1], pg.K_RIGHT)
+                # Else, if in audio menu section
+                elif self.in_audio:
+                    # If selected action index is 0
+                    if self.selected_action_index == 0:
+                        # Adjust music volume
+                        self.audio_options[0] = self.adjust_volume_option(self.selected_action_index,
+                                                                          -10, pg.K_RIGHT)
+
+                        # Play menu adjust soundeffect
+                        self.game.audio.play_sfx('menu_adjust', volume=0.9)
+
+                    # Else, if selected action index is 1
+                    elif self.selected_action_index == 1:
+                        # Replace string in option (yes/no to enable soundeffects)
+                        self.audio_options[1] = self.replace_string_in_option(self.audio_options[1], pg.K_RIGHT)
+
+                        # Play menu adjust soundeffect
+                        self.game.audio.play_sfx('menu_adjust', volume=0.9)
+
+                # Else, if in controls menu section
+                elif self.in_controls:
+                    scroll_indices = [0, 1, 2, 3, 4, 5]
+
+                    # Iterate through the indices in the controls menu options
+                    for index in scroll_indices:
+                        if self.selected_action_index == index:
+                            # If selected action index is 0
+                            if index == 0:
+                                # If index is 0, replace string in option (switch between player 1/player 2 options)
+                                self.controls_options[index] = self.replace_string_in_option(
+                                    self.controls_options[index], pg.K_RIGHT)
+                            # Else, scroll through controls option
+                            else:
+                                self.scroll_controls_option(index, pg.K_RIGHT)
 
                             # Play menu adjust soundeffect
                             self.game.audio.play_sfx('menu_adjust', volume=0.9)
 
-                    # Else, if in controls menu section
-                    elif self.in_controls:
-                        scroll_indices = [0, 1, 2, 3, 4, 5]
-
-                        # Iterate through the indices in the controls menu options
-                        for index in scroll_indices:
-                            if self.selected_action_index == index:
-                                # If selected action index is 0
-                                if index == 0:
-                                    # If index is 0, replace string in option (switch between player 1/player 2 options)
-                                    self.controls_options[index] = self.replace_string_in_option(
-                                        self.controls_options[index], pg.K_RIGHT)
-                                # Else, scroll through controls option
-                                else:
-                                    self.scroll_controls_option(index, pg.K_RIGHT)
-
-                                # Play menu adjust soundeffect
-                                self.game.audio.play_sfx('menu_adjust', volume=0.9)
-
-                # UP KEY
-                elif event.key == pg.K_UP:
-                    # If UP key is pressed, DEcrement action index by 1, wrap around to the end of list if necessary
-                    self.selected_action_index = (self.selected_action_index - 1) % len(options)
-                    self.game.audio.play_sfx('menu_nav', volume=0.3)  # Play menu navigaton soundeffect
-
-                # DOWN KEY
-                elif event.key == pg.K_DOWN:
-                    # If UP key is pressed, Increment action index by 1, wrap around to the end of list if necessary
-                    self.selected_action_index = (self.selected_action_index + 1) % len(options)
-                    self.game.audio.play_sfx('menu_nav', volume=0.3)  # Play menu navigaton soundeffect
+            # UP KEY
+            elif event.key == pg.K_UP:
+                # If UP key is pressed, DEcrement action index by 1, wrap around to the end of list if necessary
+                self.selected_action_index = (self.selected_action_index - 1) % len(options)
+                self.game.audio.play_sfx('menu_nav', volume=0.3)  # Play menu navigaton soundeffect
+
+            # DOWN KEY
+            elif event.key == pg.K_DOWN:
+                # If UP key is pressed, Increment action index by 1, wrap around to the end of list if necessary
+                self.selected_action_index = (self.selected_action_index + 1) % len(options)
+                self.game.audio.play_sfx('menu_nav', volume=0.3)  # Play menu navigaton soundeffect
 
     # This function handles the state of various flags and variables when the user switches to the main menu
     def switch_to_main_menu(self):
@@ -1084,6 +1127,7 @@ class Menu:
         self.game.game_mode_2player = False
         self.selected_action_index = 0
         self.game.audio.stop_all_sfx()
+        self.game.events.publish(MENU_OPENED)
 
     # This function handles the state of various flags and variables when the user switches to the settings menu
     def switch_to_settings(self):
@@ -1136,6 +1180,7 @@ class Menu:
         self.in_controls = False
         self.in_audio = False
         self.selected_action_index = 0
+        self.game.events.publish(MATCH_ENDED)
 
     # This function handles what happens when the user selects a particular index inside the main menu
     def main_menu_actions(self, i):
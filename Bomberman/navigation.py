@@ -0,0 +1,154 @@
+# Bomberman/navigation.py
+import heapq
+from collections import deque
+from settings import IMPASSABLE_CELLS
+
+# Offsets (row, column) of the adjacent cells a creep can step into: UP, DOWN, LEFT, RIGHT
+NEIGHBOUR_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class Navigation:
+    def __init__(self, game):
+        # REFERENCE
+        self.game = game  # Reference to the Game class to access its attributes & methods
+
+        # DISTANCE FIELDS (One breadth-first distance field per player over the cells creeps can pass through)
+        self.distance_fields = {}  # Dictionary that maps a player to the distance of every cell to its location
+        self.distance_field_states = {}  # Dictionary that maps a player to the (level version, location) of its field
+
+    # This function removes the distance fields of the previous game's players
+    def clear(self):
+        self.distance_fields.clear()
+        self.distance_field_states.clear()
+
+    # This function returns the distance field of a player, it is recomputed once the player moved to another cell
+    # and only repaired around the changed cells once the level matrix changed since it was last computed
+    def distance_field(self, player):
+        level = self.game.level
+        state = self.distance_field_states.get(player)
+        if state is None or state[1] != player.location:
+            self.distance_fields[player] = self.compute_distance_field(player.location)
+        elif state[0] != level.version:
+            changed_cells = level.changed_cells_since(state[0])
+            if changed_cells is None:
+                self.distance_fields[player] = self.compute_distance_field(player.location)
+            else:
+                self.repair_distance_field(self.distance_fields[player], player.location, changed_cells)
+        self.distance_field_states[player] = (level.version, player.location)
+        return self.distance_fields[player]
+
+    # This function computes the number of steps from every cell to the target cell with a breadth-first search
+    # Cells that can not reach the target cell (or can not be passed through) have a distance of None
+    def compute_distance_field(self, target_cell):
+        level_matrix = self.game.level.level_matrix
+        rows, cols = len(level_matrix), len(level_matrix[0])
+
+        distances = [[None] * cols for _ in range(rows)]
+        distances[target_cell[0]][target_cell[1]] = 0
+        queue = deque([target_cell])
+
+        # Expand the search from the target cell outwards, one step at a time
+        while queue:
+            row, col = queue.popleft()
+            next_distance = distances[row][col] + 1
+            for d_row, d_col in NEIGHBOUR_OFFSETS:
+                next_row, next_col = row + d_row, col + d_col
+                if 0 <= next_row < rows and 0 <= next_col < cols and distances[next_row][next_col] is None \
+                        and level_matrix[next_row][next_col] not in IMPASSABLE_CELLS:
+                    distances[next_row][next_col] = next_distance
+                    queue.append((next_row, next_col))
+
+        return distances
+
+    # This function updates a distance field to the changed cells of the level matrix, only the distances of the
+    # cells whose shortest path went through a blocked cell or that get closer through an opened cell are touched
+    def repair_distance_field(self, distances, target_cell, changed_cells):
+        level_matrix = self.game.level.level_matrix
+        rows, cols = len(level_matrix), len(level_matrix[0])
+
+        # A passable cell with a distance that became impassable is blocked, an impassable one that became passable is
+        # opened (the target cell always stays passable, players stand on their own bombs)
+        blocked_cells = []
+        opened_cells = []
+        for row, col in changed_cells:
+            if (row, col) == target_cell:
+                continue
+            if level_matrix[row][col] in IMPASSABLE_CELLS:
+                if distances[row][col] is not None:
+                    blocked_cells.append((row, col))
+            elif distances[row][col] is None:
+                opened_cells.append((row, col))
+
+        # Collect the cells that lost their shortest path: walking away from the blocked cells in the order of their
+        # distance, a cell one step further only keeps its distance if another unaffected neighbour supports it
+        affected_cells = set(blocked_cells)
+        heap = [(distances[row][col], (row, col)) for row, col in blocked_cells]
+        heapq.heapify(heap)
+        while heap:
+            distance, (row, col) = heapq.heappop(heap)
+            for d_row, d_col in NEIGHBOUR_OFFSETS:
+                next_row, next_col = row + d_row, col + d_col
+                if not (0 <= next_row < rows and 0 <= next_col < cols) or (next_row, next_col) in affected_cells \
+                        or distances[next_row][next_col] != distance + 1:
+                    continue
+                if not any(0 <= next_row + s_row < rows and 0 <= next_col + s_col < cols
+                           and distances[next_row + s_row][next_col + s_col] == distance
+                           and (next_row + s_row, next_col + s_col) not in affected_cells
+                           for s_row, s_col in NEIGHBOUR_OFFSETS):
+                    affected_cells.add((next_row, next_col))
+                    heapq.heappush(heap, (distance + 1, (next_row, next_col)))
+        for row, col in affected_cells:
+            distances[row][col] = None
+
+        # Give every affected and opened cell the distance through its closest neighbour, then spread the new distances
+        # outwards for as long as they shorten the distances of the cells they reach
+        heap = []
+        for row, col in affected_cells.union(opened_cells):
+            if level_matrix[row][col] in IMPASSABLE_CELLS:
+                continue
+            neighbour_distances = [distances[row + d_row][col + d_col] for d_row, d_col in NEIGHBOUR_OFFSETS
+                                   if 0 <= row + d_row < rows and 0 <= col + d_col < cols
+                                   and distances[row + d_row][col + d_col] is not None]
+            if neighbour_distances:
+                distances[row][col] = min(neighbour_distances) + 1
+                heap.append((distances[row][col], (row, col)))
+        heapq.heapify(heap)
+        while heap:
+            distance, (row, col) = heapq.heappop(heap)
+            if distances[row][col] != distance:
+                continue
+            for d_row, d_col in NEIGHBOUR_OFFSETS:
+                next_row, next_col = row + d_row, col + d_col
+                if 0 <= next_row < rows and 0 <= next_col < cols \
+                        and level_matrix[next_row][next_col] not in IMPASSABLE_CELLS \
+                        and (distances[next_row][next_col] is None or distances[next_row][next_col] > distance + 1):
+                    distances[next_row][next_col] = distance + 1
+                    heapq.heappush(heap, (distance + 1, (next_row, next_col)))
+
+    # This function returns the adjacent cell that brings a creep at the given cell one step closer to the closest
+    # living player it can reach, or None if no player can be reached
+    def next_step(self, cell):
+        row, col = cell
+        closest_distance = None
+        closest_distances = None
+
+        # Find the closest living player by reading the creep's cell inside every player's distance field
+        for player in self.game.players:
+            if player.hit_by_bomb_explosion or player.collided_with_creep:
+                continue
+            distances = self.distance_field(player)
+            distance = distances[row][col]
+            if distance is not None and (closest_distance is None or distance < closest_distance):
+                closest_distance = distance
+                closest_distances = distances
+
+        # The creep is either cut off from every player or already at a player's cell
+        if not closest_distance:
+            return None
+
+        # Step into the adjacent cell that is one step closer to the player
+        for d_row, d_col in NEIGHBOUR_OFFSETS:
+            next_row, next_col = row + d_row, col + d_col
+            if 0 <= next_row < len(closest_distances) and 0 <= next_col < len(closest_distances[0]) \
+                    and closest_distances[next_row][next_col] == closest_distance - 1:
+                return next_row, next_col
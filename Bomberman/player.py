@@ -1,6 +1,8 @@
 # Ilijablaster/player.py
 import pygame as pg
-from settings import TILE_SIZE, IMPASSABLE_CELLS, BG
+from settings import join, TILE_SIZE, IMPASSABLE_CELLS, BG, BASE_IMG_DIR, GREEN, BLUE
+from render_queue import LAYER_DEATH_SIGILS
+from event_bus import PLAYER_DIED, PLAYER_EXITED
 from bomb import Bomb
 
 vec2d = pg.math.Vector2
@@ -30,6 +32,7 @@ class Player:
         # CONTROL KEYS
         self.move_keys = move_keys  # Move Keys: List of keys used for player movement, defined during instantiation
         self.drop_bomb_key = drop_bomb_key  # Drop Bomb Key: Key used to drop bombs, defined during instantiation
+        self.input_bits = 0  # Input state of the current tick (bits 0-3: up, down, left, right, bit 4: drop bomb)
 
         # BOMB INTERACTION
         self.bombs = []  # List to store player's available bombs
@@ -57,28 +60,43 @@ class Player:
         self.death_animation_start_time = 0  # Timestamp for the start of the death animation
         self.death_animation_duration = 105  # Duration of the death animation in milliseconds
         self.start_death_animation = False  # Flag to indicate whether the player's death is currently in animation
+        self.death_animation_rows = 0  # Number of background colored rows drawn inside the player's death animation
 
         # UPDATE
-        self.stop_updating = False
+        self.stop_updating = False  # Flag set by the game once any player starts dying or leaving through the portal
 
     # This function handles the drawing of the player object and updates dynamically
     def draw(self):
+        screen_rect = self.game.camera.apply(self.rect)  # player's rect inside the camera's viewport
+
         # Check if the player has collided with the exit portal
         if self.collided_with_exit_portal:
-            self.exit_portal_animation()  # run exit portal animation
+            self.draw_exit_portal_animation(screen_rect)  # draw exit portal animation
 
         # Check if the player has collided with a creep (enemy) or has been hit by any of the bomb's explosions
         elif self.collided_with_creep or self.hit_by_bomb_explosion:
-            self.death_animation()  # run death animation
+            self.draw_death_animation(screen_rect)  # draw death animation
 
         # If no special animation is triggered, draw the rect that is representing the player normally
         else:
-            pg.draw.rect(self.game.window, self.color, self.rect)
-            pg.draw.rect(self.game.window, BG, self.rect, 1)  # draw a border (width=1) around the player's rect
+            pg.draw.rect(self.game.window, self.color, screen_rect)
+            pg.draw.rect(self.game.window, BG, screen_rect, 1)  # draw a border (width=1) around the player's rect
+
+        # Report the area of the player drawn on the game window
+        self.game.dirty_rects.append(screen_rect)
+
+    # This function converts the pressed keys into the input bits of the player's control keys
+    def read_input_bits(self, keys):
+        input_bits = 0
+        for i, key in enumerate(self.move_keys + [self.drop_bomb_key]):
+            if keys[key]:
+                input_bits |= 1 << i
+        return input_bits
 
     # This function handles the input keys from the user that are connected to controlling the player
     def input_keys(self):
-        keys = pg.key.get_pressed()  # retrieve the currently pressed keys
+        # The input bits of the current tick are set by the game (from the keyboard or from a replay)
+        drop_bomb_pressed = bool(self.input_bits & (1 << 4))
 
         # // *** MOVEMENT *** //
 
@@ -86,8 +104,8 @@ class Player:
         directions = [vec2d(0, -1), vec2d(0, 1), vec2d(-1, 0), vec2d(1, 0)]
 
         # Set the player's direction based on the pressed input keys, or keep direction (0, 0) if no key is pressed
-        input_direction = next((direction for key, direction in zip(self.move_keys, directions)
-                                if keys[key]), vec2d(0, 0))
+        input_direction = next((direction for i, direction in enumerate(directions)
+                                if self.input_bits & (1 << i)), vec2d(0, 0))
 
         # Handle the player movement logic when player is on ice tile
         if not self.on_ice_tile:
@@ -100,12 +118,12 @@ class Player:
         # // *** DROP BOMB *** //
 
         # Check if bomb inventory is greater than 0 and the drop bomb key is pressed, but bomb has not been dropped yet
-        if self.bomb_inventory > 0 and keys[self.drop_bomb_key] and not self.dropped_bomb:
+        if self.bomb_inventory > 0 and drop_bomb_pressed and not self.dropped_bomb:
             self.drop_bomb()
             self.dropped_bomb = True
 
         # If the drop bomb key is not pressed
-        elif not keys[self.drop_bomb_key]:
+        elif not drop_bomb_pressed:
             self.dropped_bomb = False
 
     # This function handles the movement (and movement restriction) logic for the player
@@ -218,34 +236,28 @@ class Player:
 
                     # If no player is colliding with the bomb, update the level matrix value to 6 ('6'=BOMB)
                     if not any_player_colliding:
-                        self.game.level.level_matrix[bomb_row][bomb_column] = 6
+                        self.game.level.set_cell_value(bomb_row, bomb_column, 6)
 
     # This function handles the bomb explosion collision logic
     def explosion_collision(self):
-        for player in self.game.players:
-
-            # Skip collision check if player has collided with a creep
-            if player.collided_with_creep:
-                continue
-
-            # Iterate through every bomb in the player's bomb inventory
-            for bomb in player.bombs:
-                # If the explosion portion of the bomb object is active
-                if bomb.explosion_active:
-                    explosion_rects = bomb.explosion()  # retrieve the explosion rects from the bomb
-                    for rect in explosion_rects:
-                        for target_player in self.game.players:
-                            if rect.colliderect(target_player.rect) and not target_player.hit_by_bomb_explosion:
-                                # Explosion rect colliding with player aftermath
-                                target_player.velocity = 0
-                                target_player.hit_by_bomb_explosion = True
-                                target_player.start_death_animation = True
-                                target_player.death_animation_start_time = pg.time.get_ticks()
-
-                                # Use target player variable to check which player got hit
-                                # print(f"{target_player.name} hit by {bomb.player.name}'s bomb blast!")
-
-                                self.game.audio.play_sfx('player_death', volume=0.2)
+        # Skip collision check if player has collided with a creep or has already been hit
+        if self.collided_with_creep or self.hit_by_bomb_explosion:
+            return
+
+        # Only the blast rects inside the cells covered by the player can hit the player (the game's blast mask
+        # combines the footprints of every active explosion)
+        blast_rects = self.game.detonations.blast_rects
+        for cell in self.game.player_index.entity_cells.get(self, ()):
+            blast_rect = blast_rects.get(cell)
+            if blast_rect is not None and blast_rect.colliderect(self.rect):
+                # Explosion rect colliding with player aftermath
+                self.velocity = 0
+                self.hit_by_bomb_explosion = True
+                self.start_death_animation = True
+                self.death_animation_start_time = self.game.game_clock.get_ticks()
+
+                self.game.events.publish(PLAYER_DIED, self)
+                return
 
     # This function handles the creep (enemy) collision logic
     def creep_collision(self):
@@ -262,7 +274,7 @@ class Player:
                      and not creep.is_blinking_before_death
                      and not creep.ignore_player_collision
                      and player.rect.collidepoint((creep.rect.centerx + x_offset, creep.rect.centery + y_offset)))
-                    for creep in self.game.creeps
+                    for creep in self.game.creep_index.query_rect(player.rect)  # only creeps covering player cells
                     for x_offset, y_offset in [(5, 0), (-5, 0), (0, 5), (0, -5)]
                 )
 
@@ -271,15 +283,16 @@ class Player:
                     player.collided_with_creep = True
                     player.checking_for_creep_collision = False
                     player.start_death_animation = True
-                    player.death_animation_start_time = pg.time.get_ticks()
+                    player.death_animation_start_time = self.game.game_clock.get_ticks()
 
-                    self.game.audio.play_sfx('player_death', volume=0.2)
+                    self.game.events.publish(PLAYER_DIED, player)
                     break
 
     # This function handles the ice tile collision logic
     def ice_tile_collision(self):
         # Check if the player's rect collides with an ice tile object, if it does, put the colliding ice tile in a list
-        colliding_ice_tiles = [ice_tile for ice_tile in self.game.ice_tiles if self.rect.colliderect(ice_tile.rect)]
+        colliding_ice_tiles = [ice_tile for ice_tile in self.game.ice_tile_index.query_rect(self.rect) if
+                               self.rect.colliderect(ice_tile.rect)]
 
         # If colliding with at least one ice tile, update player's state
         if colliding_ice_tiles:
@@ -354,8 +367,9 @@ class Player:
 
                     # Start the exit portal animation
                     self.start_exit_portal_animation = True
-                    self.exit_portal_animation_start_time = pg.time.get_ticks()
+                    self.exit_portal_animation_start_time = self.game.game_clock.get_ticks()
                     self.velocity = 0
+                    self.game.events.publish(PLAYER_EXITED, self)
 
             else:
                 if not any(player.rect.colliderect(self.game.exit_portal.rect) for player in self.game.players):
@@ -382,11 +396,11 @@ class Player:
             self.bomb_inventory -= 1  # reduce the bomb inventory after dropping bombs
 
             bomb_row, bomb_column = bomb.location
-            self.game.level.level_matrix[bomb_row][bomb_column] = 66
+            self.game.level.set_cell_value(bomb_row, bomb_column, 66)
 
     # This function handles how the player regains the bomb after dropping it
     def regain_bomb(self):
-        current_time = pg.time.get_ticks()
+        current_time = self.game.game_clock.get_ticks()
         regain_delay = 15
 
         # Use a list comprehension to filter bombs that need to be discarded
@@ -396,100 +410,114 @@ class Player:
         # Remove the discarded bombs and increment the bomb inventory
         for bomb in bombs_to_discard:
             self.bombs.remove(bomb)
+            self.game.render_queue.remove(bomb)
             self.bomb_inventory += 1
 
-    # This function handles the player's death animation
-    def death_animation(self):
-        # Iterate over each player in the game and check if the player's death animation should start
-        for player in self.game.players:
-            if player.start_death_animation:
-
-                # Determine the number of rows to draw based on elapsed time
-                current_time = pg.time.get_ticks()
-                elapsed_time = current_time - player.death_animation_start_time
-                num_rows = min(player.rect.height // 2, player.rect.width // 2)
-                rows_to_draw = min(num_rows, elapsed_time // player.death_animation_duration + 1)
-
-                # Draw the player's rect during the death animation with a border radius
-                if rows_to_draw < num_rows:
-                    pg.draw.rect(self.game.window, player.color, player.rect, border_radius=30)
-
-                # Draw another rect in background color inside the player during the death animation
-                middle_x = player.rect.x + player.rect.width // 2
-                middle_y = player.rect.y + player.rect.height // 2
-                for i in range(rows_to_draw):
-                    rect_size = 2 * i
-                    rect_offset = rect_size // 2
-                    rect = pg.Rect(middle_x - rect_offset, middle_y - rect_offset, rect_size, rect_size)
-                    pg.draw.rect(self.game.window, BG, rect, 1, border_radius=30)
-
-                # Stop the animation when all rows have been drawn
-                if rows_to_draw >= num_rows:
-                    # Transfer player information to the end game info dict
-                    player.game.player_end_info_dict[player.name] = {
-                        'color': player.color,
-                        'center_coords': player.rect.center,
-                        'collided_with_ep': player.collided_with_exit_portal,
-                        'collided_with_creep': player.collided_with_creep,
-                        'hit_by_bomb_explosion': player.hit_by_bomb_explosion,
-                    }
-
-                    # Stop the death animation, remove player, and switch to end game menu screen
-                    player.start_death_animation = False
-                    self.game.players.remove(player)
-                    self.game.menu.switch_to_end()
-                    break
-
-    # This function handles the player's exit portal animation
-    def exit_portal_animation(self):
-        # Iterate over each player in the game and check if the player's exit portal animation should start
-        for player in self.game.players:
-            if player.start_exit_portal_animation:
-
-                # Calculate the elapsed time since the start of the exit portal animaiton
-                current_time = pg.time.get_ticks()
-                elapsed_time = current_time - player.exit_portal_animation_start_time
-
-                # Draw the player's rect during the exit portal animation
-                pg.draw.rect(self.game.window, player.color, player.rect)
-
-                # Check if enough time has passed for the next animation step
-                if elapsed_time >= player.exit_portal_animation_duration:
-                    # Reset the animation start time for the next iteration
-                    player.exit_portal_animation_start_time = current_time
-
-                    # Shrink the original player rect to create the visual illusion of teleporting
-                    player.rect.inflate_ip(-2, -2)
-
-                    # Check if the width or height of the original rectangle is <= 0
-                    if player.rect.width <= 0 or player.rect.height <= 0:
-                        # Transfer player information to the end game info dict
-                        player.game.player_end_info_dict[player.name] = {
-                            'color': player.color,
-                            'center_coords': player.rect.center,
-                            'collided_with_ep': player.collided_with_exit_portal,
-                            'collided_with_creep': player.collided_with_creep,
-                            'hit_by_bomb_explosion': player.hit_by_bomb_explosion,
-                        }
-
-                        # Stop the exit portal animation, remove player, and switch to end game menu screen
-                        player.start_exit_portal_animation = False
-                        self.game.players.remove(player)
-                        self.game.menu.switch_to_end()
-                        break
-
-    # This function makes the player immobile and invunerabl when the game is effectively over
-    def make_immobile_and_invunerable_at_end_game(self):
-        if len(self.game.players) <= 2:
-            for player in self.game.players:
-                if player.start_death_animation or player.start_exit_portal_animation:
-                    self.stop_updating = True
+    # This function progresses the player's death animation based on the elapsed time
+    def update_death_animation(self):
+        # Determine the number of rows to draw based on elapsed time
+        elapsed_time = self.game.game_clock.get_ticks() - self.death_animation_start_time
+        num_rows = min(self.rect.height // 2, self.rect.width // 2)
+        self.death_animation_rows = min(num_rows, elapsed_time // self.death_animation_duration + 1)
+
+        # Stop the death animation and end the game for the player when all rows have been drawn
+        if self.death_animation_rows >= num_rows:
+            self.start_death_animation = False
+            self.remove_at_end_game()
+
+    # This function handles the drawing of the player's death animation
+    def draw_death_animation(self, screen_rect):
+        # Draw the player's rect during the death animation with a border radius
+        num_rows = min(screen_rect.height // 2, screen_rect.width // 2)
+        if self.death_animation_rows < num_rows:
+            pg.draw.rect(self.game.window, self.color, screen_rect, border_radius=30)
+
+        # Draw another rect in background color inside the player during the death animation
+        middle_x = screen_rect.x + screen_rect.width // 2
+        middle_y = screen_rect.y + screen_rect.height // 2
+        for i in range(self.death_animation_rows):
+            rect_size = 2 * i
+            rect_offset = rect_size // 2
+            rect = pg.Rect(middle_x - rect_offset, middle_y - rect_offset, rect_size, rect_size)
+            pg.draw.rect(self.game.window, BG, rect, 1, border_radius=30)
+
+    # This function progresses the player's exit portal animation based on the elapsed time
+    def update_exit_portal_animation(self):
+        # Calculate the elapsed time since the start of the exit portal animaiton
+        current_time = self.game.game_clock.get_ticks()
+        elapsed_time = current_time - self.exit_portal_animation_start_time
+
+        # Check if enough time has passed for the next animation step
+        if elapsed_time >= self.exit_portal_animation_duration:
+            # Reset the animation start time for the next iteration
+            self.exit_portal_animation_start_time = current_time
+
+            # Shrink the original player rect to create the visual illusion of teleporting
+            self.rect.inflate_ip(-2, -2)
+
+            # Stop the exit portal animation and end the game for the player when the rect has shrunk completely
+            if self.rect.width <= 0 or self.rect.height <= 0:
+                self.start_exit_portal_animation = False
+                self.remove_at_end_game()
+
+    # This function handles the drawing of the player's exit portal animation
+    def draw_exit_portal_animation(self, screen_rect):
+        pg.draw.rect(self.game.window, self.color, screen_rect)
+
+    # This function transfers the player's information to the end game info dict and removes the player from the game
+    def remove_at_end_game(self):
+        self.game.player_end_info_dict[self.name] = {
+            'color': self.color,
+            'center_coords': self.rect.center,
+            'collided_with_ep': self.collided_with_exit_portal,
+            'collided_with_creep': self.collided_with_creep,
+            'hit_by_bomb_explosion': self.hit_by_bomb_explosion,
+        }
+
+        # Leave a death sigil of the player's color where the player died
+        if self.collided_with_creep or self.hit_by_bomb_explosion:
+            self.game.render_queue.add(DeathSigil(self.game, self.color, self.rect.center), LAYER_DEATH_SIGILS)
+
+        # Remove player and switch to end game menu screen
+        self.game.players.remove(self)
+        self.game.player_index.remove(self)
+        self.game.render_queue.remove(self)
+        self.game.menu.switch_to_end()
 
     # This function handles dynamic updates for the player object
     def update(self):
         if not self.stop_updating:
             self.input_keys()
             self.movement()
+            self.game.player_index.move(self, self.rect)  # keep the player spatial index up to date
             self.collision()
             self.regain_bomb()
-            self.make_immobile_and_invunerable_at_end_game()
+
+        # Progress the exit portal or death animation (these keep running after the player has stopped updating)
+        if self.collided_with_exit_portal and self.start_exit_portal_animation:
+            self.update_exit_portal_animation()
+        elif self.start_death_animation:
+            self.update_death_animation()
+
+
+# Death sigil image paths mapped to the color of the player that died
+DEATH_SIGIL_IMAGE_PATHS = {
+    GREEN: join(BASE_IMG_DIR, 'death_sigils', 'death_sigil_green.png'),
+    BLUE: join(BASE_IMG_DIR, 'death_sigils', 'death_sigil_blue.png')
+}
+
+
+class DeathSigil:
+    def __init__(self, game, color, center_coords):
+        # REFERENCE
+        self.game = game  # Reference to Game class to access its attributes & methods
+
+        # IMAGE
+        self.image = self.game.assets.images[DEATH_SIGIL_IMAGE_PATHS[color]]  # Death sigil image of the player color
+
+        # HITBOX
+        self.rect = self.image.get_rect(center=center_coords)  # Death sigil rect centered where the player died
+
+    # This function draws the death sigil on the game window
+    def draw(self):
+        self.game.dirty_rects.append(self.game.window.blit(self.image, self.game.camera.apply(self.rect)))
@@ -1,6 +1,4 @@
 # Ilijablaster/powerup.py
-import random
-import pygame as pg
 from settings import join, TILE_SIZE, BASE_IMG_DIR
 
 
@@ -40,12 +38,10 @@ class PowerUp:
             if image_paths:
                 image_path = image_paths.get('default')
                 if image_path:
-                    image = pg.image.load(image_path)
-                    if image:
-                        self.image = pg.transform.smoothscale(image, (TILE_SIZE, TILE_SIZE)).convert_alpha()
-                        self.rect = self.image.get_rect()
+                    self.image = self.game.assets.images[image_path]
+                    self.rect = self.image.get_rect()
 
-    # This function renders the drawing of the powerup image and updates its rect position dynamically
+    # This function renders the drawing of the powerup image dynamically
     def draw(self):
         # Extract row and column positions from the powerup's location
         if self.location:
@@ -54,28 +50,24 @@ class PowerUp:
             image_paths = self.powerup_image_paths.get(self.image_path, {})  # Retrieve image paths
             # Check if the cell value is 10 (indicating a powerup) and image paths exist
             if cell_value == 10 and image_paths:
-                # Check for collision with ice tile and decide image path based on whether the powerup is on ice
-                on_ice_tile = any(self.rect.colliderect(ice_tile.rect) for ice_tile in self.game.ice_tiles)
+                # Check for an ice tile inside the powerup's cell and decide image path based on whether it is on ice
+                on_ice_tile = bool(self.game.ice_tile_index.query_cell(self.location))
                 image_path_key = 'on_ice' if on_ice_tile else 'default'
                 image_path = image_paths.get(image_path_key)
 
-                # Load and process the image if the image path is valid
+                # Retrieve the preloaded image if the image path is valid
                 if image_path:
-                    self.image = pg.image.load(image_path)
-                    self.image = pg.transform.smoothscale(self.image, (TILE_SIZE, TILE_SIZE)).convert_alpha()
+                    self.image = self.game.assets.images[image_path]
 
-                    # Update the position of the powerup's rect and display the image onto the game window
+                    # Display the image onto the game window at the powerup's position inside the camera's viewport
                     if self.image:
-                        self.rect.x = col * TILE_SIZE  # update rect x coordinate
-                        self.rect.y = row * TILE_SIZE  # update rect y coordinate
-                        self.game.window.blit(self.image, (col * TILE_SIZE, row * TILE_SIZE))
+                        self.game.dirty_rects.append(
+                            self.game.window.blit(self.image, self.game.camera.apply(self.rect)))
 
     # This function iterates through the cells inside the matrix level and selects a viable spawn cell for the powerup
     def select_viable_spawn_cell(self, available_powerups):
         # Define a list of all viable cells where powerups can spawn, represented by value 5, ('5'=BRITTLE))
-        viable_powerup_cells = [(row, col) for row in range(len(self.game.level.level_matrix)) for col in
-                                range(len(self.game.level.level_matrix[row]))
-                                if self.game.level.level_matrix[row][col] == 5]
+        viable_powerup_cells = self.game.level.find_cells({5})
 
         # Define a list of used cells for every powerup in available_powerups that's not itself and append its location
         used_powerup_cells = [powerup.location for powerup in available_powerups if powerup != self]
@@ -83,12 +75,13 @@ class PowerUp:
         # Check if there are available viable cells for spawning powerups
         if viable_powerup_cells:
             # Choose a random cell among all the valid cells that hasn't been used yet
-            chosen_powerup_cell = random.choice(
+            chosen_powerup_cell = self.game.rng.choice(
                 [cell for cell in viable_powerup_cells if cell not in used_powerup_cells])
 
             row, col = chosen_powerup_cell
-            self.game.level.level_matrix[row][col] = 9  # assign value 9 ('9'=POWERUP(BR))
+            self.game.level.set_cell_value(row, col, 9)  # assign value 9 ('9'=POWERUP(BR))
             self.location = chosen_powerup_cell  # save the selected cell's location information
+            self.rect.topleft = (col * TILE_SIZE, row * TILE_SIZE)  # update the powerup's rect position
 
             # FOR DEBUGGING /// Uncomment to check if assignment was successful
             # print(f"Assigned PowerUp: {self.image_path} to cell {chosen_powerup_cell}")
@@ -114,5 +107,6 @@ class PowerUp:
     def remove_from_game(self):
         # Remove powerup from map and set its row and column location to value 1 ('1'=PATH)
         row, col = self.location
-        self.game.level.level_matrix[row][col] = 1
+        self.game.level.set_cell_value(row, col, 1)
         self.game.powerups.remove(self)
+        self.game.render_queue.remove(self)
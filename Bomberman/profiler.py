@@ -0,0 +1,154 @@
+# Bomberman/profiler.py
+import csv
+import time
+from time import perf_counter
+from collections import deque
+import pygame as pg
+from settings import FPS, WHITE, GREEN, RED, GREY, PROFILER_BUFFER_FRAMES, PROFILER_AVERAGE_FRAMES, \
+    PROFILER_OVERLAY_REFRESH_FRAMES
+
+# Overlay layout (in pixels)
+OVERLAY_WIDTH = 320
+OVERLAY_GRAPH_HEIGHT = 64
+OVERLAY_LINE_HEIGHT = 16
+OVERLAY_MARGIN = 8
+
+
+class FrameProfiler:
+    def __init__(self, game):
+        # REFERENCE
+        self.game = game  # Reference to the Game class to access its attributes & methods
+
+        # STATE
+        self.enabled = False  # Flag used to indicate if frames are profiled (the overlay is displayed while they are)
+
+        # CURRENT FRAME (Each phase is timed from the end of the previous phase, like the laps of a stopwatch)
+        self.frame_start_time = 0  # Time (perf counter, in seconds) at which the current frame started
+        self.lap_start_time = 0  # Time (perf counter, in seconds) at which the current phase started
+        self.phase_times = {}  # Dictionary that maps the phases of the current frame to their duration in ms
+
+        # RING BUFFER
+        self.frames = deque(maxlen=PROFILER_BUFFER_FRAMES)  # (frame time in ms, phase times, entity counts) per frame
+        self.phases = []  # List of every phase profiled so far, in the order they were first seen
+
+        # OVERLAY
+        self.overlay_surface = None  # Surface of the overlay, redrawn every few frames
+        self.frames_since_overlay_refresh = 0  # Number of profiled frames since the overlay was last redrawn
+        self.last_export_path = None  # Path of the last CSV export (displayed on the overlay)
+
+    # This function turns the profiler on (with an empty ring buffer) or off, a frame that is already running when
+    # the profiler is turned on gets timed from that moment on
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frames.clear()
+        self.overlay_surface = None
+        self.frame_start_time = self.lap_start_time = perf_counter()
+        self.phase_times = {}
+        self.game.previous_scene = None  # redraw the whole display, so the area below the overlay gets restored
+
+    # This function starts timing a new frame
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame_start_time = self.lap_start_time = perf_counter()
+        self.phase_times = {}
+
+    # This function adds the time since the previous lap to the duration of a phase of the current frame
+    def lap(self, phase):
+        if not self.enabled:
+            return
+        lap_end_time = perf_counter()
+        if phase not in self.phase_times and phase not in self.phases:
+            self.phases.append(phase)
+        self.phase_times[phase] = self.phase_times.get(phase, 0) + (lap_end_time - self.lap_start_time) * 1000
+        self.lap_start_time = lap_end_time
+
+    # This function stores the timings and entity counts of the current frame inside the ring buffer
+    def end_frame(self):
+        if not self.enabled:
+            return
+        frame_time = (perf_counter() - self.frame_start_time) * 1000
+        self.frames.append((frame_time, self.phase_times, self.entity_counts()))
+
+    # This function counts the game objects of every entity type
+    def entity_counts(self):
+        return {
+            'players': len(self.game.players),
+            'creeps': len(self.game.creeps),
+            'bombs': sum(len(player.bombs) for player in self.game.players),
+            'ice_tiles': len(self.game.ice_tiles),
+            'powerups': len(self.game.powerups)
+        }
+
+    # This function displays the overlay on the game window and returns the area it covers (None if disabled)
+    def draw(self):
+        if not self.enabled or not self.frames:
+            return None
+
+        # Redraw the overlay only every few frames, the text rendering would otherwise dominate the profiled frames
+        self.frames_since_overlay_refresh += 1
+        if self.overlay_surface is None or self.frames_since_overlay_refresh >= PROFILER_OVERLAY_REFRESH_FRAMES:
+            self.overlay_surface = self.render_overlay()
+            self.frames_since_overlay_refresh = 0
+
+        return self.game.window.blit(self.overlay_surface, (0, 0))
+
+    # This function renders the frame time graph, the average time of every phase and the entity counts
+    def render_overlay(self):
+        font = self.game.assets.fonts['profiler']
+        recent_frames = list(self.frames)[-PROFILER_AVERAGE_FRAMES:]
+        frame_times = [frame_time for frame_time, _, _ in recent_frames]
+        busy_times = [frame_time - phase_times.get('idle', 0) for frame_time, phase_times, _ in recent_frames]
+
+        # Average every phase over the recent frames, slowest phases first
+        phase_averages = {phase: sum(phase_times.get(phase, 0) for _, phase_times, _ in recent_frames)
+                          / len(recent_frames) for phase in self.phases}
+
+        # Each line has a left aligned and a right aligned text
+        lines = [('frame (avg / max)', f"{sum(frame_times) / len(frame_times):.2f} / {max(frame_times):.2f} ms"),
+                 ('busy (avg / max)', f"{sum(busy_times) / len(busy_times):.2f} / {max(busy_times):.2f} ms")]
+        lines += [(phase, f"{average:.3f} ms") for phase, average in
+                  sorted(phase_averages.items(), key=lambda item: item[1], reverse=True)]
+        lines += [(name, str(count)) for name, count in recent_frames[-1][2].items()]
+        lines += [('F3 hide, F4 export CSV', self.last_export_path or '')]
+
+        overlay_height = OVERLAY_GRAPH_HEIGHT + len(lines) * OVERLAY_LINE_HEIGHT + 3 * OVERLAY_MARGIN
+        overlay_surface = pg.Surface((OVERLAY_WIDTH, overlay_height), pg.SRCALPHA)
+        overlay_surface.fill((0, 0, 0, 200))
+
+        # Draw the rolling graph of the busy frame times (without waiting for the next frame), one bar per frame,
+        # frames that took longer than the frame budget are red
+        frame_budget = 1000 / FPS
+        graph_rect = pg.Rect(OVERLAY_MARGIN, OVERLAY_MARGIN, OVERLAY_WIDTH - 2 * OVERLAY_MARGIN, OVERLAY_GRAPH_HEIGHT)
+        graph_scale = graph_rect.height / (2 * frame_budget)  # the graph shows frame times up to twice the budget
+        for x, busy_time in enumerate(busy_times[-graph_rect.width:]):
+            bar_height = min(graph_rect.height, round(busy_time * graph_scale))
+            pg.draw.line(overlay_surface, RED if busy_time > frame_budget else GREEN, (graph_rect.left + x,
+                         graph_rect.bottom - 1), (graph_rect.left + x, graph_rect.bottom - bar_height))
+        budget_y = graph_rect.bottom - round(frame_budget * graph_scale)
+        pg.draw.line(overlay_surface, GREY, (graph_rect.left, budget_y), (graph_rect.right - 1, budget_y))
+
+        # Draw the text lines below the graph
+        for i, (left_text, right_text) in enumerate(lines):
+            y = graph_rect.bottom + OVERLAY_MARGIN + i * OVERLAY_LINE_HEIGHT
+            overlay_surface.blit(font.render(left_text, True, WHITE), (graph_rect.left, y))
+            right_surface = font.render(right_text, True, WHITE)
+            overlay_surface.blit(right_surface, right_surface.get_rect(topright=(graph_rect.right, y)))
+
+        return overlay_surface.convert_alpha()
+
+    # This function exports every frame inside the ring buffer to a CSV file and returns the path of the file
+    def export_csv(self, path=None):
+        path = path or f"frame_profile_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+        count_names = list(self.frames[0][2]) if self.frames else []
+
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['frame', 'frame_ms'] + [f"{phase}_ms" for phase in self.phases] + count_names)
+            for i, (frame_time, phase_times, counts) in enumerate(self.frames):
+                writer.writerow([i, f"{frame_time:.4f}"]
+                                + [f"{phase_times.get(phase, 0):.4f}" for phase in self.phases]
+                                + [counts[name] for name in count_names])
+
+        self.last_export_path = path
+        return path
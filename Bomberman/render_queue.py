@@ -0,0 +1,65 @@
+# Bomberman/render_queue.py
+
+# Draw layers of the game objects, lower layers are drawn first (below the higher layers)
+LAYER_ICE_TILES = 0
+LAYER_EXIT_PORTAL = 1
+LAYER_DEATH_SIGILS = 2
+LAYER_POWERUPS = 3
+LAYER_PLAYERS = 4
+LAYER_IMMUNE_CREEPS = 5  # Transmutated yellow creeps are drawn below the bombs, so their bombs stay visible
+LAYER_BOMBS = 6
+LAYER_CREEPS = 7
+
+# Names of the layers (reported by the frame profiler)
+LAYER_NAMES = ('draw.ice_tiles', 'draw.exit_portal', 'draw.death_sigils', 'draw.powerups', 'draw.players',
+               'draw.immune_creeps', 'draw.bombs', 'draw.creeps')
+
+# Layers whose game objects are drawn even outside of the camera's viewport (explosions spread beyond the bomb's rect)
+UNCULLED_LAYERS = {LAYER_BOMBS}
+
+
+class RenderQueue:
+    def __init__(self, game):
+        # REFERENCE
+        self.game = game  # Reference to the Game class to access its attributes & methods
+
+        # LAYERS (Game objects are stored as dictionary keys, so they are drawn in the order they were added)
+        self.layers = [{} for _ in LAYER_NAMES]  # List of the game objects inside every layer
+        self.entity_layers = {}  # Dictionary that maps a game object to the layer it is drawn on
+
+    # This function adds a game object to a layer of the render queue
+    def add(self, entity, layer):
+        self.layers[layer][entity] = None
+        self.entity_layers[entity] = layer
+
+    # This function removes a game object from the render queue
+    def remove(self, entity):
+        layer = self.entity_layers.pop(entity, None)
+        if layer is not None:
+            del self.layers[layer][entity]
+
+    # This function moves a game object onto another layer (drawn on top of the game objects already on that layer)
+    def change_layer(self, entity, layer):
+        if self.entity_layers.get(entity, layer) != layer:
+            self.remove(entity)
+            self.add(entity, layer)
+
+    # This function removes every game object from the render queue
+    def clear(self):
+        for entities in self.layers:
+            entities.clear()
+        self.entity_layers.clear()
+
+    # This function draws the game objects layer by layer in one ordered pass, skipping the game objects outside of
+    # the camera's viewport
+    def draw(self):
+        is_visible = self.game.camera.is_visible
+        for layer, entities in enumerate(self.layers):
+            if layer in UNCULLED_LAYERS:
+                for entity in entities:
+                    entity.draw()
+            else:
+                for entity in entities:
+                    if is_visible(entity.rect):
+                        entity.draw()
+            self.game.profiler.lap(LAYER_NAMES[layer])
@@ -0,0 +1,41 @@
+# Bomberman/render_utils.py
+from collections import OrderedDict
+import pygame as pg
+
+
+def merge_rects(rects):
+    merged_rects = []
+
+    for rect in rects:
+        rect = pg.Rect(rect)
+
+        # Absorb every already merged rect that overlaps with the current rect
+        overlapping_index = rect.collidelist(merged_rects)
+        while overlapping_index != -1:
+            rect.union_ip(merged_rects.pop(overlapping_index))
+            overlapping_index = rect.collidelist(merged_rects)
+
+        merged_rects.append(rect)
+
+    return merged_rects
+
+
+class TextCache:
+    def __init__(self, max_size):
+        # CACHE
+        self.max_size = max_size  # Maximum number of text surfaces kept inside the cache
+        self.surfaces = OrderedDict()  # Rendered text surfaces mapped to their (font, text, color), oldest used first
+
+    # This function returns the surface of a text rendered (antialiased) in a font and color, the text is only
+    # rendered the first time it is requested, the least recently used surface is dropped once the cache is full
+    def render(self, font, text, color):
+        key = (font, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
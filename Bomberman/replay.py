@@ -0,0 +1,141 @@
+# Bomberman/replay.py
+import json
+import struct
+import zlib
+
+# REPLAY FILE FORMAT
+# Header: magic bytes, format version, RNG seed, number of ticks and the length of the settings
+# Settings: UTF-8 encoded JSON of the game mode, custom menu options and level size/seed of the match
+# Ticks: zlib compressed records of the game time since the previous tick (ms) and the input bits of every player
+REPLAY_MAGIC = b'IBRP'
+REPLAY_VERSION = 1
+HEADER_FORMAT = '<4sBIIH'
+TICK_FORMAT = '<IH'
+
+# The input bits of each player are packed next to each other in the order of the player names
+PLAYER_NAMES = ('Player 1', 'Player 2')
+INPUT_BITS_PER_PLAYER = 5
+
+
+class MatchRecorder:
+    def __init__(self, path):
+        # FILE
+        self.path = path  # Path of the replay file the recorded match is saved to
+
+        # MATCH
+        self.seed = None  # RNG seed the recorded match was started with
+        self.settings = None  # Dictionary of the settings the recorded match was started with
+        self.recording = False  # Flag used to indicate if a match is currently being recorded
+
+        # TICKS
+        self.ticks = bytearray()  # Packed tick records of the recorded match
+        self.tick_count = 0  # Number of recorded ticks
+        self.start_time = 0  # Game time in ms at which the recorded match started
+        self.previous_time = 0  # Game time in ms (since the start of the match) of the previously recorded tick
+
+    # This function starts recording a new match
+    def start(self, game):
+        self.seed = game.rng_seed
+        self.settings = {
+            'game_mode_2player': game.game_mode_2player,
+            'custom_options': list(game.menu.custom_options),
+            'level_size': game.level_size,
+            'level_seed': game.level_seed
+        }
+        self.ticks = bytearray()
+        self.tick_count = 0
+        self.start_time = game.game_clock.get_ticks()
+        self.previous_time = 0
+        self.recording = True
+
+    # This function records the game time and the input bits of every player for the current game tick
+    def record_tick(self, game):
+        if not self.recording:
+            return
+
+        tick_time = game.game_clock.get_ticks() - self.start_time
+        input_bits = 0
+        for player in game.players:
+            input_bits |= player.input_bits << (PLAYER_NAMES.index(player.name) * INPUT_BITS_PER_PLAYER)
+
+        self.ticks += struct.pack(TICK_FORMAT, tick_time - self.previous_time, input_bits)
+        self.tick_count += 1
+        self.previous_time = tick_time
+
+    # This function stops recording and saves the recorded match to the replay file
+    def finish(self):
+        if not self.recording:
+            return
+        self.recording = False
+
+        settings = json.dumps(self.settings).encode('utf-8')
+        with open(self.path, 'wb') as file:
+            file.write(struct.pack(HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.tick_count,
+                                   len(settings)))
+            file.write(settings)
+            file.write(zlib.compress(bytes(self.ticks)))
+
+
+class MatchReplay:
+    def __init__(self, seed, settings, ticks):
+        # MATCH
+        self.seed = seed  # RNG seed the recorded match was started with
+        self.settings = settings  # Dictionary of the settings the recorded match was started with
+
+        # TICKS
+        self.ticks = ticks  # List of (game time since the start of the match, input bits) of every recorded tick
+        self.tick_index = 0  # Index of the next tick to replay
+        self.time_offset = 0  # Virtual time in ms at which the replayed match starts
+
+    # This function loads a replay from a replay file
+    @staticmethod
+    def load(path):
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        # Read and validate the header
+        header_size = struct.calcsize(HEADER_FORMAT)
+        magic, version, seed, tick_count, settings_length = struct.unpack_from(HEADER_FORMAT, data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a version {REPLAY_VERSION} replay file")
+
+        # Read the settings and unpack the ticks, turning the time deltas back into game times
+        settings = json.loads(data[header_size:header_size + settings_length].decode('utf-8'))
+        ticks = []
+        tick_time = 0
+        for time_delta, input_bits in struct.iter_unpack(TICK_FORMAT,
+                                                         zlib.decompress(data[header_size + settings_length:])):
+            tick_time += time_delta
+            ticks.append((tick_time, input_bits))
+
+        if len(ticks) != tick_count:
+            raise ValueError(f"{path} is truncated, expected {tick_count} ticks but found {len(ticks)}")
+
+        # Return the loaded replay
+        return MatchReplay(seed, settings, ticks)
+
+    # This function checks if every recorded tick has been replayed
+    def finished(self):
+        return self.tick_index >= len(self.ticks)
+
+    # This function starts the recorded match with its settings, seed and a virtual game time
+    def start(self, game):
+        game.menu.custom_options = self.settings['custom_options']
+
+        # The game time of the replay is set by the recorded ticks (it starts at zero, like the recording)
+        game.game_clock.resume()
+        game.game_clock.set_virtual_time(game.game_clock.paused_duration)
+        self.time_offset = game.game_clock.paused_duration
+        self.tick_index = 0
+
+        game.start_match(self.settings['game_mode_2player'], seed=self.seed)
+
+    # This function sets the game time and the input bits of every player to the ones of the next recorded tick
+    def apply_next_tick(self, game):
+        tick_time, input_bits = self.ticks[self.tick_index]
+        self.tick_index += 1
+
+        game.game_clock.set_virtual_time(self.time_offset + tick_time)
+        mask = (1 << INPUT_BITS_PER_PLAYER) - 1
+        for player in game.players:
+            player.input_bits = (input_bits >> (PLAYER_NAMES.index(player.name) * INPUT_BITS_PER_PLAYER)) & mask
@@ -1,5 +1,5 @@
 # Ilijablaster/settings.py
-from os.path import join as join
+from os.path import join as join, dirname, abspath
 
 # Window resolution
 WINDOW_SIZE = (1392, 624)
@@ -7,11 +7,48 @@ WINDOW_SIZE = (1392, 624)
 # Display framerate
 FPS = 120
 
-# Dir paths
-BASE_IMG_DIR = join('assets', 'images')
-BASE_FONT_DIR = join('assets', 'fonts')
-BASE_ICON_DIR = join('assets', 'icon')
-BASE_AUDIO_DIR = join('audio')
+# Display updates (only the areas drawn during gameplay get updated, menu, pause and end screens always flip)
+DIRTY_RECT_RENDERING = True
+
+# Headless mode (the game is advanced by a fixed virtual timestep in milliseconds, up to a maximum number of steps)
+HEADLESS_TIMESTEP = 1000 / FPS
+HEADLESS_MAX_STEPS = 60 * 60 * FPS
+
+# Level size (None plays the hard-coded level layout, otherwise a level of (rows, columns) is generated from the seed)
+LEVEL_SIZE = None
+LEVEL_SEED = None
+LEVEL_CHUNK_SIZE = 16  # Number of rows and columns of tiles rendered together on one level chunk surface
+
+# Benchmarks (frames simulated per scenario, relative slowdown that counts as a regression and the smallest slowdown
+# in milliseconds worth reporting, anything below it is measurement noise)
+BENCHMARK_FRAMES = 600
+BENCHMARK_REGRESSION_THRESHOLD = 0.25
+BENCHMARK_MIN_REGRESSION_MS = 0.05
+
+# Frame profiler (frames kept inside its ring buffer, frames averaged on its overlay and frames between two redraws
+# of the overlay)
+PROFILER_BUFFER_FRAMES = 10 * FPS
+PROFILER_AVERAGE_FRAMES = FPS
+PROFILER_OVERLAY_REFRESH_FRAMES = FPS // 8
+
+# Asset loading (number of threads decoding the images and soundeffects in parallel at startup)
+ASSET_LOADER_THREADS = 4
+
+# Menu text cache (number of rendered text surfaces kept, the least recently used surface is dropped first)
+MENU_TEXT_CACHE_SIZE = 128
+
+# Creep pool (from this many creeps on, their movement state is stored in arrays and advanced in batches)
+CREEP_POOL_MIN_CREEPS = 32
+
+# Dir paths (built from the game's directory, so the game can be run from any working directory)
+GAME_DIR = dirname(abspath(__file__))
+BASE_IMG_DIR = join(GAME_DIR, 'assets', 'images')
+BASE_FONT_DIR = join(GAME_DIR, 'assets', 'fonts')
+BASE_ICON_DIR = join(GAME_DIR, 'assets', 'icon')
+BASE_AUDIO_DIR = join(GAME_DIR, 'audio')
+
+# Directory holding every game, the asset pack reader shared by them (asset_pack.py) and the pack it builds
+SHARED_DIR = dirname(GAME_DIR)
 
 # Grid
 TILE_SIZE = 48
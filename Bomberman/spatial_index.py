@@ -0,0 +1,76 @@
+# Bomberman/spatial_index.py
+from settings import TILE_SIZE
+
+
+class SpatialIndex:
+    def __init__(self):
+        # GRID (Every entity is stored inside each level cell (row, column) its rect covers)
+        # Entities are stored as dictionary keys (instead of sets) so queries return them in a deterministic order
+        self.cells = {}  # Dictionary that maps a cell to a dictionary of the entities covering that cell
+        self.entity_cells = {}  # Dictionary that maps an entity to the tuple of cells it currently covers
+
+    # This function returns the cells (row, column) covered by a rect
+    @staticmethod
+    def cells_covered_by_rect(rect):
+        return tuple((row, col)
+                     for row in range(rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE + 1)
+                     for col in range(rect.left // TILE_SIZE, (rect.right - 1) // TILE_SIZE + 1))
+
+    # This function inserts an entity into the index or moves it, the grid only changes when it crosses a cell boundary
+    def move(self, entity, rect):
+        covered_cells = self.cells_covered_by_rect(rect)
+        previous_cells = self.entity_cells.get(entity)
+
+        # If the entity still covers the same cells, there is nothing to update
+        if covered_cells == previous_cells:
+            return
+
+        # Remove the entity from the cells it no longer covers and add it to the cells it now covers
+        if previous_cells is not None:
+            self.discard_from_cells(entity, previous_cells)
+        for cell in covered_cells:
+            self.cells.setdefault(cell, {})[entity] = None
+        self.entity_cells[entity] = covered_cells
+
+    # The entity is inserted the same way it is moved
+    insert = move
+
+    # This function removes an entity from the index
+    def remove(self, entity):
+        previous_cells = self.entity_cells.pop(entity, None)
+        if previous_cells is not None:
+            self.discard_from_cells(entity, previous_cells)
+
+    # This function discards an entity from the given cells and drops the cells that are left empty
+    def discard_from_cells(self, entity, cells):
+        for cell in cells:
+            entities = self.cells.get(cell)
+            if entities is not None:
+                entities.pop(entity, None)
+                if not entities:
+                    del self.cells[cell]
+
+    # This function removes every entity from the index
+    def clear(self):
+        self.cells.clear()
+        self.entity_cells.clear()
+
+    # This function returns a list of the entities covering a cell
+    def query_cell(self, cell):
+        return list(self.cells.get(cell, ()))
+
+    # This function returns a list of the entities covering any of the cells covered by a rect (without duplicates)
+    def query_rect(self, rect):
+        entities = {}
+        for cell in self.cells_covered_by_rect(rect):
+            entities.update(self.cells.get(cell, {}))
+        return list(entities)
+
+    # This function returns a list of the entities covering the cells within the radius around a cell
+    def query_neighbourhood(self, cell, radius=1):
+        row, col = cell
+        entities = {}
+        for d_row in range(-radius, radius + 1):
+            for d_col in range(-radius, radius + 1):
+                entities.update(self.cells.get((row + d_row, col + d_col), {}))
+        return list(entities)
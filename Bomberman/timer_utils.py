@@ -1,52 +1,49 @@
 # Bomberman/timer_utils.py
-
-def adjust_bomb_timer(start_time, duration, init_timer, on_expire_action):
-    current_time = init_timer
-
-    time_until_completion = (start_time + duration) - current_time
-
-    if time_until_completion <= 0 and on_expire_action is not None:
-        on_expire_action()
-
-    return time_until_completion
-
-
-def adjust_ice_tile_remove_timer(timers_dict, init_timer, duration, start_time, new_duration=None, new_start_time=None,
-                                 on_expire_action=None):
-    current_time = init_timer
-
-    if new_duration is not None:
-        start_time = new_start_time or current_time
-        duration = new_duration
-
-    elapsed_time = current_time - start_time
-    remaining_time_at_pause = duration - elapsed_time
-    timers_dict['remaining_time_at_pause'] = remaining_time_at_pause
-
-    if remaining_time_at_pause <= 0 and on_expire_action is not None:
-        on_expire_action()
-
-
-def adjust_ice_tile_spawn_timer(start_time, duration, init_timer, on_expire_action):
-    current_time = init_timer
-
-    if current_time - start_time >= duration and on_expire_action is not None:
-        on_expire_action()
-
-        start_time = current_time
-
-    return start_time
-
-
-def update_start_time(timer_dict, current_time, paused_time, start_time_key):
-    timer_dict[start_time_key] += current_time - paused_time
-
-
-def update_timer_data_on_pause(timers_dict, paused):
-    if paused:
-        timers_dict['new_duration'] = timers_dict['remaining_time_at_pause']
-
-
-def update_timer_data_on_resume(timers_dict, init_timer, resumed):
-    if resumed:
-        timers_dict['new_start_time'] = init_timer
+import heapq
+
+
+class Timer:
+    def __init__(self, deadline, callback):
+        # TIMER
+        self.deadline = deadline  # Game time in ms at which the timer expires
+        self.callback = callback  # Function that gets called when the timer expires
+        self.cancelled = False  # Flag used to skip the callback of a cancelled timer when its deadline passes
+
+
+class TimerScheduler:
+    def __init__(self, game_clock):
+        # REFERENCE
+        self.game_clock = game_clock  # Reference to the GameClock class that every deadline is measured against
+
+        # HEAP
+        self.heap = []  # Min-heap of (deadline, order, timer) entries, the earliest deadline is always at index 0
+        self.order = 0  # Counter used to keep timers with equal deadlines in the order they were scheduled
+
+    # This function schedules a callback to be called once the duration (in ms) has passed and returns its timer
+    def schedule(self, duration, callback):
+        timer = Timer(self.game_clock.get_ticks() + duration, callback)
+        heapq.heappush(self.heap, (timer.deadline, self.order, timer))
+        self.order += 1
+        return timer
+
+    # This function cancels a timer (it stays inside the heap and is discarded once its deadline passes)
+    @staticmethod
+    def cancel(timer):
+        if timer is not None:
+            timer.cancelled = True
+
+    # This function returns the time in ms until the timer expires (negative once the deadline has passed)
+    def time_remaining(self, timer):
+        return timer.deadline - self.game_clock.get_ticks()
+
+    # This function removes every scheduled timer
+    def clear(self):
+        self.heap.clear()
+
+    # This function calls the callbacks of every timer whose deadline has passed, in order of their deadlines
+    def update(self):
+        current_time = self.game_clock.get_ticks()
+        while self.heap and self.heap[0][0] <= current_time:
+            timer = heapq.heappop(self.heap)[2]
+            if not timer.cancelled:
+                timer.callback()
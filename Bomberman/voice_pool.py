@@ -0,0 +1,82 @@
+# Bomberman/voice_pool.py
+
+# Voice limits of every soundeffect as (priority, maximum concurrent instances, minimum time in ms between two starts)
+# A soundeffect can only steal the channel of a soundeffect with the same or a lower priority
+SFX_VOICE_LIMITS = {
+    'menu_nav': (2, 1, 0),
+    'menu_confirm': (2, 1, 0),
+    'menu_adjust': (2, 1, 0),
+    'end_game_victory': (3, 1, 0),
+    'end_game_defeat': (3, 1, 0),
+    'pause_game': (3, 1, 0),
+    'exit_portal_reveal': (2, 1, 0),
+    'powerup_reveal': (2, 2, 0),
+    'powerup_pickup': (2, 2, 0),
+    'bomb_countdown_tick': (0, 2, 60),
+    'bomb_explosion': (1, 3, 50),
+    'player_death': (3, 2, 0)
+}
+DEFAULT_SFX_VOICE_LIMITS = (1, 2, 0)
+
+
+class VoicePool:
+    def __init__(self, channels):
+        # CHANNELS
+        self.channels = channels  # List of the mixer channels reserved for the soundeffects
+        self.voices = [None] * len(channels)  # (effect name, priority, start time) of the last voice of each channel
+
+        # RATE LIMITING
+        self.last_start_times = {}  # Dictionary that maps an effect name to the time its last voice was started
+
+    # This function plays a sound on a reserved channel and returns that channel (None if the sound was dropped)
+    # A sound is dropped when its effect was started too recently or when every channel plays a voice of a higher
+    # priority, the oldest instance of the same effect (or the oldest voice of the lowest priority) is stolen otherwise
+    def play(self, effect_name, sound, volume, current_time):
+        priority, max_instances, min_interval = SFX_VOICE_LIMITS.get(effect_name, DEFAULT_SFX_VOICE_LIMITS)
+
+        last_start_time = self.last_start_times.get(effect_name)
+        if last_start_time is not None and current_time - last_start_time < min_interval:
+            return None
+
+        index = self.select_channel(effect_name, priority, max_instances)
+        if index is None:
+            return None
+
+        channel = self.channels[index]
+        channel.set_volume(volume)
+        channel.play(sound)
+        self.voices[index] = (effect_name, priority, current_time)
+        self.last_start_times[effect_name] = current_time
+        return channel
+
+    # This function returns the index of the channel a new voice of an effect is played on (None if none can be used)
+    def select_channel(self, effect_name, priority, max_instances):
+        free_index = None
+        instances = []  # (start time, channel index) of the playing voices of the same effect
+        stealable = []  # (priority, start time, channel index) of the playing voices that can be stolen
+
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                free_index = index if free_index is None else free_index
+                continue
+            voice_name, voice_priority, start_time = self.voices[index]
+            if voice_name == effect_name:
+                instances.append((start_time, index))
+            if voice_priority <= priority:
+                stealable.append((voice_priority, start_time, index))
+
+        # Restart the oldest instance once the effect plays its maximum number of instances
+        if len(instances) >= max_instances:
+            return min(instances)[1]
+
+        if free_index is not None:
+            return free_index
+
+        # Steal the oldest voice with the lowest priority
+        return min(stealable)[2] if stealable else None
+
+    # This function stops every voice
+    def stop_all(self):
+        for channel in self.channels:
+            channel.stop()
+        self.voices = [None] * len(self.channels)
@@ -0,0 +1,21 @@
+# Pong/asset_files.py
+import os
+import sys
+
+# Directory of the game (asset paths are relative to it)
+game_dir = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.append(os.path.dirname(game_dir))  # the asset pack reader shared by every game is stored next to the game dirs
+from asset_pack import open_asset_pack
+
+asset_pack = open_asset_pack()  # memory-map the shared asset pack once (None if it has not been built)
+
+
+def open_asset(path):
+    # Return a file-like view of an asset (path relative to the game directory) inside the shared asset pack, or the
+    # asset's absolute file path if it is not packed (both can be passed to pygame's loaders)
+    asset_path = os.path.join(game_dir, path)
+    if asset_pack is not None and asset_path in asset_pack:
+        return asset_pack.open(asset_path)
+
+    return asset_path
@@ -1,5 +1,6 @@
 # Pong/font.py
 from setup import pg, setup_pygame
+from asset_files import open_asset
 
 setup_pygame()  # initialize pygame module to access pg.font.Font
 
@@ -9,6 +10,6 @@ score_font = "font/Score.ttf"
 countdown321_font = "font/Countdown321.ttf"
 
 # texts
-menu_txt = pg.font.Font(menu_font, 22)
-score_txt = pg.font.Font(score_font, 36)
-countdown321_txt = pg.font.Font(countdown321_font, 30)
+menu_txt = pg.font.Font(open_asset(menu_font), 22)
+score_txt = pg.font.Font(open_asset(score_font), 36)
+countdown321_txt = pg.font.Font(open_asset(countdown321_font), 30)
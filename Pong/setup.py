@@ -1,6 +1,7 @@
 # Pong/setup.py
 import pygame as pg
 from constants import WINDOW_SIZE, FPS
+from asset_files import open_asset
 
 
 def setup_pygame():
@@ -15,7 +16,7 @@ def access_window():
     # Create window display, caption & icon
     window_ = pg.display.set_mode(WINDOW_SIZE)
     pg.display.set_caption("Pong | by Ilija")
-    pg.display.set_icon(pg.image.load("icon/pong.ico"))
+    pg.display.set_icon(pg.image.load(open_asset("icon/pong.ico"), "icon/pong.ico"))
 
     return window_  # return window
 
@@ -1,5 +1,6 @@
 # Pong/sound.py
 from setup import pg, setup_mixer
+from asset_files import open_asset
 
 setup_mixer()  # initialize pygame mixer module to access pg.mixer.Sound()
 
@@ -8,23 +9,23 @@ menu_music = "sound/menu_theme.mp3"
 game_music = "sound/game_theme.mp3"
 
 # sound effects
-countdown321_sfx = pg.mixer.Sound("sound/countdown_sfx.ogg")
-paddle_strike_sfx = pg.mixer.Sound("sound/paddle_strike_sfx.ogg")
-point_scored_sfx = pg.mixer.Sound("sound/point_scored_sfx.ogg")
-menu_select_sfx = pg.mixer.Sound("sound/menu_select_sfx.ogg")
-menu_confirm_sfx = pg.mixer.Sound("sound/menu_confirm_sfx.ogg")
+countdown321_sfx = pg.mixer.Sound(file=open_asset("sound/countdown_sfx.ogg"))
+paddle_strike_sfx = pg.mixer.Sound(file=open_asset("sound/paddle_strike_sfx.ogg"))
+point_scored_sfx = pg.mixer.Sound(file=open_asset("sound/point_scored_sfx.ogg"))
+menu_select_sfx = pg.mixer.Sound(file=open_asset("sound/menu_select_sfx.ogg"))
+menu_confirm_sfx = pg.mixer.Sound(file=open_asset("sound/menu_confirm_sfx.ogg"))
 
 
 def play_menu_music():
     # Play menu theme music
-    pg.mixer.music.load(menu_music)
+    pg.mixer.music.load(open_asset(menu_music), menu_music)
     pg.mixer.music.play(loops=-1)
     pg.mixer.music.set_volume(0.4)
 
 
 def play_game_music():
     # Play in game theme music
-    pg.mixer.music.load(game_music)
+    pg.mixer.music.load(open_asset(game_music), game_music)
     pg.mixer.music.play(loops=-1)
     pg.mixer.music.set_volume(0.1)
 
@@ -1,5 +1,6 @@
 # Snake/font.py
 import pygame as pg
+from asset_files import open_asset
 
 pg.init()
 
@@ -7,6 +8,6 @@ pg.init()
 main_font = "assets/font/nokia_cell.ttf"
 
 # Game texts
-space_txt = pg.font.Font(main_font, 22)
-score_txt = pg.font.Font(main_font, 21)
+space_txt = pg.font.Font(open_asset(main_font), 22)
+score_txt = pg.font.Font(open_asset(main_font), 21)
 
@@ -4,6 +4,7 @@ from random import randrange
 from constants import WINDOW_SIZE, TILE_SIZE, BLACK, WINDOW_OFFSET
 from images import snake_food
 from sound import play_pickup_food_sound, play_crash_sound
+from asset_files import open_asset
 
 vec2d = pg.math.Vector2  # save pygame class for working with 2D vectors into an easily accessible variable
 
@@ -137,7 +138,7 @@ class Player:
 class Food:
     def __init__(self, game, player):
         self.game = game
-        self.image = pg.image.load(snake_food)
+        self.image = pg.image.load(open_asset(snake_food), snake_food)
         self.image = pg.transform.scale(self.image, (TILE_SIZE, TILE_SIZE))
         self.rect = self.image.get_rect()
         self.rect.center = randomize_location(player)  # randomize food rect location center coordinates at init
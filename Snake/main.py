@@ -6,6 +6,7 @@ from font import space_txt, score_txt
 from images import snake_ico, trophy, musical_note
 from sound import play_background_music
 from highscore import load_highscore, save_highscore
+from asset_files import open_asset
 
 
 class Game:
@@ -13,7 +14,7 @@ class Game:
         pg.init()
         self.window = pg.display.set_mode(WINDOW_SIZE)
         pg.display.set_caption("Snake | by Ilija")
-        pg.display.set_icon(pg.image.load(snake_ico))
+        pg.display.set_icon(pg.image.load(open_asset(snake_ico), snake_ico))
         self.clock = pg.time.Clock()
         self.player = None
         self.food = None
@@ -54,7 +55,7 @@ class Game:
 
     def music_switch(self):
         # Graphics for switching music on/off
-        music_note_img = pg.image.load(musical_note)
+        music_note_img = pg.image.load(open_asset(musical_note), musical_note)
         music_note_img = pg.transform.scale(music_note_img, (TILE_SIZE, TILE_SIZE))
         music_note_img_rect = music_note_img.get_rect(center=(WINDOW_SIZE[0] // 2 + 305, WINDOW_SIZE[1] // 2 - 240))
 
@@ -81,7 +82,7 @@ class Game:
     def scoreboard(self):
         # Graphics for the scoreboard
         score = self.player.length - 1
-        score_img = pg.image.load(snake_food)
+        score_img = pg.image.load(open_asset(snake_food), snake_food)
         score_img = pg.transform.scale(score_img, (TILE_SIZE, TILE_SIZE))
         score_img_rect = score_img.get_rect(center=(WINDOW_SIZE[0] // 2 - 300, WINDOW_SIZE[1] // 2 - 275))
         self.window.blit(score_img, score_img_rect)
@@ -92,7 +93,7 @@ class Game:
 
     def highscore(self):
         # Graphics for the highscore
-        highscore_img = pg.image.load(trophy)
+        highscore_img = pg.image.load(open_asset(trophy), trophy)
         highscore_img = pg.transform.scale(highscore_img, (TILE_SIZE, TILE_SIZE))
         highscore_img_rect = highscore_img.get_rect(center=(WINDOW_SIZE[0] // 2 - 300, WINDOW_SIZE[1] // 2 - 240))
         self.window.blit(highscore_img, highscore_img_rect)
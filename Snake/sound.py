@@ -1,6 +1,7 @@
 # Snake/sound.py
 import time
 import pygame as pg
+from asset_files import open_asset
 
 pg.init()
 pg.mixer.init(frequency=44100, size=32, channels=2, buffer=512)  # initialize Pygame mixer for sound
@@ -10,9 +11,9 @@ bg_music = "assets/sound/ingame_music.mp3"  # game background music
 
 
 # Sound effects (paths)
-food_pickup_sfx = pg.mixer.Sound("assets/sound/food_pickup_sfx.ogg")
-crash_sfx = pg.mixer.Sound("assets/sound/crash_sfx.ogg")
-round_over_sfx = pg.mixer.Sound("assets/sound/game_over_sfx.ogg")
+food_pickup_sfx = pg.mixer.Sound(file=open_asset("assets/sound/food_pickup_sfx.ogg"))
+crash_sfx = pg.mixer.Sound(file=open_asset("assets/sound/crash_sfx.ogg"))
+round_over_sfx = pg.mixer.Sound(file=open_asset("assets/sound/game_over_sfx.ogg"))
 
 
 def play_pickup_food_sound():
@@ -40,6 +41,6 @@ def play_round_over_sound():
 
 def play_background_music():
     # Play game background music
-    pg.mixer.music.load(bg_music)
+    pg.mixer.music.load(open_asset(bg_music), bg_music)
     pg.mixer.music.play(loops=-1)  # loop back to start when finished
     pg.mixer.music.set_volume(0.4)
@@ -0,0 +1,153 @@
+# asset_pack.py
+import io
+import os
+import sys
+import json
+import mmap
+import struct
+
+# ASSET PACK FILE FORMAT
+# Header: magic bytes, format version and the length of the index
+# Index: UTF-8 encoded JSON that maps the path of every asset ('/' separated, relative to the directory the pack is
+# stored in) to its (offset, size)
+# Data: the unmodified content of every asset file, one after the other (offsets are counted from the file start)
+PACK_MAGIC = b'IBAP'
+PACK_VERSION = 1
+HEADER_FORMAT = '<4sBI'
+
+# File extensions of the assets written into a pack
+PACKED_EXTENSIONS = ('.png', '.ico', '.ttf', '.otf', '.ogg', '.wav', '.mp3')
+
+# Shared pack read by every game (stored next to the game directories, the asset keys are relative to this directory)
+ASSET_PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets.pack')
+
+# Asset directories of every game (relative to the directory holding the games), packed into the shared pack
+GAME_ASSET_DIRS = (os.path.join('Bomberman', 'assets'), os.path.join('Bomberman', 'audio'),
+                   os.path.join('Pong', 'font'), os.path.join('Pong', 'sound'), os.path.join('Pong', 'icon'),
+                   os.path.join('Snake', 'assets'))
+
+
+# This function returns the key of an asset path relative to the pack's directory (the same on every platform)
+def pack_key(path):
+    return os.path.normpath(path).replace(os.sep, '/')
+
+
+# This function writes every asset found inside the directories (relative to the root directory) into a pack file and
+# returns the number of packed assets
+def pack_assets(root_dir, asset_dirs, output_path):
+    asset_paths = []
+    for asset_dir in asset_dirs:
+        for dir_path, _, file_names in os.walk(os.path.join(root_dir, asset_dir)):
+            asset_paths += [os.path.join(dir_path, file_name) for file_name in sorted(file_names)
+                            if file_name.lower().endswith(PACKED_EXTENSIONS)]
+
+    # Read every asset and lay them out one after the other
+    contents = []
+    for asset_path in asset_paths:
+        with open(asset_path, 'rb') as file:
+            contents.append((pack_key(os.path.relpath(asset_path, root_dir)), file.read()))
+
+    # The data starts after the header and the index, whose length depends on the offsets written into it
+    index = {}
+    index_size = 0
+    while True:
+        offset = struct.calcsize(HEADER_FORMAT) + index_size
+        for key, content in contents:
+            index[key] = (offset, len(content))
+            offset += len(content)
+        encoded_index = json.dumps(index, separators=(',', ':')).encode('utf-8')
+        if len(encoded_index) == index_size:
+            break
+        index_size = len(encoded_index)
+
+    with open(output_path, 'wb') as file:
+        file.write(struct.pack(HEADER_FORMAT, PACK_MAGIC, PACK_VERSION, len(encoded_index)))
+        file.write(encoded_index)
+        for _, content in contents:
+            file.write(content)
+
+    return len(contents)
+
+
+# This function memory-maps the shared pack, or returns None if it has not been built (the games then load the asset
+# files instead)
+def open_asset_pack(path=ASSET_PACK_PATH):
+    return AssetPack(path) if os.path.exists(path) else None
+
+
+class AssetPack:
+    def __init__(self, path):
+        # FILE (The pack is memory-mapped once, the assets are read straight from the mapped pages)
+        with open(path, 'rb') as file:
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)  # Read-only mapping of the pack
+        self.buffer = memoryview(self.mapping)  # View of the whole pack, sliced without copying
+
+        # INDEX
+        magic, version, index_size = struct.unpack_from(HEADER_FORMAT, self.mapping)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{path} is not a version {PACK_VERSION} asset pack")
+        index_start = struct.calcsize(HEADER_FORMAT)
+        self.index = json.loads(bytes(self.buffer[index_start:index_start + index_size]))  # Asset key -> (offset, size)
+        self.root_dir = os.path.dirname(os.path.abspath(path))  # Directory the asset keys are relative to
+
+    # This function returns the key of an absolute asset path inside the pack
+    def key(self, path):
+        return pack_key(os.path.relpath(path, self.root_dir))
+
+    # This function checks if an asset (absolute path) is inside the pack
+    def __contains__(self, path):
+        return self.key(path) in self.index
+
+    # This function returns a read-only file-like view of an asset (each view has its own read position)
+    def open(self, path):
+        offset, size = self.index[self.key(path)]
+        return AssetView(self.buffer[offset:offset + size])
+
+
+class AssetView(io.RawIOBase):
+    def __init__(self, buffer):
+        super().__init__()
+
+        # BUFFER
+        self.buffer = buffer  # Memoryview of the asset's bytes inside the memory-mapped pack
+        self.position = 0  # Current read position inside the asset
+
+    # This function copies the next bytes of the asset into the given buffer and returns the number of copied bytes
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self.buffer) - self.position)
+        buffer[:size] = self.buffer[self.position:self.position + size]
+        self.position += size
+        return size
+
+    # This function moves the read position and returns the new position
+    def seek(self, offset, whence=io.SEEK_SET):
+        start = {io.SEEK_SET: 0, io.SEEK_CUR: self.position, io.SEEK_END: len(self.buffer)}[whence]
+        self.position = max(0, start + offset)
+        return self.position
+
+    # This function returns the current read position
+    def tell(self):
+        return self.position
+
+    # This function reports that the view can be read
+    def readable(self):
+        return True
+
+    # This function reports that the read position can be moved
+    def seekable(self):
+        return True
+
+
+# Run this file to pack the assets of every game into the shared pack read by the games, options: '--root DIR' to pack
+# the assets of another directory, '--dirs DIR,DIR' to choose the packed directories and '--output FILE' to choose the
+# pack file (the asset keys are relative to the root directory, so a pack read by the games is stored inside it)
+if __name__ == "__main__":
+    def option_value(option):
+        return sys.argv[sys.argv.index(option) + 1] if option in sys.argv[:-1] else None
+
+    root = option_value('--root') or os.path.dirname(ASSET_PACK_PATH)
+    dirs = option_value('--dirs').split(',') if option_value('--dirs') else GAME_ASSET_DIRS
+    output = option_value('--output') or ASSET_PACK_PATH
+
+    num_of_assets = pack_assets(root, dirs, output)
+    print(f"Packed {num_of_assets} assets from {root} into {output} ({os.path.getsize(output)} bytes)")